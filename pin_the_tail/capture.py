@@ -0,0 +1,761 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import cv2
+import numpy as np
+import pyautogui
+
+from pin_the_tail.location import Region
+
+
+class CaptureUnavailableError(Exception):
+    """
+    Raised when a capture backend cannot be used on this system (e.g. no X server or missing X extensions).
+    """
+
+
+@dataclass(frozen=True)
+class Monitor:
+    """
+    A monitor attached to the computer.
+    """
+
+    #: Position of the monitor in the list of monitors
+    index: int
+    #: Where the monitor is on the desktop (i.e. in the coordinates used for capturing and moving the mouse)
+    region: Region
+    #: Name of the monitor (e.g. the video output it's connected to), if known
+    name: str = ""
+    #: Whether this is the primary monitor
+    is_primary: bool = False
+
+
+@dataclass(frozen=True)
+class CaptureInfo:
+    """
+    When and how a frame was captured from the screen.
+    """
+
+    #: When the capture started, according to ``time.monotonic``
+    start: float
+    #: When the capture finished (i.e. the frame was ready to be searched), according to ``time.monotonic``
+    end: float
+    #: ``name`` of the capture backend that captured the frame
+    backend: str
+    #: How many frames were captured (by the same ``Screen``) before this one
+    sequence: int
+
+    @property
+    def duration(self) -> float:
+        """
+        How long the capture took, in seconds.
+        """
+        return self.end - self.start
+
+
+def as_frame(pixels: np.ndarray) -> np.ndarray:
+    """
+    Convert captured pixels to the format that ``CaptureBackend.grab`` returns: a writable, C-contiguous
+    ``height`` x ``width`` x 3 array of RGB ``uint8`` values.  OpenCV (e.g. ``cv2.matchTemplate``) can use such arrays
+    without copying them first.
+
+    Pixels already in that format are returned as they are; otherwise, they're copied once.
+
+    :param pixels: A ``height`` x ``width`` x 3 (RGB) or 4 (RGBA) array.
+    """
+    pixels = np.asarray(pixels)
+    if pixels.ndim != 3 or pixels.shape[2] not in (3, 4):
+        raise ValueError(f"Unsupported shape for captured pixels: {pixels.shape!r}")
+    if pixels.shape[2] == 4:
+        return cv2.cvtColor(np.asarray(pixels, dtype=np.uint8), cv2.COLOR_RGBA2RGB)
+    if pixels.dtype == np.uint8 and pixels.flags.c_contiguous and pixels.flags.writeable:
+        return pixels
+    return np.array(pixels, dtype=np.uint8, order="C")
+
+
+class CaptureBackend:
+    """
+    A way of capturing the pixels on the screen.
+    """
+
+    #: Short name of the backend, e.g. for logging which backend was used
+    name = "base"
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        """
+        Capture the screen.
+
+        :param region: The rectangle of the screen to capture.  If ``None``, the whole screen is captured.
+        :return: A ``height`` x ``width`` x 3 array of the RGB pixel values, in the format described in ``as_frame``.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def monitors(self) -> List[Monitor]:
+        """
+        Get the monitors that the backend can capture, primary monitor first.  Backends that can't tell the monitors
+        apart report the whole captured area as one monitor.
+        """
+        height, width = self.grab().shape[:2]
+        return [Monitor(0, Region(0, 0, width, height), is_primary=True)]
+
+    def damage_count(self) -> Optional[int]:
+        """
+        Count how many times the screen was seen to change, e.g. using notifications from the windowing system.  The
+        count never goes down, so everything using the backend can tell whether the screen may have changed since it
+        last looked by comparing counts, without affecting each other.  The first call starts tracking changes.
+
+        :return: The count, or ``None`` if the backend can't tell.
+        """
+        return None
+
+    def wait_for_damage(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        """
+        Block until the screen may have changed, or until ``timeout`` seconds pass.
+
+        :param since: A count from ``damage_count``, to wait until the count is higher.  If ``None``, waits for a change
+            since the last capture.
+        :return: ``True`` if the screen may have changed, ``False`` if it didn't change before the timeout, or ``None``
+            if the backend can't tell (in which case it returns immediately).
+        """
+        return None
+
+    def close(self) -> None:
+        """
+        Release any resources held by the backend.  The backend can't be used afterwards.
+        """
+
+    def __enter__(self) -> "CaptureBackend":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class PyAutoGUICapture(CaptureBackend):
+    """
+    Capture the screen using ``pyautogui.screenshot``.  This works wherever PyAutoGUI does, but can be slow (e.g. on
+    Linux, it runs an external program for each screenshot).
+    """
+
+    name = "pyautogui"
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        if region is None:
+            return as_frame(pyautogui.screenshot())
+        return as_frame(pyautogui.screenshot(region=(region.x, region.y, region.width, region.height)))
+
+
+class _XImage(ctypes.Structure):
+    # The fields of Xlib's ``XImage`` up to (but not including) the function pointers, which aren't needed
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+        ("red_mask", ctypes.c_ulong),
+        ("green_mask", ctypes.c_ulong),
+        ("blue_mask", ctypes.c_ulong),
+    ]
+
+
+class _XRRMonitorInfo(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_ulong),
+        ("primary", ctypes.c_int),
+        ("automatic", ctypes.c_int),
+        ("noutput", ctypes.c_int),
+        ("x", ctypes.c_int),
+        ("y", ctypes.c_int),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("mwidth", ctypes.c_int),
+        ("mheight", ctypes.c_int),
+        ("outputs", ctypes.c_void_p),
+    ]
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+def _load_library(name: str) -> ctypes.CDLL:
+    path = ctypes.util.find_library(name)
+    if path is None:
+        raise CaptureUnavailableError(f"Cannot find the {name} library")
+    return ctypes.CDLL(path)
+
+
+class XShmCapture(CaptureBackend):
+    """
+    Capture the screen of an X11 server using the MIT shared memory extension (MIT-SHM).
+
+    The X server copies the pixels straight into a shared memory segment that is reused between captures, which avoids
+    both encoding the screenshot and sending it through the X connection.  The segment is only reallocated when the size
+    of the captured rectangle changes, so repeatedly capturing the same region is cheapest.
+
+    The backend can be used from several threads (e.g. an ``Observer`` and a wait), but only one of them uses the X
+    connection and the shared memory segment at a time.
+
+    :param display: The X display to connect to (e.g. ``":0"``).  If ``None``, the ``DISPLAY`` environment variable is
+        used.
+    :raises CaptureUnavailableError: If the display can't be opened or doesn't support MIT-SHM with 32-bit pixels.
+    """
+
+    name = "xshm"
+
+    _Z_PIXMAP = 2
+    _IPC_PRIVATE = 0
+    _IPC_CREAT = 0o1000
+    _IPC_RMID = 0
+    _ALL_PLANES = ctypes.c_ulong(-1)
+    _X_DAMAGE_REPORT_NON_EMPTY = 3
+    _X_DAMAGE_NOTIFY = 0
+    # Longest time (in seconds) ``wait_for_damage`` sleeps before checking for damage again.  Another thread can read
+    # the damage events from the X connection while this one sleeps, and then nothing wakes it.
+    _DAMAGE_POLL_INTERVAL = 0.05
+
+    def __init__(self, display: Optional[str] = None):
+        # Xlib isn't initialized for threads, so every use of the display (and of the shared memory image) holds this
+        self._lock = threading.RLock()
+        self._xlib = _load_library("X11")
+        self._xext = _load_library("Xext")
+        self._libc = _load_library("c")
+        self._declare_functions()
+
+        self._display = self._xlib.XOpenDisplay(None if display is None else display.encode())
+        if not self._display:
+            raise CaptureUnavailableError(f"Cannot open X display {display or os.environ.get('DISPLAY')!r}")
+
+        self._image = None
+        self._buffer: Optional[np.ndarray] = None
+        self._shm_info = _XShmSegmentInfo()
+        self._xdamage: Optional[ctypes.CDLL] = None
+        self._damage: Optional[int] = None
+        self._damage_unavailable = False
+        self._damage_event_type = 0
+        self._damage_count = 0
+        # ``damage_count`` when the screen was last captured, for ``wait_for_damage`` without ``since``
+        self._captured_damage_count = 0
+        try:
+            if not self._xext.XShmQueryExtension(self._display):
+                raise CaptureUnavailableError("The X server doesn't support the MIT-SHM extension")
+            screen_number = self._xlib.XDefaultScreen(self._display)
+            self._root = self._xlib.XDefaultRootWindow(self._display)
+            self._visual = self._xlib.XDefaultVisual(self._display, screen_number)
+            self._depth = self._xlib.XDefaultDepth(self._display, screen_number)
+            self._screen_region = Region(
+                0,
+                0,
+                self._xlib.XDisplayWidth(self._display, screen_number),
+                self._xlib.XDisplayHeight(self._display, screen_number),
+            )
+        except Exception:
+            self._xlib.XCloseDisplay(self._display)
+            self._display = None
+            raise
+
+    def _declare_functions(self) -> None:
+        xlib, xext, libc = self._xlib, self._xext, self._libc
+        p_image = ctypes.POINTER(_XImage)
+        p_shm_info = ctypes.POINTER(_XShmSegmentInfo)
+
+        xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        xlib.XOpenDisplay.restype = ctypes.c_void_p
+        xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+        xlib.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDefaultVisual.restype = ctypes.c_void_p
+        xlib.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XFree.argtypes = [ctypes.c_void_p]
+
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmCreateImage.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            p_shm_info,
+            ctypes.c_uint,
+            ctypes.c_uint,
+        ]
+        xext.XShmCreateImage.restype = p_image
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, p_shm_info]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, p_shm_info]
+        xext.XShmGetImage.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_ulong,
+            p_image,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_ulong,
+        ]
+
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+    def _get_image(self, width: int, height: int):
+        """
+        Get a shared memory image of the given size, reusing the previous one if it's the same size.
+        """
+        if self._image is not None and (self._image.contents.width, self._image.contents.height) == (width, height):
+            return self._image
+        self._release_image()
+
+        image = self._xext.XShmCreateImage(
+            self._display, self._visual, self._depth, self._Z_PIXMAP, None, ctypes.byref(self._shm_info), width, height
+        )
+        if not image:
+            raise CaptureUnavailableError("Cannot create a shared memory image")
+        bits_per_pixel = image.contents.bits_per_pixel
+        if bits_per_pixel != 32:
+            self._xlib.XFree(image)
+            raise CaptureUnavailableError(f"Unsupported pixel format ({bits_per_pixel} bits per pixel)")
+
+        size = image.contents.bytes_per_line * height
+        self._shm_info.shmid = self._libc.shmget(self._IPC_PRIVATE, size, self._IPC_CREAT | 0o600)
+        if self._shm_info.shmid < 0:
+            self._xlib.XFree(image)
+            raise CaptureUnavailableError("Cannot allocate shared memory")
+        address = self._libc.shmat(self._shm_info.shmid, None, 0)
+        # Mark the segment for removal right away, so it's freed once both this process and the X server detach, even
+        # if this process dies without cleaning up
+        self._libc.shmctl(self._shm_info.shmid, self._IPC_RMID, None)
+        if address in (None, ctypes.c_void_p(-1).value):
+            self._xlib.XFree(image)
+            raise CaptureUnavailableError("Cannot attach shared memory")
+
+        self._shm_info.shmaddr = address
+        self._shm_info.readOnly = 0
+        image.contents.data = address
+        if not self._xext.XShmAttach(self._display, ctypes.byref(self._shm_info)):
+            self._libc.shmdt(address)
+            self._xlib.XFree(image)
+            raise CaptureUnavailableError("The X server cannot attach the shared memory")
+        self._xlib.XSync(self._display, 0)
+
+        self._image = image
+        self._buffer = np.ctypeslib.as_array(ctypes.cast(address, ctypes.POINTER(ctypes.c_uint8)), shape=(size,))
+        return image
+
+    def _release_image(self) -> None:
+        if self._image is None:
+            return
+        self._xext.XShmDetach(self._display, ctypes.byref(self._shm_info))
+        self._xlib.XSync(self._display, 0)
+        self._libc.shmdt(self._shm_info.shmaddr)
+        self._xlib.XFree(self._image)
+        self._image = None
+        self._buffer = None
+
+    def monitors(self) -> List[Monitor]:
+        """
+        Get the monitors using the X RandR extension, or the whole screen as one monitor if it isn't available.
+        """
+        with self._lock:
+            if self._display is None:
+                raise ValueError("Cannot list the monitors after the backend is closed")
+            try:
+                xrandr = _load_library("Xrandr")
+            except CaptureUnavailableError:
+                return [Monitor(0, self._screen_region, is_primary=True)]
+            xrandr.XRRGetMonitors.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_ulong,
+                ctypes.c_int,
+                ctypes.POINTER(ctypes.c_int),
+            ]
+            xrandr.XRRGetMonitors.restype = ctypes.POINTER(_XRRMonitorInfo)
+            xrandr.XRRFreeMonitors.argtypes = [ctypes.POINTER(_XRRMonitorInfo)]
+            self._xlib.XGetAtomName.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+            self._xlib.XGetAtomName.restype = ctypes.c_void_p
+
+            n_monitors = ctypes.c_int()
+            monitor_infos = xrandr.XRRGetMonitors(self._display, self._root, 1, ctypes.byref(n_monitors))
+            if not monitor_infos or n_monitors.value == 0:
+                return [Monitor(0, self._screen_region, is_primary=True)]
+            try:
+                infos = [monitor_infos[i] for i in range(n_monitors.value)]
+                names = [self._get_atom_name(info.name) for info in infos]
+                regions = [Region(info.x, info.y, info.width, info.height) for info in infos]
+                primaries = [bool(info.primary) for info in infos]
+            finally:
+                xrandr.XRRFreeMonitors(monitor_infos)
+
+            order = sorted(range(len(infos)), key=lambda i: (not primaries[i], i))
+            return [Monitor(index, regions[i], names[i], primaries[i]) for index, i in enumerate(order)]
+
+    def _get_atom_name(self, atom: int) -> str:
+        if not atom:
+            return ""
+        name = self._xlib.XGetAtomName(self._display, atom)
+        if not name:
+            return ""
+        try:
+            return ctypes.string_at(name).decode(errors="replace")
+        finally:
+            self._xlib.XFree(name)
+
+    def _start_damage_tracking(self) -> bool:
+        """
+        Start tracking changes to the screen with the X Damage extension.
+
+        :return: Whether the extension is available.
+        """
+        try:
+            xdamage = _load_library("Xdamage")
+        except CaptureUnavailableError:
+            return False
+        xdamage.XDamageQueryExtension.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        xdamage.XDamageCreate.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int]
+        xdamage.XDamageCreate.restype = ctypes.c_ulong
+        xdamage.XDamageSubtract.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+        xdamage.XDamageDestroy.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        self._xlib.XCheckTypedEvent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+        self._xlib.XFlush.argtypes = [ctypes.c_void_p]
+        self._xlib.XConnectionNumber.argtypes = [ctypes.c_void_p]
+
+        event_base, error_base = ctypes.c_int(), ctypes.c_int()
+        if not xdamage.XDamageQueryExtension(self._display, ctypes.byref(event_base), ctypes.byref(error_base)):
+            return False
+        self._xdamage = xdamage
+        self._damage_event_type = event_base.value + self._X_DAMAGE_NOTIFY
+        self._damage = xdamage.XDamageCreate(self._display, self._root, self._X_DAMAGE_REPORT_NON_EMPTY)
+        self._xlib.XFlush(self._display)
+        return True
+
+    def damage_count(self) -> Optional[int]:
+        """
+        Count the changes to the screen using the X Damage extension.  Returns ``None`` if the extension isn't
+        available.
+        """
+        with self._lock:
+            if self._display is None:
+                raise ValueError("Cannot check the screen after the backend is closed")
+            if self._damage is None:
+                if self._damage_unavailable or not self._start_damage_tracking():
+                    self._damage_unavailable = True
+                    return None
+                return self._damage_count
+            return self._collect_damage()
+
+    def _collect_damage(self) -> int:
+        """
+        Read the damage events received so far, counting them as one more change if there were any, and get the count.
+        """
+        damaged = False
+        event = (ctypes.c_long * 24)()  # Large enough for any XEvent
+        while self._xlib.XCheckTypedEvent(self._display, self._damage_event_type, event):
+            damaged = True
+        if damaged:
+            # With "non-empty" reporting, the next event is only sent after the damage is cleared
+            self._xdamage.XDamageSubtract(self._display, self._damage, 0, 0)
+            self._xlib.XFlush(self._display)
+            self._damage_count += 1
+        return self._damage_count
+
+    def wait_for_damage(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        with self._lock:
+            if self._display is None:
+                raise ValueError("Cannot check the screen after the backend is closed")
+            if self._damage is None:
+                # Tracking starts with ``damage_count``, since changes from before tracking started can't be known
+                return None if self.damage_count() is None else True
+            since = self._captured_damage_count if since is None else since
+            connection = self._xlib.XConnectionNumber(self._display)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._display is None:
+                    raise ValueError("Cannot check the screen after the backend is closed")
+                if self._collect_damage() > since:
+                    return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Sleep (without holding the lock, so other threads can capture) until the X server sends something (e.g. a
+            # damage event)
+            select.select([connection], [], [], min(remaining, self._DAMAGE_POLL_INTERVAL))
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        with self._lock:
+            if self._display is None:
+                raise ValueError("Cannot capture the screen after the backend is closed")
+            region = self._screen_region if region is None else region
+            if not self._screen_region.contains(region):
+                raise ValueError(f"Cannot capture {region!r}, which is outside of the screen {self._screen_region!r}")
+
+            if self._damage is not None:
+                self._captured_damage_count = self._collect_damage()
+            image = self._get_image(region.width, region.height)
+            if not self._xext.XShmGetImage(self._display, self._root, image, region.x, region.y, self._ALL_PLANES):
+                raise CaptureUnavailableError("Cannot capture the screen")
+
+            # The pixels are BGRX, with each row padded to ``bytes_per_line``
+            rows = self._buffer.reshape((region.height, image.contents.bytes_per_line))
+            pixels = rows[:, : region.width * 4].reshape((region.height, region.width, 4))
+            return cv2.cvtColor(pixels, cv2.COLOR_BGRA2RGB)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._display is None:
+                return
+            self._release_image()
+            if self._damage is not None:
+                self._xdamage.XDamageDestroy(self._display, self._damage)
+                self._damage = None
+            self._xlib.XCloseDisplay(self._display)
+            self._display = None
+
+    def __del__(self):
+        if getattr(self, "_display", None) is not None:
+            self.close()
+
+
+def get_monitors(capture_backend: Optional[CaptureBackend] = None) -> List[Monitor]:
+    """
+    Get the monitors attached to the computer, primary monitor first.
+
+    :param capture_backend: The backend to ask.  If ``None``, the backend from ``best_capture_backend`` is used.
+    """
+    if capture_backend is not None:
+        return capture_backend.monitors()
+    with best_capture_backend() as backend:
+        return backend.monitors()
+
+
+def best_capture_backend() -> CaptureBackend:
+    """
+    Get the fastest capture backend that works on this system, falling back to ``PyAutoGUICapture``.
+    """
+    if sys.platform.startswith("linux") and os.environ.get("DISPLAY"):
+        try:
+            return XShmCapture()
+        except CaptureUnavailableError:
+            pass
+    return PyAutoGUICapture()
+
+
+@dataclass(frozen=True)
+class Frame:
+    """
+    A frame captured by a ``ScreenStream``.
+    """
+
+    #: The RGB pixel values of the whole screen
+    image: np.ndarray
+    #: When the frame was captured, according to ``time.monotonic``
+    timestamp: float
+    #: How many frames the stream captured before this one
+    sequence: int
+
+
+class ScreenStream(CaptureBackend):
+    """
+    Capture frames in a background thread, so getting the screen just reads the latest frame instead of waiting for a
+    capture.
+
+    Frames are copied into a ring buffer that is allocated once (and again only if the screen's resolution changes), and
+    the most recent ``history_size`` frames are kept, e.g. to see what was on the screen leading up to a wait timing
+    out.  Several ``Screen`` objects can share the same stream.
+
+    The thread starts on the first ``grab`` (or when entering the stream as a context manager) and runs until ``close``
+    is called.
+
+    :param backend: How to capture each frame.  If ``None``, ``PyAutoGUICapture`` is used.
+    :param fps: How many frames to capture per second (at most).
+    :param history_size: How many recent frames to keep.
+    """
+
+    name = "stream"
+
+    def __init__(self, backend: Optional[CaptureBackend] = None, fps: float = 30, history_size: int = 8):
+        if fps <= 0:
+            raise ValueError(f'"fps" must be positive: {fps!r}')
+        if history_size < 1:
+            raise ValueError(f'"history_size" must be at least one: {history_size!r}')
+
+        self._backend = PyAutoGUICapture() if backend is None else backend
+        self._period = 1 / fps
+        self._history_size = history_size
+
+        self._buffer: Optional[np.ndarray] = None
+        self._timestamps = [0.0] * history_size
+        # Number of frames captured, which is also the sequence number of the next frame.  It keeps counting when the
+        # resolution changes, so it can be used as the damage count.
+        self._n_frames = 0
+        # Sequence number of the first frame in the buffer at the current resolution
+        self._first_buffered = 0
+        self._error: Optional[BaseException] = None
+
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> CaptureBackend:
+        return self._backend
+
+    def monitors(self) -> List[Monitor]:
+        return self._backend.monitors()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "ScreenStream":
+        """
+        Start capturing frames in the background, if not already started.
+        """
+        if self._stop_event.is_set():
+            raise ValueError("Cannot start a stream after it is closed")
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ScreenStream", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        next_capture = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                image = self._backend.grab()
+                self._store(image, time.monotonic())
+            except BaseException as error:  # pylint: disable=broad-exception-caught
+                with self._condition:
+                    self._error = error
+                    self._condition.notify_all()
+                return
+
+            # Skip frames that couldn't be captured in time rather than trying to catch up
+            next_capture = max(next_capture + self._period, time.monotonic())
+            self._stop_event.wait(next_capture - time.monotonic())
+
+    def _store(self, image: np.ndarray, timestamp: float) -> None:
+        with self._condition:
+            if self._buffer is None or self._buffer.shape[1:] != image.shape:
+                self._buffer = np.empty((self._history_size,) + image.shape, dtype=image.dtype)
+                self._first_buffered = self._n_frames
+            slot = self._n_frames % self._history_size
+            np.copyto(self._buffer[slot], image)
+            self._timestamps[slot] = timestamp
+            self._n_frames += 1
+            self._condition.notify_all()
+
+    def _frame_at(self, sequence: int) -> Frame:
+        slot = sequence % self._history_size
+        return Frame(self._buffer[slot].copy(), self._timestamps[slot], sequence)
+
+    def _wait_for_first_frame(self, timeout: Optional[float]) -> None:
+        """
+        Wait until a frame is available.  Must be called while holding ``self._condition``.
+        """
+        if not self._condition.wait_for(lambda: self._n_frames > 0 or self._error is not None, timeout):
+            raise TimeoutError("No frame was captured in time")
+        if self._error is not None:
+            raise self._error
+
+    def latest(self, timeout: Optional[float] = None) -> Frame:
+        """
+        Get the most recently captured frame, waiting for the first frame if none has been captured yet.
+
+        :param timeout: How long to wait (in seconds) for the first frame.  If ``None``, waits indefinitely.
+        :raises TimeoutError: If no frame was captured within ``timeout``.
+        """
+        self.start()
+        with self._condition:
+            self._wait_for_first_frame(timeout)
+            return self._frame_at(self._n_frames - 1)
+
+    def history(self) -> List[Frame]:
+        """
+        Get the recently captured frames, from oldest to newest.
+        """
+        with self._condition:
+            first = max(self._n_frames - self._history_size, self._first_buffered)
+            return [self._frame_at(sequence) for sequence in range(first, self._n_frames)]
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        if region is None:
+            return self.latest().image
+
+        self.start()
+        with self._condition:
+            self._wait_for_first_frame(None)
+            latest_image = self._buffer[(self._n_frames - 1) % self._history_size]
+            return latest_image[region.top : region.bottom, region.left : region.right].copy()
+
+    def damage_count(self) -> Optional[int]:
+        """
+        Count the frames captured so far.  Frames may be the same as the frame before them, so the count only tells
+        that the screen may have changed.
+        """
+        with self._condition:
+            return self._n_frames
+
+    def wait_for_damage(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        """
+        Block until a new frame is captured, or until ``timeout`` seconds pass.  The new frame may be the same as the
+        previous one; compare them (e.g. with a ``ChangeDetector``) to find out.
+
+        :param since: A count from ``damage_count``, to wait for a frame captured after it was taken.  If ``None``,
+            waits for a frame captured after this call.
+        """
+        self.start()
+        with self._condition:
+            if since is None:
+                since = self._n_frames
+            has_new_frame = self._condition.wait_for(lambda: self._n_frames > since or self._error is not None, timeout)
+            if self._error is not None:
+                raise self._error
+            return has_new_frame
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._backend.close()
+
+    def __enter__(self) -> "ScreenStream":
+        return self.start()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(backend={self._backend!r}, fps={1 / self._period!r}, "
+            f"history_size={self._history_size!r})"
+        )
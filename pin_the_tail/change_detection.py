@@ -0,0 +1,101 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Width and height (in pixels) of the tiles that frames are split into when looking for changes
+_TILE_SIZE = 64
+
+
+@lru_cache(maxsize=8)
+def _checksum_weights(shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Get the (odd, so no information is lost) random weights for each 64-bit word of a tile.  A fixed seed keeps
+    checksums comparable between calls.
+    """
+    weights = np.random.default_rng(0).integers(0, 2**63, size=shape, dtype=np.uint64)
+    return weights * np.uint64(2) + np.uint64(1)
+
+
+def tile_checksums(image: np.ndarray, tile_size: int = _TILE_SIZE) -> np.ndarray:
+    """
+    Compute a checksum of each ``tile_size`` x ``tile_size`` tile of ``image``.
+
+    The checksum is a random linear combination of the tile's bytes (taken 8 at a time), so any change to a tile changes
+    its checksum with overwhelming probability, and it only takes one multiplication and one sum per 8 bytes.
+
+    :param image: A ``height`` x ``width`` x ``channels`` array of ``uint8`` pixel values.
+    :param tile_size: Width and height of each tile.  Must be a multiple of 8.  Tiles along the right and bottom edges
+        may be partially outside the image.
+    :return: An array of the checksums, where element ``[row, column]`` is the checksum of the tile whose top left
+        corner is at ``(column * tile_size, row * tile_size)``.
+    """
+    if tile_size <= 0 or tile_size % 8 != 0:
+        raise ValueError(f'"tile_size" must be a positive multiple of 8: {tile_size!r}')
+
+    height, width = image.shape[:2]
+    n_rows, n_columns = -(-height // tile_size), -(-width // tile_size)
+    if (n_rows * tile_size, n_columns * tile_size) != (height, width):
+        padded = np.zeros((n_rows * tile_size, n_columns * tile_size) + image.shape[2:], dtype=np.uint8)
+        padded[:height, :width] = image
+        image = padded
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+
+    words = image.reshape((n_rows, tile_size, n_columns, -1)).view(np.uint64)
+    weights = _checksum_weights((tile_size, 1, words.shape[3]))
+    return (words * weights).sum(axis=(1, 3), dtype=np.uint64)
+
+
+class ChangeDetector:
+    """
+    Detect whether successive frames (e.g. of the screen) differ, by comparing the checksums of their tiles (see
+    ``tile_checksums``).
+
+    When the frames come with the damage count of their source (see ``CaptureBackend.damage_count``), a frame whose
+    count is the same as the previous frame's can't have changed, so comparing the checksums is skipped entirely.  Each
+    detector remembers the last count it saw, so any number of detectors can watch the same source.
+
+    :param tile_size: Width and height of the tiles to compare.
+    :param tolerance: The fraction of the tiles that may differ without it counting as a change, e.g. so a blinking
+        cursor doesn't count.  Frames are compared to the last frame that counted as a change (rather than to the
+        previous frame), so changes that creep in a few tiles at a time still add up.
+    """
+
+    def __init__(self, tile_size: int = _TILE_SIZE, tolerance: float = 0):
+        if not 0 <= tolerance < 1:
+            raise ValueError(f'"tolerance" must be at least 0 and less than 1: {tolerance!r}')
+        self._tile_size = tile_size
+        self._tolerance = tolerance
+        self._damage_count: Optional[int] = None
+        self._checksums: Optional[np.ndarray] = None
+        self._changed_tiles: Optional[np.ndarray] = None
+
+    @property
+    def changed_tiles(self) -> Optional[np.ndarray]:
+        """
+        Which tiles differed in the last call to ``has_changed``, as a boolean array (indexed like ``tile_checksums``).
+        """
+        return self._changed_tiles
+
+    def has_changed(self, image: np.ndarray, damage_count: Optional[int] = None) -> bool:
+        """
+        Check whether ``image`` differs from the image passed in the last call that reported a change (by more than
+        the tolerance).  The first call always reports a change.
+
+        :param damage_count: The damage count of the image's source (see ``CaptureBackend.damage_count``) from before
+            the image was captured, or ``None`` if it isn't known.
+        """
+        if damage_count is not None and damage_count == self._damage_count and self._checksums is not None:
+            self._changed_tiles = np.zeros_like(self._checksums, dtype=bool)
+            return False
+        self._damage_count = damage_count
+
+        checksums = tile_checksums(image, self._tile_size)
+        if self._checksums is None or self._checksums.shape != checksums.shape:
+            self._changed_tiles = np.ones(checksums.shape, dtype=bool)
+        else:
+            self._changed_tiles = checksums != self._checksums
+        has_changed = bool(self._changed_tiles.any()) and self._changed_tiles.mean() > self._tolerance
+        if has_changed:
+            self._checksums = checksums
+        return has_changed
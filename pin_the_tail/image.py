@@ -1,5 +1,29 @@
+import asyncio
+import functools
+import math
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import cv2
 import numpy as np
@@ -7,11 +31,54 @@ import pyautogui
 from PIL import Image as PILImage
 from PIL import ImageDraw
 
+from pin_the_tail.capture import CaptureBackend, CaptureInfo, Monitor, PyAutoGUICapture, as_frame
+from pin_the_tail.change_detection import ChangeDetector
 from pin_the_tail.location import Point, Region
 from pin_the_tail.ocr import OCRMatcher
+from pin_the_tail.scheduler import get_current_watcher
 
 FileReferenceType = Union[str, Path]
 NeedleType = Union[str, "BaseImage"]
+MatchDomainType = Literal["color", "edges"]
+MatchBackendType = Literal["opencv", "numpy", "elimination"]
+FindModeType = Literal["all", "any"]
+ScanRateType = Union[float, "ScanPolicy"]
+T = TypeVar("T")
+
+# Number of pixels trimmed from each side of a needle's edge map before matching.  The gradient at a needle's border
+# depends on pixels outside the needle, so those pixels rarely agree with the same pixels in the haystack.
+_EDGE_MAP_MARGIN = 1
+
+# Maximum number of pixel values to copy at once when evaluating candidate locations with the numpy backend.
+_CANDIDATE_CHUNK_PIXELS = 2**22
+
+# Slack allowed when eliminating locations by bounds on their distance from the needle, so rounding errors can't
+# eliminate a match
+_ELIMINATION_TOLERANCE = 1e-6
+
+# Elimination is abandoned when checking the surviving locations would cost more than this many pixel comparisons,
+# since a dense search is faster by then
+_ELIMINATION_MAX_SURVIVOR_PIXELS = 2**24
+
+# Width and height of the sub-patch used to search for large needles.  Needles must be at least twice as big as this
+# (in both dimensions) to be searched by sub-patch.
+_SUBPATCH_SIZE = 32
+# When choosing a needle's sub-patch, the needle is split into a grid of this many rows and columns and the
+# self-similarity of the highest-entropy patch in each cell is checked
+_SUBPATCH_GRID_SIZE = 3
+# How much less similar the sub-patch may be than the full needle for its location to still be verified, as a multiple
+# of the full needle's allowed dissimilarity (i.e. ``1 - confidence``)
+_SUBPATCH_TOLERANCE_FACTOR = 5
+# When the sub-patch is found in more places than this, checking the whole needle at each of them would cost more than
+# searching for the whole needle, so it's searched for instead
+_SUBPATCH_MAX_CANDIDATES = 64
+
+# Scans scheduled this close (in seconds) to a wait's deadline count as being at the deadline, so rounding errors can't
+# add an extra scan
+_DEADLINE_TOLERANCE = 1e-6
+
+# Slack allowed when scaling lengths, so e.g. 100 pixels at a scale of 0.1 is 10 pixels rather than 11
+_SCALE_TOLERANCE = 1e-9
 
 
 class OutOfBoundsError(Exception):
@@ -27,26 +94,875 @@ class NeedleNotFoundError(Exception):
         super().__init__(message)
 
 
+# The executor that the asyncio methods (e.g. ``afind_all``) run captures and searches on; see ``set_async_executor``
+_async_executor: Optional[Executor] = None
+_async_executor_lock = threading.Lock()
+
+
+def set_async_executor(executor: Optional[Executor]) -> None:
+    """
+    Set the executor that the asyncio methods (e.g. ``BaseImage.afind_all``) run captures and searches on.  Its number
+    of workers bounds how many captures and searches run at once, however many asyncio tasks are waiting.
+
+    :param executor: The executor to use.  If ``None``, a thread pool with one thread per CPU is created when it's
+        first needed.
+    """
+    global _async_executor  # pylint: disable=global-statement
+    with _async_executor_lock:
+        _async_executor = executor
+
+
+def _get_async_executor() -> Executor:
+    global _async_executor  # pylint: disable=global-statement
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="pin_the_tail")
+        return _async_executor
+
+
+# The executor that ``find_all`` runs OCR on while it searches for images
+_ocr_executor: Optional[Executor] = None
+
+
+def _get_ocr_executor() -> Executor:
+    global _ocr_executor  # pylint: disable=global-statement
+    with _async_executor_lock:
+        if _ocr_executor is None:
+            _ocr_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="pin_the_tail_ocr")
+        return _ocr_executor
+
+
+# OCR runs that ``find_all`` stopped waiting for (e.g. because an image needle was found first) but that had already
+# started, so they still hold an OCR worker until they finish
+_abandoned_ocr_runs: Set[Future] = set()
+_abandoned_ocr_runs_lock = threading.Lock()
+
+
+def _abandon_ocr_run(future: Future) -> None:
+    """
+    Stop waiting for an OCR run from ``find_all``.  If it already started, it's remembered until it finishes.
+    """
+    if future.cancel():
+        return
+    with _abandoned_ocr_runs_lock:
+        _abandoned_ocr_runs.add(future)
+    # Called right away if the run already finished, so it must not be called while holding the lock
+    future.add_done_callback(_forget_ocr_run)
+
+
+def _forget_ocr_run(future: Future) -> None:
+    with _abandoned_ocr_runs_lock:
+        _abandoned_ocr_runs.discard(future)
+
+
+def _is_abandoned_ocr_running() -> bool:
+    with _abandoned_ocr_runs_lock:
+        return len(_abandoned_ocr_runs) > 0
+
+
+async def _run_in_executor(function: Callable[..., T], *args) -> T:
+    """
+    Call ``function`` on the asyncio executor (see ``set_async_executor``) and wait for the result.  If the waiting task
+    is cancelled, the call still runs to completion in the background, but its result is discarded.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_get_async_executor(), functools.partial(function, *args))
+
+
+@dataclass
+class WaitStatistics:
+    """
+    Statistics about a call to one of the ``wait_until_*`` methods.
+    """
+
+    #: How many times the image was scanned for the needle
+    scans: int = 0
+    #: How many of the scans reused the previous scan's result because the image hadn't changed
+    skipped_scans: int = 0
+    #: Total time (in seconds) spent capturing the screen.  Timings are left out of comparisons, since they differ
+    #: between runs.
+    capture_time: float = field(default=0.0, compare=False)
+    #: Total time (in seconds) spent searching for the needle
+    search_time: float = field(default=0.0, compare=False)
+    #: Time (in seconds) from the start of the first scan to the end of the last scan
+    elapsed_time: float = field(default=0.0, compare=False)
+
+    @property
+    def achieved_scans_per_second(self) -> Optional[float]:
+        """
+        How many scans were actually made per second, or ``None`` if no time elapsed.  It's lower than the requested
+        ``scans_per_second`` when scans take longer than the time between them.
+        """
+        if self.elapsed_time <= 0:
+            return None
+        return self.scans / self.elapsed_time
+
+
+class ScanPolicy:
+    """
+    Decides how long the ``wait_until_*`` methods wait between scans.  Pass one as their ``scans_per_second`` to vary
+    the rate during a wait.  Policies shouldn't keep any state of their own, so one policy can be used by several waits
+    at once.
+    """
+
+    def next_interval(self, previous_interval: Optional[float], changed: bool) -> float:
+        """
+        Get how long (in seconds) to wait from the start of one scan to the start of the next.
+
+        :param previous_interval: What this method returned after the previous scan, or ``None`` after the first scan.
+        :param changed: Whether the scan found that the image changed since the scan before it.  Images that can't
+            change (e.g. an ``Image``) never change.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+@dataclass(frozen=True)
+class FixedScanPolicy(ScanPolicy):
+    """
+    Scan ``scans_per_second`` times per second for the whole wait.  This is the policy used when ``scans_per_second``
+    is a number.
+    """
+
+    scans_per_second: float
+
+    def __post_init__(self):
+        if self.scans_per_second <= 0:
+            raise ValueError(f'"scans_per_second" must be positive: {self.scans_per_second!r}')
+
+    def next_interval(self, previous_interval: Optional[float], changed: bool) -> float:
+        return 1 / self.scans_per_second
+
+
+@dataclass(frozen=True)
+class BackoffScanPolicy(ScanPolicy):
+    """
+    Scan quickly at first, when a quick response matters most, and then back off exponentially, so long waits (e.g. for
+    a build or an installer to finish) don't keep the CPU busy.  Whenever the image changes, scanning is fast again.
+
+    :param initial_scans_per_second: The rate of the first scans, and of the scans after a change.
+    :param minimum_scans_per_second: The rate that backing off stops at.
+    :param backoff: How much longer each interval between scans is than the one before it, until the minimum rate is
+        reached.
+    """
+
+    initial_scans_per_second: float = 10
+    minimum_scans_per_second: float = 0.5
+    backoff: float = 1.5
+
+    def __post_init__(self):
+        if not 0 < self.minimum_scans_per_second <= self.initial_scans_per_second:
+            raise ValueError(
+                '"minimum_scans_per_second" must be positive and at most "initial_scans_per_second": '
+                f"{self.minimum_scans_per_second!r}"
+            )
+        if self.backoff < 1:
+            raise ValueError(f'"backoff" must be at least 1: {self.backoff!r}')
+
+    def next_interval(self, previous_interval: Optional[float], changed: bool) -> float:
+        if previous_interval is None or changed:
+            return 1 / self.initial_scans_per_second
+        return min(previous_interval * self.backoff, 1 / self.minimum_scans_per_second)
+
+
+def _as_scan_policy(scans_per_second: ScanRateType) -> ScanPolicy:
+    if isinstance(scans_per_second, ScanPolicy):
+        return scans_per_second
+    return FixedScanPolicy(scans_per_second)
+
+
+@dataclass
+class FiredCondition:
+    """
+    The condition that ended a call to ``BaseImage.wait_for_any``.
+    """
+
+    #: The condition's key in the ``conditions`` passed to ``wait_for_any``
+    name: Hashable
+    #: The regions matching the condition's needle, or the list returned by its predicate (empty if the predicate
+    #: returned something other than a list)
+    matches: List["MatchedRegionInImage"]
+
+
+def _as_float_channels(image: np.ndarray) -> np.ndarray:
+    """
+    Convert ``image`` to a float64 array with a channel dimension, even if it only has one channel.
+    """
+    image = np.asarray(image, dtype=np.float64)
+    return image if image.ndim == 3 else image[:, :, np.newaxis]
+
+
+def _scores_from_correlations(
+    correlations: np.ndarray,
+    window_sums: Optional[np.ndarray],
+    window_square_sums: np.ndarray,
+    needle: np.ndarray,
+    match_method,
+) -> np.ndarray:
+    """
+    Compute the score ``cv2.matchTemplate`` would give each window, given the correlation between the needle and the
+    window (the sum of their pixel-wise products), the window's per-channel sums, and the window's squared sum.  The
+    window sums are only needed by ``cv2.TM_CCOEFF`` and ``cv2.TM_CCOEFF_NORMED``.
+
+    This follows OpenCV's implementation, including how it handles windows whose norm is (close to) zero.
+    """
+    needle = _as_float_channels(needle)
+    n_pixels = needle.shape[0] * needle.shape[1]
+    needle_sums = needle.sum(axis=(0, 1))
+    needle_square_sum = float((needle**2).sum())
+    is_centered = match_method in (cv2.TM_CCOEFF, cv2.TM_CCOEFF_NORMED)
+
+    if match_method in (cv2.TM_CCORR, cv2.TM_CCORR_NORMED):
+        numerators = correlations
+    elif match_method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
+        numerators = window_square_sums - 2 * correlations
+        numerators += needle_square_sum
+        np.maximum(numerators, 0, out=numerators)
+    elif is_centered:
+        numerators = correlations - window_sums @ (needle_sums / n_pixels)
+        needle_square_sum -= float((needle_sums**2).sum()) / n_pixels
+        if match_method == cv2.TM_CCOEFF_NORMED and needle_square_sum < np.finfo(np.float64).eps * n_pixels:
+            return np.ones_like(correlations)
+    else:
+        raise ValueError(f"Unsupported match method: {match_method!r}")
+
+    if match_method not in (cv2.TM_SQDIFF_NORMED, cv2.TM_CCORR_NORMED, cv2.TM_CCOEFF_NORMED):
+        return numerators
+
+    if is_centered:
+        centered_square_sums = np.maximum(window_square_sums - (window_sums**2).sum(axis=-1) / n_pixels, 0)
+        norms = np.sqrt(centered_square_sums)
+        norms[centered_square_sums <= np.minimum(0.5, 10 * np.finfo(np.float32).eps * window_square_sums)] = 0
+    else:
+        norms = np.sqrt(window_square_sums)
+    norms *= np.sqrt(max(needle_square_sum, 0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = numerators / norms
+
+    out_of_range = ~(np.abs(numerators) < norms)
+    if out_of_range.any():
+        nearly_in_range = out_of_range & (np.abs(numerators) < norms * 1.125)
+        scores[out_of_range] = 1.0 if match_method == cv2.TM_SQDIFF_NORMED else 0.0
+        scores[nearly_in_range] = np.sign(numerators[nearly_in_range])
+    return scores
+
+
+def _match_template_numpy(
+    needle: np.ndarray,
+    haystack: np.ndarray,
+    match_method,
+    candidates: Optional[np.ndarray] = None,
+    prepared: Optional["PreparedHaystack"] = None,
+) -> np.ndarray:
+    """
+    A numpy implementation of ``cv2.matchTemplate`` that can evaluate just some locations in the haystack.
+
+    :param needle: The image to search for.
+    :param haystack: The image to search in.
+    :param match_method: Any of OpenCV's template matching methods.
+    :param candidates: An ``(n, 2)`` array of ``(x, y)`` locations in the haystack to evaluate.  If ``None``, all
+        locations are evaluated, which is only fast enough for small needles.
+    :param prepared: The prepared form of ``haystack``.  If ``None``, it is created when needed.
+    :return: If ``candidates`` is ``None``, the same scores as ``cv2.matchTemplate``.  Otherwise, the scores for each
+        candidate location.
+    """
+    needle_channels = _as_float_channels(needle)
+    height, width = needle_channels.shape[:2]
+    haystack = np.asarray(haystack)
+
+    if candidates is None:
+        haystack_channels = _as_float_channels(haystack)
+        n_rows = haystack_channels.shape[0] - height + 1
+        n_columns = haystack_channels.shape[1] - width + 1
+        if n_rows <= 0 or n_columns <= 0:
+            return np.empty((0, 0), dtype=np.float32)
+
+        correlations = np.zeros((n_rows, n_columns))
+        for y in range(height):
+            for x in range(width):
+                correlations += haystack_channels[y : y + n_rows, x : x + n_columns] @ needle_channels[y, x]
+
+        prepared = prepared or PreparedHaystack(haystack)
+        window_sums = prepared.window_sums(height, width)
+        window_square_sums = prepared.window_square_sums(height, width)
+    else:
+        # The windows are taken from the haystack as it is, and only the gathered windows are converted to floats,
+        # rather than converting the whole haystack to score a few locations
+        haystack_channels = haystack if haystack.ndim == 3 else haystack[:, :, np.newaxis]
+        all_windows = np.lib.stride_tricks.sliding_window_view(haystack_channels, (height, width), axis=(0, 1))
+        correlations = np.empty(len(candidates))
+        window_sums = np.empty((len(candidates), needle_channels.shape[2]))
+        window_square_sums = np.empty(len(candidates))
+
+        # Gathering the windows copies them, so only gather a limited number of pixels at a time
+        chunk_size = max(1, _CANDIDATE_CHUNK_PIXELS // needle_channels.size)
+        for start in range(0, len(candidates), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            windows = all_windows[candidates[chunk, 1], candidates[chunk, 0]].astype(np.float64)
+            correlations[chunk] = np.einsum("nchw,hwc->n", windows, needle_channels)
+            window_sums[chunk] = windows.sum(axis=(2, 3))
+            window_square_sums[chunk] = (windows**2).sum(axis=(1, 2, 3))
+
+    return _scores_from_correlations(
+        correlations, window_sums, window_square_sums, needle_channels, match_method
+    ).astype(np.float32)
+
+
+class PreparedHaystack:
+    """
+    A haystack with its integral images, which give the sum over any window of the haystack in constant time.
+
+    The normalized match methods need the sum (and squared sum) of every window in the haystack that the needle is
+    compared to.  Preparing the haystack once lets every needle, of any size, reuse the same integral images instead of
+    recomputing the window sums each search.  The integral images are only computed when first needed.
+    """
+
+    # Number of window sizes to remember the window sums for
+    _MAX_CACHED_WINDOW_SIZES = 4
+
+    def __init__(self, image: np.ndarray):
+        self._image = image
+        self._region = Region(0, 0, image.shape[1], image.shape[0])
+        self._integrals: Dict[str, np.ndarray] = {}
+        self._window_square_sums: Dict[Tuple[int, int], np.ndarray] = {}
+
+    @property
+    def image(self) -> np.ndarray:
+        """
+        The haystack.
+        """
+        x_min, x_max, y_min, y_max = self._region.left, self._region.right, self._region.top, self._region.bottom
+        return self._image[y_min:y_max, x_min:x_max]
+
+    @property
+    def width(self) -> int:
+        return self._region.width
+
+    @property
+    def height(self) -> int:
+        return self._region.height
+
+    def get_child(self, region: Region) -> "PreparedHaystack":
+        """
+        Get the prepared form of a region within the haystack.  It shares this haystack's integral images, so no new
+        integral images need to be computed.
+        """
+        child = PreparedHaystack.__new__(PreparedHaystack)
+        child._image = self._image
+        child._region = Region(self._region.x + region.x, self._region.y + region.y, region.width, region.height)
+        child._integrals = self._integrals
+        child._window_square_sums = {}
+        return child
+
+    def _get_integral(self, name: str) -> np.ndarray:
+        if name not in self._integrals:
+            if name == "sums":
+                integral = cv2.integral(self._image, sdepth=cv2.CV_64F)
+            else:
+                # float32 holds the squares of 8-bit pixels (and their sum over the channels) exactly
+                pixels = np.asarray(self._image, dtype=np.float32)
+                squares = pixels * pixels
+                if squares.ndim == 3:
+                    squares = squares.sum(axis=2)
+                integral = cv2.integral(squares, sdepth=cv2.CV_64F)
+            self._integrals[name] = _as_float_channels(integral)
+        return self._integrals[name]
+
+    def _window_totals(self, integral: np.ndarray, height: int, width: int) -> np.ndarray:
+        n_rows = self._region.height - height + 1
+        n_columns = self._region.width - width + 1
+        if n_rows <= 0 or n_columns <= 0:
+            return np.empty((0, 0, integral.shape[2]))
+
+        top, left = self._region.top, self._region.left
+        bottom, right = top + height, left + width
+        return (
+            integral[bottom : bottom + n_rows, right : right + n_columns]
+            - integral[top : top + n_rows, right : right + n_columns]
+            - integral[bottom : bottom + n_rows, left : left + n_columns]
+            + integral[top : top + n_rows, left : left + n_columns]
+        )
+
+    def sums_at(self, xs: np.ndarray, ys: np.ndarray, height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the sums of just some ``height`` x ``width`` windows, whose top left corners are at ``(xs[i], ys[i])``.
+
+        :return: The per-channel sums (shape ``(n, channels)``) and the squared sums over all channels (shape ``(n,)``)
+            of the windows.
+        """
+        top = ys + self._region.top
+        left = xs + self._region.left
+        bottom, right = top + height, left + width
+
+        def gather_totals(integral):
+            return integral[bottom, right] - integral[top, right] - integral[bottom, left] + integral[top, left]
+
+        square_sums = gather_totals(self._get_integral("square_sums"))[:, 0]
+        return gather_totals(self._get_integral("sums")), np.maximum(square_sums, 0)
+
+    def window_sums(self, height: int, width: int) -> np.ndarray:
+        """
+        Get the per-channel sum of every ``height`` x ``width`` window.  Element ``[y, x, c]`` is the sum of channel
+        ``c`` over the window whose top left corner is ``(x, y)``.
+        """
+        return self._window_totals(self._get_integral("sums"), height, width)
+
+    def window_square_sums(self, height: int, width: int) -> np.ndarray:
+        """
+        Get the sum of the squared pixel values (over all channels) of every ``height`` x ``width`` window.  Element
+        ``[y, x]`` is the squared sum of the window whose top left corner is ``(x, y)``.
+        """
+        key = (height, width)
+        if key not in self._window_square_sums:
+            if len(self._window_square_sums) >= self._MAX_CACHED_WINDOW_SIZES:
+                del self._window_square_sums[next(iter(self._window_square_sums))]
+            square_sums = self._window_totals(self._get_integral("square_sums"), height, width)[:, :, 0]
+            # Rounding errors in the integral image can make the sums of (nearly) black windows slightly negative
+            self._window_square_sums[key] = np.maximum(square_sums, 0)
+        return self._window_square_sums[key]
+
+
+def _split_into_blocks(height: int, width: int, n_blocks: int) -> List[Region]:
+    """
+    Split a ``height`` x ``width`` area into a grid of (up to) ``n_blocks`` x ``n_blocks`` blocks of nearly equal size.
+    """
+    row_edges = np.unique(np.linspace(0, height, min(n_blocks, height) + 1).astype(int))
+    column_edges = np.unique(np.linspace(0, width, min(n_blocks, width) + 1).astype(int))
+    return [
+        Region.from_coordinates(left, top, right, bottom)
+        for top, bottom in zip(row_edges[:-1], row_edges[1:])
+        for left, right in zip(column_edges[:-1], column_edges[1:])
+    ]
+
+
+def _eliminate_candidates(
+    needle: np.ndarray, prepared: "PreparedHaystack", match_threshold: float, block_levels: Iterable[int] = (1, 2, 4, 8)
+) -> Optional[np.ndarray]:
+    """
+    Find the locations in the haystack where ``needle`` could be at least ``match_threshold`` similar using
+    ``cv2.TM_SQDIFF_NORMED``, without computing the full distance at each location.
+
+    A location matches when the squared distance between the needle and the window is at most
+    ``(1 - match_threshold) * sqrt(needle_square_sum * window_square_sum)``.  Cheap lower bounds on the squared distance
+    come from the window sums (via the integral images): for any block of pixels, the squared distance is at least
+    ``(||window|| - ||needle||)^2`` (triangle inequality) and at least ``sum((window_sum - needle_sum)^2) / n_pixels``
+    (Cauchy-Schwarz).  A location is eliminated as soon as a bound exceeds the allowed distance, so no true match is
+    eliminated.  Each level splits the needle into more blocks, which gives tighter (but more expensive) bounds, so
+    only the locations that survive the previous level are checked.
+
+    :return: An ``(n, 2)`` array of the ``(x, y)`` locations that could not be eliminated, or ``None`` if too many
+        locations survive for elimination to be worthwhile (e.g. a low ``match_threshold`` or a plain needle).
+    """
+    needle_channels = _as_float_channels(needle)
+    height, width = needle_channels.shape[:2]
+    needle_norm = np.sqrt((needle_channels**2).sum())
+
+    window_square_sums = prepared.window_square_sums(height, width)
+    allowed_distances = (1 - match_threshold) * needle_norm * np.sqrt(window_square_sums)
+    lower_bounds = (np.sqrt(window_square_sums) - needle_norm) ** 2
+    ys, xs = np.nonzero(lower_bounds <= allowed_distances * (1 + _ELIMINATION_TOLERANCE) + _ELIMINATION_TOLERANCE)
+    allowed_distances = allowed_distances[ys, xs]
+
+    for n_blocks in block_levels:
+        if len(xs) * n_blocks**2 > _ELIMINATION_MAX_SURVIVOR_PIXELS // 64:
+            return None
+        lower_bounds = np.zeros(len(xs))
+        for block in _split_into_blocks(height, width, n_blocks):
+            needle_block = needle_channels[block.top : block.bottom, block.left : block.right]
+            window_sums, window_square_sums = prepared.sums_at(xs + block.x, ys + block.y, block.height, block.width)
+            sums_bound = ((window_sums - needle_block.sum(axis=(0, 1))) ** 2).sum(axis=1) / (block.width * block.height)
+            norms_bound = (np.sqrt(window_square_sums) - np.sqrt((needle_block**2).sum())) ** 2
+            lower_bounds += np.maximum(sums_bound, norms_bound)
+
+        could_match = lower_bounds <= allowed_distances * (1 + _ELIMINATION_TOLERANCE) + _ELIMINATION_TOLERANCE
+        xs, ys, allowed_distances = xs[could_match], ys[could_match], allowed_distances[could_match]
+
+    if len(xs) * height * width > _ELIMINATION_MAX_SURVIVOR_PIXELS:
+        return None
+    return np.stack([xs, ys], axis=1)
+
+
+def _scale_length(length: float, scale: float) -> int:
+    """
+    Scale ``length`` (e.g. a width or a right edge), rounding up so nothing is cut off.
+    """
+    return math.ceil(length * scale - _SCALE_TOLERANCE)
+
+
+def _resize(image: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Resize ``image`` to ``width`` x ``height`` pixels.  Area interpolation averages the pixels that are combined, so
+    shrinking doesn't alias.
+    """
+    if image.shape[:2] == (height, width):
+        return image
+    return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+
+
+def _to_similarity(result: np.ndarray, match_method) -> np.ndarray:
+    """
+    Convert the scores from template matching so higher scores always mean more similar.
+    """
+    if match_method == cv2.TM_SQDIFF:
+        return result.max(initial=0) - result
+    if match_method == cv2.TM_SQDIFF_NORMED:
+        return 1 - result
+    return result
+
+
 def _find_all_within(
-    needle: np.ndarray, haystack: np.ndarray, match_threshold: float = 1.0, *, match_method=cv2.TM_SQDIFF_NORMED
+    needle: np.ndarray,
+    haystack: np.ndarray,
+    match_threshold: float = 1.0,
+    *,
+    match_method=cv2.TM_SQDIFF_NORMED,
+    backend: Optional[MatchBackendType] = None,
+    candidates: Optional[np.ndarray] = None,
+    prepared: Optional[PreparedHaystack] = None,
 ) -> Iterable[Tuple[Region, float]]:
+    """
+    Find all locations of ``needle`` in ``haystack`` that are at least ``match_threshold`` similar.
+
+    :param backend: How to compare the needle and haystack.  "opencv" uses ``cv2.matchTemplate``.  "numpy" uses
+        ``_match_template_numpy``, which is slower when searching the whole haystack but can evaluate just a few
+        locations.  "elimination" is experimental: it first rules out the locations that provably can't be similar
+        enough (see ``_eliminate_candidates``), then uses the "numpy" backend on the remaining locations.  It gives the
+        same matches as "opencv", but isn't faster in the cases measured so far.  It falls back to "opencv" when too
+        many locations survive, and for match methods other than ``cv2.TM_SQDIFF_NORMED`` (e.g. ``cv2.TM_SQDIFF``
+        scores are relative to the worst location, so no location can be ruled out without computing them all).  If
+        ``None``, then "numpy" is used when ``candidates`` is provided and "opencv" otherwise.
+    :param candidates: An ``(n, 2)`` array of ``(x, y)`` locations (the top left corner of the needle) to evaluate.  If
+        ``None``, all locations are evaluated.  When provided, ``cv2.TM_SQDIFF`` scores are relative to the worst
+        candidate instead of the worst location in the haystack.
+    :param prepared: The prepared form of ``haystack``.  When provided, the window sums needed by the normalized match
+        methods come from its integral images instead of being recomputed.
+    """
     # https://stackoverflow.com/questions/7853628/how-do-i-find-an-image-contained-within-an-image/15147009#15147009
     height, width = needle.shape[:2]
 
-    result = cv2.matchTemplate(needle, haystack, match_method)
-    if match_method == cv2.TM_SQDIFF:
-        result = result.max() - result
-    elif match_method == cv2.TM_SQDIFF_NORMED:
-        result = 1 - result
+    if backend is None:
+        backend = "opencv" if candidates is None else "numpy"
+    if backend not in ("opencv", "numpy", "elimination"):
+        raise ValueError(f'Unrecognized value for "backend": {backend!r}')
+    if backend == "opencv" and candidates is not None:
+        raise ValueError('The "opencv" backend cannot evaluate candidate locations; use the "numpy" backend')
+
+    if backend == "elimination":
+        if match_method == cv2.TM_SQDIFF_NORMED and candidates is None and match_threshold > 0:
+            prepared = prepared or PreparedHaystack(haystack)
+            candidates = _eliminate_candidates(needle, prepared, match_threshold)
+        backend = "opencv" if candidates is None else "numpy"
+
+    if candidates is None:
+        if backend == "numpy":
+            result = _match_template_numpy(needle, haystack, match_method, prepared=prepared)
+        elif prepared is not None and match_method in (cv2.TM_SQDIFF_NORMED, cv2.TM_CCORR_NORMED):
+            result = _scores_from_correlations(
+                cv2.matchTemplate(haystack, needle, cv2.TM_CCORR),
+                None,
+                prepared.window_square_sums(height, width),
+                needle,
+                match_method,
+            )
+        else:
+            result = cv2.matchTemplate(needle, haystack, match_method)
+        result = _to_similarity(result, match_method)
+
+        locations = np.where(result >= match_threshold)
+        scores = result[locations]
+        xs, ys = locations[1], locations[0]
+    else:
+        candidates = np.asarray(candidates, dtype=np.intp).reshape(-1, 2)
+        haystack_height, haystack_width = haystack.shape[:2]
+        candidates = candidates[
+            (candidates[:, 0] >= 0)
+            & (candidates[:, 1] >= 0)
+            & (candidates[:, 0] + width <= haystack_width)
+            & (candidates[:, 1] + height <= haystack_height)
+        ]
+        result = _to_similarity(_match_template_numpy(needle, haystack, match_method, candidates), match_method)
+
+        is_match = result >= match_threshold
+        scores = result[is_match]
+        xs, ys = candidates[is_match, 0], candidates[is_match, 1]
+
+    return ((Region(x, y, width, height), score) for x, y, score in zip(xs, ys, scores))
+
+
+def _compute_edge_map(image: np.ndarray) -> np.ndarray:
+    """
+    Compute the gradient magnitude of ``image``, keeping the strongest response across the color channels.
+
+    The result only depends on where colors change, not on which colors are used, so it is the same for e.g. a light
+    and a dark theme of the same UI.
+    """
+    image = np.asarray(image, dtype=np.float32)
+    x_gradient = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3)
+    y_gradient = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3)
+    magnitude = cv2.magnitude(x_gradient, y_gradient)
+    if magnitude.ndim == 3:
+        magnitude = magnitude.max(axis=2)
+    return magnitude
+
+
+def _find_all_edges_within(
+    needle_edges: np.ndarray,
+    haystack_edges: np.ndarray,
+    match_threshold: float = 1.0,
+    *,
+    candidates: Optional[np.ndarray] = None,
+    **kwargs,
+) -> Iterable[Tuple[Region, float]]:
+    """
+    Find ``needle_edges`` within ``haystack_edges``, where both are edge maps from ``_compute_edge_map``.
+
+    The border of the needle's edge map is trimmed before matching (see ``_EDGE_MAP_MARGIN``) and the regions returned
+    are adjusted so they cover the full needle.  ``candidates`` are locations of the full needle.  Other keyword
+    arguments are passed to ``_find_all_within``.
+    """
+    height, width = needle_edges.shape[:2]
+    margin = _EDGE_MAP_MARGIN if min(height, width) > 2 * _EDGE_MAP_MARGIN else 0
+    trimmed_needle = needle_edges[margin : height - margin, margin : width - margin]
+    if candidates is not None:
+        candidates = np.asarray(candidates, dtype=np.intp).reshape(-1, 2) + margin
+
+    haystack_height, haystack_width = haystack_edges.shape[:2]
+    results = _find_all_within(trimmed_needle, haystack_edges, match_threshold, candidates=candidates, **kwargs)
+    for region, score in results:
+        region = Region(region.x - margin, region.y - margin, width, height)
+        if region.left >= 0 and region.top >= 0 and region.right <= haystack_width and region.bottom <= haystack_height:
+            yield region, score
+
+
+def _patch_entropy(patch: np.ndarray) -> float:
+    """
+    The Shannon entropy (in bits) of the brightness of the patch's pixels.
+    """
+    brightness = patch.mean(axis=2) if patch.ndim == 3 else patch
+    counts, _ = np.histogram(brightness, bins=32, range=(0, 256))
+    probabilities = counts[counts > 0] / counts.sum()
+    return float(-(probabilities * np.log2(probabilities)).sum())
+
+
+def _select_distinctive_patch(needle: np.ndarray, patch_size: int = _SUBPATCH_SIZE) -> Optional[Region]:
+    """
+    Choose the small region of ``needle`` that best identifies it, so the region can be searched for instead of the
+    whole needle.
+
+    The highest-entropy (i.e. most detailed) patches from across the needle are compared to the rest of the needle and
+    the one least similar to anywhere else in the needle is chosen, since that patch is also the least likely to match
+    the wrong location in the haystack.
+
+    :return: The region of the chosen patch, or ``None`` if the needle is too small to benefit from a sub-patch.
+    """
+    height, width = needle.shape[:2]
+    if height < 2 * patch_size or width < 2 * patch_size:
+        return None
 
-    locations = np.where(result >= match_threshold)
-    scores = result[locations]
-    return ((Region(x, y, width, height), score) for (x, y), score in zip(zip(*locations[::-1]), scores))
+    stride = patch_size // 2
+    patches = [
+        Region(x, y, patch_size, patch_size)
+        for y in range(0, height - patch_size + 1, stride)
+        for x in range(0, width - patch_size + 1, stride)
+    ]
+
+    # Keep the most detailed patch from each part of the needle, so the candidates aren't all from one busy area
+    candidates_by_area: Dict[Tuple[int, int], Tuple[float, Region]] = {}
+    for patch in patches:
+        entropy = _patch_entropy(needle[patch.top : patch.bottom, patch.left : patch.right])
+        area = (
+            patch.y * _SUBPATCH_GRID_SIZE // (height - patch_size + 1),
+            patch.x * _SUBPATCH_GRID_SIZE // (width - patch_size + 1),
+        )
+        if area not in candidates_by_area or entropy > candidates_by_area[area][0]:
+            candidates_by_area[area] = (entropy, patch)
+
+    needle_pixels = np.asarray(needle, dtype=np.float32)
+    best_patch, best_score = None, None
+    for entropy, patch in candidates_by_area.values():
+        patch_pixels = np.ascontiguousarray(needle_pixels[patch.top : patch.bottom, patch.left : patch.right])
+        distances = cv2.matchTemplate(needle_pixels, patch_pixels, cv2.TM_SQDIFF_NORMED)
+
+        # Ignore the patch's own location (and the locations overlapping it by more than half)
+        distances[
+            max(patch.y - stride, 0) : patch.y + stride + 1,
+            max(patch.x - stride, 0) : patch.x + stride + 1,
+        ] = np.inf
+        uniqueness = min(float(distances.min()), 1.0)
+
+        score = (uniqueness, entropy)
+        if best_score is None or score > best_score:
+            best_patch, best_score = patch, score
+
+    return best_patch
+
+
+def _find_all_by_subpatch(
+    needle: np.ndarray,
+    patch: Region,
+    haystack: np.ndarray,
+    match_threshold: float = 1.0,
+    *,
+    match_method=cv2.TM_SQDIFF_NORMED,
+    prepared: Optional[PreparedHaystack] = None,
+    **kwargs,
+) -> Iterable[Tuple[Region, float]]:
+    """
+    Find ``needle`` by first searching for the ``patch`` region of it, then checking the whole needle at each location
+    implied by where the patch was found.
+
+    The patch is searched for with a lower threshold than the needle (see ``_SUBPATCH_TOLERANCE_FACTOR``), since the
+    needle's differences from the haystack can be concentrated in the patch.  If the patch is found in more than
+    ``_SUBPATCH_MAX_CANDIDATES`` places, the whole needle is searched for instead.  The scores returned are for the
+    whole needle.  Other keyword arguments are passed to ``_find_all_within``.
+    """
+    patch_pixels = needle[patch.top : patch.bottom, patch.left : patch.right]
+    patch_threshold = 1 - (1 - match_threshold) * _SUBPATCH_TOLERANCE_FACTOR
+    kwargs = dict(kwargs, match_method=match_method, prepared=prepared)
+    patch_matches = list(_find_all_within(patch_pixels, haystack, patch_threshold, **kwargs))
+    if len(patch_matches) > _SUBPATCH_MAX_CANDIDATES:
+        return _find_all_within(needle, haystack, match_threshold, **kwargs)
+    candidates = np.array([(region.x - patch.x, region.y - patch.y) for region, _ in patch_matches], dtype=np.intp)
+
+    return _find_all_within(
+        needle,
+        haystack,
+        match_threshold,
+        match_method=match_method,
+        backend="numpy",
+        candidates=candidates.reshape(-1, 2),
+        prepared=prepared,
+    )
+
+
+class _WaitLoop:
+    """
+    The bookkeeping of the ``wait_until_*`` methods (and their asyncio versions): scanning the image with ``search``
+    (e.g. searching it for a needle), scheduling the scans, and keeping the statistics (which are stored in the image's
+    ``last_wait_statistics``).
+
+    Scans are scheduled every ``1 / scans_per_second`` seconds from the start (or at the intervals chosen by a
+    ``ScanPolicy``, and no more often than the wait's watcher allows), so the time a scan takes counts toward the wait
+    until the next one.  If a scan takes longer than that, the scans that were missed are skipped rather than made in a
+    burst.  There's always a first scan and, unless a scan is running at the time, a last scan at the deadline, and no
+    scan starts after the deadline.
+
+    When the image can change (e.g. the screen), each scan first checks whether the image changed since the previous
+    scan (by more than ``change_tolerance``; see ``ChangeDetector``), and if it didn't, the previous scan's result is
+    reused instead of searching again.  That's what keeps text waits from recognizing the text on every scan.
+    """
+
+    def __init__(
+        self,
+        image: "BaseImage",
+        search: Callable[["BaseImage"], T],
+        timeout: float,
+        scans_per_second: ScanRateType,
+        change_tolerance: float = 0,
+    ):
+        self._image = image
+        self._search = search
+
+        self._statistics = WaitStatistics()
+        image.last_wait_statistics = self._statistics
+        self._change_detector = image._create_change_detector(change_tolerance) if image._is_live else None
+
+        self._policy = _as_scan_policy(scans_per_second)
+        self._interval: Optional[float] = None
+        self._watcher = get_current_watcher()
+        self._start = time.monotonic()
+        self._deadline = self._start + max(timeout, 0)
+        self._next_scan = self._start
+        self._last_scan_end = self._start
+        self._has_result = False
+        self._result: Optional[T] = None
+        # The image's damage count from before the last snapshot, for waiting until the image changes after it
+        self._damage_count: Optional[int] = None
+
+    @property
+    def damage_count(self) -> Optional[int]:
+        return self._damage_count
+
+    def _run_search(self, image: "BaseImage") -> T:
+        search_start = time.monotonic()
+        result = self._search(image)
+        self._statistics.search_time += time.monotonic() - search_start
+        self._has_result = True
+        return result
+
+    def _next_interval(self, changed: bool) -> float:
+        interval = self._policy.next_interval(self._interval, changed)
+        if self._watcher is not None:
+            interval = self._watcher.cap_interval(interval)
+        return interval
+
+    def _finish_scan(self, changed: bool) -> T:
+        self._interval = self._next_interval(changed)
+        self._statistics.scans += 1
+        self._last_scan_end = time.monotonic()
+        self._statistics.elapsed_time = self._last_scan_end - self._start
+        return self._result
+
+    def scan(self) -> T:
+        """
+        Scan the image, and get the result.  If the wait belongs to a watcher (see ``ScanScheduler``), the scan first
+        waits for the scheduler to let it start.
+        """
+        if self._watcher is None:
+            return self._scan()
+        period = self._interval if self._interval is not None else self._next_interval(True)
+        with self._watcher.scan(self._next_scan, period):
+            return self._scan()
+
+    def _scan(self) -> T:
+        if self._change_detector is None:
+            self._result = self._run_search(self._image)
+            has_changed = False
+        else:
+            self._damage_count = self._image._get_damage_count()
+            snapshot = self._image._snapshot()
+            if snapshot.capture_info is not None:
+                self._statistics.capture_time += snapshot.capture_info.duration
+            has_changed = self._change_detector.has_changed(snapshot._get_numpy_image(), self._damage_count)
+            if not self._has_result or has_changed:
+                self._result = self._run_search(snapshot)
+            else:
+                self._statistics.skipped_scans += 1
+        return self._finish_scan(has_changed)
+
+    def skip(self) -> T:
+        """
+        Count a scan without looking at the image, because it's known not to have changed, and get the previous result.
+        """
+        self._statistics.skipped_scans += 1
+        return self._finish_scan(False)
+
+    def time_until_next_scan(self) -> Optional[float]:
+        """
+        Get how long (in seconds) to wait after the last scan before the next scan, or ``None`` if the deadline has
+        passed.
+        """
+        if self._last_scan_end >= self._deadline - _DEADLINE_TOLERANCE:
+            return None
+        next_scan = self._next_scan + self._interval
+        if next_scan < self._last_scan_end:
+            next_scan += math.ceil((self._last_scan_end - next_scan) / self._interval) * self._interval
+        if next_scan > self._deadline - _DEADLINE_TOLERANCE:
+            next_scan = self._deadline
+        self._next_scan = next_scan
+        return next_scan - self._last_scan_end
+
+    def remaining_time(self) -> float:
+        """
+        Get how long (in seconds) is left until the deadline.
+        """
+        return max(self._deadline - time.monotonic(), 0)
 
 
 class BaseImage:
     def __init__(self):
         self._ocr_matchers = {}
+        self._cache: Dict[Hashable, Any] = {}
+        self.last_wait_statistics: Optional[WaitStatistics] = None
 
     def _get_numpy_image(self) -> np.ndarray:
         """
@@ -57,6 +973,247 @@ class BaseImage:
     def _get_pil_image(self) -> PILImage.Image:
         return PILImage.fromarray(self._get_numpy_image())
 
+    def _get_region_numpy_image(self, region: Region) -> np.ndarray:
+        """
+        Get just the part of the image inside ``region``.  Images that can get a region more cheaply than getting the
+        whole image (e.g. the screen) override this.
+        """
+        region = self._to_pixels(region)
+        return self._get_numpy_image()[region.top : region.bottom, region.left : region.right, :]
+
+    @property
+    def _scale(self) -> float:
+        """
+        How many pixels of ``_get_numpy_image`` there are per unit of the image's coordinates.  It's less than 1 for an
+        image captured at a reduced resolution (see ``Screen``), whose coordinates are still those of the full
+        resolution.
+        """
+        return 1.0
+
+    def _to_pixels(self, region: Region) -> Region:
+        """
+        Convert ``region`` from the image's coordinates to the pixels of ``_get_numpy_image`` that cover it.
+        """
+        scale = self._scale
+        if scale == 1:
+            return region
+        left, top = int(region.left * scale), int(region.top * scale)
+        return Region.from_coordinates(
+            left,
+            top,
+            max(_scale_length(region.right, scale), left + 1),
+            max(_scale_length(region.bottom, scale), top + 1),
+        )
+
+    def _from_pixels(self, region: Region, size: Optional[Tuple[int, int]] = None) -> Region:
+        """
+        Convert ``region`` from pixels of ``_get_numpy_image`` to the image's coordinates.
+
+        :param size: The ``(width, height)`` of the region in the image's coordinates, if it's known (e.g. the size of a
+            needle that was found).  Otherwise, it's scaled from the pixels.
+        """
+        scale = self._scale
+        if scale == 1:
+            return region
+        if size is None:
+            left, top = int(region.left / scale), int(region.top / scale)
+            right = min(_scale_length(region.right, 1 / scale), self.width)
+            bottom = min(_scale_length(region.bottom, 1 / scale), self.height)
+            return Region.from_coordinates(left, top, right, bottom)
+        width, height = size
+        return Region(
+            max(min(round(region.x / scale), self.width - width), 0),
+            max(min(round(region.y / scale), self.height - height), 0),
+            width,
+            height,
+        )
+
+    def _get_scaled_numpy_image(self, scale: float) -> np.ndarray:
+        """
+        Get the image resized by ``scale``, e.g. to search for it in an image captured at a reduced resolution.
+        """
+        if scale == 1:
+            return self._get_numpy_image()
+
+        def resize() -> np.ndarray:
+            numpy_image = self._get_numpy_image()
+            height, width = numpy_image.shape[:2]
+            return _resize(numpy_image, max(_scale_length(width, scale), 1), max(_scale_length(height, scale), 1))
+
+        return self._get_cached(("scaled", scale), resize)
+
+    @property
+    def _is_live(self) -> bool:
+        """
+        Whether the image can change between calls (e.g. the screen).  Data derived from a live image is not cached.
+        """
+        return False
+
+    def _get_cached(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Get the data derived from the image that is stored under ``key``, calling ``factory`` to create it if needed.
+        """
+        if self._is_live:
+            return factory()
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def _snapshot(self) -> "BaseImage":
+        """
+        Get an unchanging image of what the image currently shows.  Images that can't change return themselves.
+        """
+        if self._is_live:
+            numpy_image = self._get_numpy_image()
+            return Screenshot(
+                numpy_image, scale=self._scale, size=(self.width, self.height), capture_info=self.capture_info
+            )
+        return self
+
+    def _snapshot_region(self, region: Region) -> "RegionInImage":
+        """
+        Get an unchanging image of what ``region`` of the image currently shows, as a region of the snapshot, so the
+        regions found in it are still located in this image.  Images that can capture a region more cheaply than the
+        whole image (e.g. the screen) override this.
+        """
+        return self._snapshot().get_child_region(region)
+
+    def _create_change_detector(self, tolerance: float = 0) -> ChangeDetector:
+        return ChangeDetector(tolerance=tolerance)
+
+    def _get_damage_count(self) -> Optional[int]:
+        """
+        Get how many times the image was seen to change (see ``CaptureBackend.damage_count``), or ``None`` if it can't
+        tell.  To know whether a capture may differ from an earlier one, read the count before capturing, so a change
+        during the capture counts as a change after it.
+        """
+        return None
+
+    def _wait_for_change(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        """
+        Block until the image may have changed since its damage count was ``since`` (see ``_get_damage_count``), or
+        until ``timeout`` seconds pass (see ``CaptureBackend.wait_for_damage``).  Returns ``None`` immediately if the
+        image can't tell when it changes.
+        """
+        return None
+
+    @staticmethod
+    def _needle_search(
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        confidence: Optional[float],
+        text_kwargs: Optional[Mapping[str, Any]],
+        image_kwargs: Optional[Mapping[str, Any]],
+    ) -> Callable[["BaseImage"], List["MatchedRegionInImage"]]:
+        """
+        Get a function that searches an image for the needle, for ``_scan_repeatedly``.
+        """
+
+        def search(image: BaseImage) -> List[MatchedRegionInImage]:
+            return list(
+                image.find_all(needle, confidence, text_kwargs=text_kwargs, image_kwargs=image_kwargs, mode="any")
+            )
+
+        return search
+
+    def _scan_repeatedly(
+        self,
+        search: Callable[["BaseImage"], T],
+        timeout: float,
+        scans_per_second: ScanRateType,
+        change_tolerance: float = 0,
+    ) -> Iterator[T]:
+        """
+        Scan the image with ``search`` (called with the image, or a snapshot of it if it can change)
+        ``scans_per_second`` times per second until ``timeout``, yielding the result of each scan.
+        The statistics of the scans are stored in ``last_wait_statistics``.  See ``_WaitLoop`` for how scans are
+        scheduled.
+
+        If the image can tell when it changes (see ``_wait_for_change``), then once a scan is due, the wait continues
+        until the image changes, so an unchanging image isn't scanned at all and a change is scanned as soon as it
+        happens (but at most ``scans_per_second`` times per second).  If the image doesn't change before the deadline,
+        the last scan's result still holds and no final scan is made.
+        """
+        wait_loop = _WaitLoop(self, search, timeout, scans_per_second, change_tolerance)
+        while True:
+            yield wait_loop.scan()
+
+            delay = wait_loop.time_until_next_scan()
+            if delay is None:
+                return
+            pyautogui.sleep(delay)
+
+            if self._is_live and self._wait_for_change(wait_loop.remaining_time(), wait_loop.damage_count) is False:
+                return
+
+    async def _scan_repeatedly_async(
+        self,
+        search: Callable[["BaseImage"], T],
+        timeout: float,
+        scans_per_second: ScanRateType,
+        change_tolerance: float = 0,
+    ) -> AsyncIterator[T]:
+        """
+        The asyncio version of ``_scan_repeatedly``.  Scans run on the executor (see ``set_async_executor``), and the
+        time between them is spent in ``asyncio.sleep``.
+
+        Blocking until the image changes would hold one of the executor's threads for the whole wait, so instead, when a
+        scan is due, an image that can tell when it changes is only scanned if it did.
+        """
+        wait_loop = _WaitLoop(self, search, timeout, scans_per_second, change_tolerance)
+        result = await _run_in_executor(wait_loop.scan)
+        while True:
+            yield result
+
+            delay = wait_loop.time_until_next_scan()
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+            if self._is_live and await _run_in_executor(self._wait_for_change, 0, wait_loop.damage_count) is False:
+                result = wait_loop.skip()
+            else:
+                result = await _run_in_executor(wait_loop.scan)
+
+    def _get_edge_map(self, scale: float = 1) -> np.ndarray:
+        """
+        :param scale: Get the edge map of the image resized by this much (see ``_get_scaled_numpy_image``).
+        """
+        return self._get_cached(
+            "edge_map" if scale == 1 else ("edge_map", scale),
+            lambda: _compute_edge_map(self._get_scaled_numpy_image(scale)),
+        )
+
+    def _get_distinctive_patch(self, scale: float = 1) -> Optional[Region]:
+        """
+        Get the region of the image to search for when the image is used as a needle (see
+        ``_select_distinctive_patch``).
+
+        :param scale: Get the region of the image resized by this much (see ``_get_scaled_numpy_image``).
+        """
+        return self._get_cached(
+            "distinctive_patch" if scale == 1 else ("distinctive_patch", scale),
+            lambda: _select_distinctive_patch(self._get_scaled_numpy_image(scale)),
+        )
+
+    def _get_prepared_haystack(self, numpy_image: Optional[np.ndarray] = None) -> PreparedHaystack:
+        """
+        Get the image prepared for being searched (see ``PreparedHaystack``).
+
+        :param numpy_image: The image, if the caller already has it.  For a live image, this makes sure the prepared
+            form is for the same capture the caller is using.
+        """
+        return self._get_cached(
+            "prepared_haystack",
+            lambda: PreparedHaystack(self._get_numpy_image() if numpy_image is None else numpy_image),
+        )
+
+    def _has_prepared_haystack(self) -> bool:
+        """
+        Whether the image's prepared form (see ``_get_prepared_haystack``) was already created, so searching with it
+        reuses its integral images.
+        """
+        return not self._is_live and "prepared_haystack" in self._cache
+
     def get_as_inverted_colors(self) -> "Image":
         numpy_image = self._get_numpy_image()
         has_alpha = numpy_image.shape[2] == 4
@@ -99,6 +1256,21 @@ class BaseImage:
         """
         return Region(0, 0, self.width, self.height)
 
+    @property
+    def origin(self) -> Point:
+        """
+        Where the image's top left pixel is on the desktop (i.e. in the coordinates used for moving the mouse).  Images
+        that weren't captured from the screen are treated as if they were at (0, 0).
+        """
+        return Point(0, 0)
+
+    @property
+    def capture_info(self) -> Optional[CaptureInfo]:
+        """
+        When and how the image was captured from the screen, or ``None`` if it wasn't.
+        """
+        return None
+
     def show(
         self, *, bounding_boxes: Iterable[Region] = (), output_location: Optional[Union[str, Path]] = None
     ) -> None:
@@ -115,6 +1287,12 @@ class BaseImage:
             img = img.copy()
             canvas = ImageDraw.Draw(img)
             for bounding_box in bounding_boxes:
+                if self._scale != 1:
+                    bounding_box = self._to_pixels(
+                        Region.from_coordinates(
+                            bounding_box.left, bounding_box.top, bounding_box.right, bounding_box.bottom
+                        )
+                    )
                 canvas.rectangle(
                     (bounding_box.x, bounding_box.y, bounding_box.right, bounding_box.bottom), outline="blue", width=2
                 )
@@ -177,6 +1355,10 @@ class BaseImage:
         confidence: float = 0.99,
         *,
         match_method=cv2.TM_SQDIFF_NORMED,
+        match_domain: MatchDomainType = "color",
+        backend: Optional[MatchBackendType] = None,
+        candidates: Optional[Iterable[Union[Point, Tuple[int, int]]]] = None,
+        subpatch: bool = False,
     ) -> List["MatchedRegionInImage"]:
         """
         Find all locations of ``needle`` in the image.
@@ -189,22 +1371,99 @@ class BaseImage:
             considered a match.  Defaults to 0.99 (99%).  Setting the threshold to 1 (i.e. 100%) may result in false
             negatives (i.e. exact matches not being found).
         :param match_method: What technique should openCV's image matching method use?
+        :param match_domain: What to compare.  "color" (default) compares the pixels directly.  "edges" compares where
+            the colors change (i.e. the shapes), so a needle will also match when the colors are different, e.g. a
+            different UI theme.  Edge maps are cached on the images, so a needle's edge map is only computed once and
+            the haystack's edge map is shared by all needles.  Edge matching is less exact than color matching, so a
+            lower ``confidence`` (e.g. 0.95) is usually needed.
+        :param backend: What implementation to use for matching.  "opencv" (default unless ``candidates`` is provided)
+            uses openCV.  "numpy" uses a numpy implementation that gives the same results and is faster when only a few
+            locations need to be checked (see ``candidates``).  "elimination" is experimental: it rules out locations
+            that can't reach ``confidence`` using cheap bounds before checking the rest.  It gives the same matches as
+            "opencv" but isn't faster in the cases measured so far, and it only supports ``cv2.TM_SQDIFF_NORMED``
+            (other methods use "opencv").
+        :param candidates: If provided, only check these locations (the top left corner of the needle) instead of
+            searching the whole image.  This is useful for checking locations found some other way, e.g. in a previous
+            search.  Requires the "numpy" ``backend``.
+        :param subpatch: If true, large needles are found by searching for a small, distinctive part of the needle
+            and then checking the whole needle wherever that part was found.  For a large needle in a large image (e.g.
+            a screenshot of a whole dialog on a 4K screen) this can be up to about twice as fast, but it's often no
+            faster, or slower, for smaller needles and images, so measure before relying on it.  A needle may be
+            missed if its differences from the image are concentrated in the part that is searched for.  The part
+            chosen is cached on the needle.  Only used for color matching with ``cv2.TM_SQDIFF_NORMED`` or
+            ``cv2.TM_CCOEFF_NORMED`` and when no ``candidates`` are provided, and the whole needle is searched for
+            instead when the part is found in too many places.
         :return: Regions containing the found image(s). The regions are not in sorted order.
         """
-        if isinstance(needle, BaseImage):
-            needle = [needle]
+        if match_domain not in ("color", "edges"):
+            raise ValueError(f'Unrecognized value for "match_domain": {match_domain!r}')
+
+        needle = [needle] if isinstance(needle, BaseImage) else list(needle)
 
         if all(needle_part.width > self.width or needle_part.height > self.height for needle_part in needle):
             return []
 
-        numpy_image = self._get_numpy_image()
+        if candidates is not None:
+            candidates = np.array(
+                [(c.x, c.y) if isinstance(c, Point) else tuple(c) for c in candidates], dtype=np.intp
+            ).reshape(-1, 2)
+            if self._scale != 1:
+                candidates = (candidates * self._scale).astype(np.intp)
+
+        # The integral images of a prepared haystack only pay off when they're reused: by several needles, by earlier
+        # searches of the same image, or by the "elimination" backend (which needs them anyway).  Otherwise, e.g. when
+        # each scan of a wait searches a new screenshot for one needle, OpenCV's own matching is faster.
+        reuses_prepared = len(needle) > 1 or backend == "elimination"
+        prepared = None
+        if match_domain == "color":
+            haystack = self._get_numpy_image()
+            if reuses_prepared or self._has_prepared_haystack():
+                prepared = self._get_prepared_haystack(haystack)
+        else:
+            haystack = self._get_edge_map()
+            if reuses_prepared or (not self._is_live and "prepared_edge_map" in self._cache):
+                prepared = self._get_cached("prepared_edge_map", lambda: PreparedHaystack(haystack))
+
         all_found = []  # type: List[MatchedRegionInImage]
+        use_subpatch = (
+            subpatch
+            and match_domain == "color"
+            and candidates is None
+            # A loosened threshold lets a cv2.TM_CCORR_NORMED patch match almost everywhere, so it's never searched for
+            and match_method in (cv2.TM_SQDIFF_NORMED, cv2.TM_CCOEFF_NORMED)
+        )
         for needle_part in needle:
-            results = _find_all_within(
-                needle_part._get_numpy_image(), numpy_image, confidence, match_method=match_method
-            )
+            # Needles are resized to match the resolution of the image's pixels
+            needle_scale = self._scale / needle_part._scale
+            patch = needle_part._get_distinctive_patch(needle_scale) if use_subpatch else None
+            if patch is not None:
+                results = _find_all_by_subpatch(
+                    needle_part._get_scaled_numpy_image(needle_scale),
+                    patch,
+                    haystack,
+                    confidence,
+                    match_method=match_method,
+                    backend=backend,
+                    prepared=prepared,
+                )
+            else:
+                find_all_within = _find_all_within if match_domain == "color" else _find_all_edges_within
+                results = find_all_within(
+                    needle_part._get_scaled_numpy_image(needle_scale)
+                    if match_domain == "color"
+                    else needle_part._get_edge_map(needle_scale),
+                    haystack,
+                    confidence,
+                    match_method=match_method,
+                    backend=backend,
+                    candidates=candidates,
+                    prepared=prepared,
+                )
+            needle_size = (needle_part.width, needle_part.height)
             all_found.extend(
-                MatchedRegionInImage.from_region_in_image(self.get_child_region(region), needle_part, score)
+                MatchedRegionInImage.from_region_in_image(
+                    self.get_child_region(self._from_pixels(region, needle_size)), needle_part, score
+                )
                 for region, score in results
             )
 
@@ -239,6 +1498,10 @@ class BaseImage:
         """
         if isinstance(needle, str):
             needle = [needle]
+        else:
+            needle = list(needle)
+        if len(needle) == 0:
+            return []
 
         matcher = self._get_ocr_matcher(language, line_break, paragraph_break)
 
@@ -247,7 +1510,7 @@ class BaseImage:
             results = matcher.find_all(needle_part, regex=regex, regex_flags=regex_flags)
             all_found.extend(
                 MatchedRegionInImage.from_region_in_image(
-                    self.get_child_region(result.region), needle_part, result.confidence
+                    self.get_child_region(self._from_pixels(result.region)), needle_part, result.confidence
                 )
                 for result in results
                 if result.confidence >= confidence
@@ -279,34 +1542,61 @@ class BaseImage:
         confidence: Optional[float] = None,
         text_kwargs: Optional[Mapping[str, Any]] = None,
         image_kwargs: Optional[Mapping[str, Any]] = None,
+        mode: FindModeType = "all",
     ) -> List["MatchedRegionInImage"]:
         """
         Find all locations of ``needle`` in the image.
 
         This is a convenience wrapper around ``find_image_all`` and ``find_text_all``.  Based on the type for
-        ``needle``, the appropriate method will be called.
+        ``needle``, the appropriate method will be called.  When there are both text and image needles, the text is
+        recognized in the background while the images are searched for, so the two searches overlap.
 
         :param needle: Image, text, regular expression, or iterable of those types to search for.
         :param confidence: Confidence threshold to use for identifying matches.
         :param text_kwargs: Additional arguments to pass along to the `find_text_all` method.
         :param image_kwargs: Additional arguments to pass along to the `find_image_all` method.
+        :param mode: ``"all"`` to find the matches of every needle, or ``"any"`` to only find out whether any needle is
+            there.  In ``"any"`` mode, if an image needle is found, its matches are returned without waiting for the
+            text to be recognized.  An OCR pass that has already started finishes in the background, and until it
+            does, searches in ``"any"`` mode only recognize the text if no image needle is found.
         :return: Regions containing the matches.
         """
         # If the method header changes, remember to update it in Screen
+        if mode not in ("all", "any"):
+            raise ValueError(f'Unrecognized value for "mode": {mode!r}')
         text_kwargs = text_kwargs or {}
         image_kwargs = image_kwargs or {}
+        confidence_args = [confidence] if confidence is not None else []
 
         text_needles, image_needles = self._group_needles_by_type(needle)
 
-        text_results = self.find_text_all(
-            text_needles, *([confidence] if confidence is not None else []), **text_kwargs
-        )
-
-        image_results = self.find_image_all(
-            image_needles, *([confidence] if confidence is not None else []), **image_kwargs
-        )
-
-        return text_results + image_results
+        if len(text_needles) == 0 or len(image_needles) == 0:
+            text_results = self.find_text_all(text_needles, *confidence_args, **text_kwargs)
+            image_results = self.find_image_all(image_needles, *confidence_args, **image_kwargs)
+            return text_results + image_results
+
+        if mode == "any" and _is_abandoned_ocr_running():
+            # An earlier search's OCR, whose result isn't needed, is still running (e.g. from the previous scan of a
+            # wait that keeps finding the image).  Rather than queue up another OCR run that may not be needed either,
+            # only recognize the text if no image is found.
+            image_results = self.find_image_all(image_needles, *confidence_args, **image_kwargs)
+            if len(image_results) > 0:
+                return image_results
+            return self.find_text_all(text_needles, *confidence_args, **text_kwargs)
+
+        # Tesseract runs in a separate process and OpenCV releases the GIL, so the searches really do run at once.  The
+        # images are searched for on this thread, since that's usually much faster than OCR.
+        text_future = _get_ocr_executor().submit(self.find_text_all, text_needles, *confidence_args, **text_kwargs)
+        try:
+            image_results = self.find_image_all(image_needles, *confidence_args, **image_kwargs)
+        except BaseException:
+            _abandon_ocr_run(text_future)
+            raise
+
+        if mode == "any" and len(image_results) > 0:
+            _abandon_ocr_run(text_future)
+            return image_results
+        return text_future.result() + image_results
 
     def find_image(
         self, needle: Union["BaseImage", Iterable["BaseImage"]], confidence: Optional[float] = None, **kwargs
@@ -383,15 +1673,42 @@ class BaseImage:
             return result[0]
         return None
 
+    async def afind_all(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        confidence: Optional[float] = None,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> List["MatchedRegionInImage"]:
+        """
+        The asyncio version of ``find_all``.  The capture and search run on the asyncio executor (see
+        ``set_async_executor``), so the event loop isn't blocked.
+        """
+        return await _run_in_executor(self.find_all, needle, confidence, text_kwargs, image_kwargs)
+
+    async def afind(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        confidence: Optional[float] = None,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> Optional["MatchedRegionInImage"]:
+        """
+        The asyncio version of ``find``.  The capture and search run on the asyncio executor (see
+        ``set_async_executor``), so the event loop isn't blocked.
+        """
+        return await _run_in_executor(self.find, needle, confidence, text_kwargs, image_kwargs)
+
     def wait_until_appears(
         self,
         needle: Union[NeedleType, Iterable[NeedleType]],
         confidence: Optional[float] = None,
         timeout: float = 5,
         *,
-        scans_per_second: float = 3,
+        scans_per_second: ScanRateType = 3,
         text_kwargs: Optional[Mapping[str, Any]] = None,
         image_kwargs: Optional[Mapping[str, Any]] = None,
+        change_tolerance: float = 0,
     ) -> List["MatchedRegionInImage"]:
         """
         Pauses execution until the needle appears or it times out.
@@ -402,22 +1719,21 @@ class BaseImage:
             considered a match.  Defaults to 0.99 (99%).  Setting the threshold to 1 (i.e. 100%) may result in false
             negatives (i.e. exact matches not being found).
         :param timeout: Wait up to ``timeout`` seconds before giving up waiting.
-        :param scans_per_second: How many times per second should the image be searched for the needle.
+        :param scans_per_second: How many times per second should the image be searched for the needle, or a
+            ``ScanPolicy`` that varies the rate during the wait (e.g. ``BackoffScanPolicy``).
         :param text_kwargs: Additional arguments to pass along to the `find_text_all` method.
         :param image_kwargs: Additional arguments to pass along to the `find_image_all` method.
+        :param change_tolerance: The fraction of the image that may change without it being searched again (e.g. so a
+            blinking cursor or a clock doesn't make the text be recognized again).  See ``ChangeDetector``.
         :return: Regions containing the found needle(s). The regions are not in sorted order.  If ``timeout`` is reached
             and the needle did not appear, then an empty list will be returned.
         """
-        scan_count = 0 if timeout * scans_per_second > 0 else -1  # We want the loop to occur at least once
-        result = []
-        while scan_count < timeout * scans_per_second:
-            result = list(self.find_all(needle, confidence, text_kwargs=text_kwargs, image_kwargs=image_kwargs))
-            scan_count += 1
+        result: List[MatchedRegionInImage] = []
+        search = self._needle_search(needle, confidence, text_kwargs, image_kwargs)
+        for result in self._scan_repeatedly(search, timeout, scans_per_second, change_tolerance):
             if len(result) > 0:
                 break
 
-            pyautogui.sleep(1 / scans_per_second)
-
         return result
 
     def wait_until_image_appears(
@@ -427,7 +1743,7 @@ class BaseImage:
         timeout: float = 5,
         *,
         match_method=cv2.TM_SQDIFF_NORMED,
-        scans_per_second: float = 3,
+        scans_per_second: ScanRateType = 3,
     ) -> List["MatchedRegionInImage"]:
         """
         Pauses execution until the needle appears or it times out.
@@ -439,7 +1755,8 @@ class BaseImage:
             negatives (i.e. exact matches not being found).
         :param timeout: Wait up to ``timeout`` seconds before giving up waiting.
         :param match_method: What technique should openCV's image matching method use?
-        :param scans_per_second: How many times per second should the image be searched for the needle.
+        :param scans_per_second: How many times per second should the image be searched for the needle, or a
+            ``ScanPolicy`` that varies the rate during the wait (e.g. ``BackoffScanPolicy``).
         :return: Regions containing the found needle(s). The regions are not in sorted order.  If ``timeout`` is reached
             and the needle did not appear, then an empty list will be returned.
         """
@@ -462,7 +1779,8 @@ class BaseImage:
         language: Optional[str] = None,
         line_break: str = "\n",
         paragraph_break: str = "\n\n",
-        scans_per_second: float = 3,
+        scans_per_second: ScanRateType = 3,
+        change_tolerance: float = 0,
     ) -> List["MatchedRegionInImage"]:
         """
         Pauses execution until the needle appears or it times out.
@@ -480,7 +1798,10 @@ class BaseImage:
         :param language: A language the PyTesseract recognizes.  If `None` specified (default), then defaults to "eng".
         :param line_break: The string to use when concatenating two OCR'ed lines.
         :param paragraph_break:  The string to use when concatenating two OCR'ed paragraphs.
-        :param scans_per_second: How many times per second should the image be searched for the needle.
+        :param scans_per_second: How many times per second should the image be searched for the needle, or a
+            ``ScanPolicy`` that varies the rate during the wait (e.g. ``BackoffScanPolicy``).
+        :param change_tolerance: The fraction of the image that may change without the text being recognized again
+            (e.g. so a blinking cursor or a clock doesn't count).  See ``ChangeDetector``.
         :return: Regions containing the found needle(s). The regions are not in sorted order.  If ``timeout`` is reached
             and the needle did not appear, then an empty list will be returned.
         """
@@ -489,6 +1810,7 @@ class BaseImage:
             confidence,
             timeout,
             scans_per_second=scans_per_second,
+            change_tolerance=change_tolerance,
             text_kwargs={
                 "regex": regex,
                 "regex_flags": regex_flags,
@@ -504,9 +1826,10 @@ class BaseImage:
         confidence: Optional[float] = None,
         timeout: float = 5,
         *,
-        scans_per_second: float = 3,
+        scans_per_second: ScanRateType = 3,
         text_kwargs: Optional[Mapping[str, Any]] = None,
         image_kwargs: Optional[Mapping[str, Any]] = None,
+        change_tolerance: float = 0,
     ) -> bool:
         """
         Pauses execution until the needle vanishes or it times out.
@@ -517,20 +1840,19 @@ class BaseImage:
             considered a match.  Defaults to 0.99 (99%).  Setting the threshold to 1 (i.e. 100%) may result in false
             negatives (i.e. exact matches not being found).
         :param timeout: Wait up to ``timeout`` seconds before giving up waiting.
-        :param scans_per_second: How many times per second should the image be searched for the needle.
+        :param scans_per_second: How many times per second should the image be searched for the needle, or a
+            ``ScanPolicy`` that varies the rate during the wait (e.g. ``BackoffScanPolicy``).
         :param text_kwargs: Additional arguments to pass along to the `find_text_all` method.
         :param image_kwargs: Additional arguments to pass along to the `find_image_all` method.
+        :param change_tolerance: The fraction of the image that may change without it being searched again (e.g. so a
+            blinking cursor or a clock doesn't make the text be recognized again).  See ``ChangeDetector``.
         :return: True if the needle vanished, False if the method timed out.
         """
-        scan_count = 0 if timeout * scans_per_second > 0 else -1  # We want the loop to occur at least once
-        while scan_count < timeout * scans_per_second:
-            result = list(self.find_all(needle, confidence, text_kwargs=text_kwargs, image_kwargs=image_kwargs))
-            scan_count += 1
+        search = self._needle_search(needle, confidence, text_kwargs, image_kwargs)
+        for result in self._scan_repeatedly(search, timeout, scans_per_second, change_tolerance):
             if len(result) == 0:
                 return True
 
-            pyautogui.sleep(1 / scans_per_second)
-
         return False
 
     def wait_until_image_vanishes(
@@ -540,7 +1862,7 @@ class BaseImage:
         timeout: float = 5,
         *,
         match_method=cv2.TM_SQDIFF_NORMED,
-        scans_per_second: float = 3,
+        scans_per_second: ScanRateType = 3,
     ) -> bool:
         """
         Pauses execution until the needle vanishes or it times out.
@@ -552,7 +1874,8 @@ class BaseImage:
             negatives (i.e. exact matches not being found).
         :param timeout: Wait up to ``timeout`` seconds before giving up waiting.
         :param match_method: What technique should openCV's image matching method use?
-        :param scans_per_second: How many times per second should the image be searched for the needle.
+        :param scans_per_second: How many times per second should the image be searched for the needle, or a
+            ``ScanPolicy`` that varies the rate during the wait (e.g. ``BackoffScanPolicy``).
         :return: True if the needle vanished, False if the method timed out.
         """
         return self.wait_until_vanishes(
@@ -574,7 +1897,8 @@ class BaseImage:
         language: Optional[str] = None,
         line_break: str = "\n",
         paragraph_break: str = "\n\n",
-        scans_per_second: float = 3,
+        scans_per_second: ScanRateType = 3,
+        change_tolerance: float = 0,
     ) -> bool:
         """
         Pauses execution until the needle vanishes or it times out.
@@ -592,7 +1916,10 @@ class BaseImage:
         :param language: A language the PyTesseract recognizes.  If `None` specified (default), then defaults to "eng".
         :param line_break: The string to use when concatenating two OCR'ed lines.
         :param paragraph_break:  The string to use when concatenating two OCR'ed paragraphs.
-        :param scans_per_second: How many times per second should the image be searched for the needle.
+        :param scans_per_second: How many times per second should the image be searched for the needle, or a
+            ``ScanPolicy`` that varies the rate during the wait (e.g. ``BackoffScanPolicy``).
+        :param change_tolerance: The fraction of the image that may change without the text being recognized again
+            (e.g. so a blinking cursor or a clock doesn't count).  See ``ChangeDetector``.
         :return: True if the needle vanished, False if the method timed out.
         """
         return self.wait_until_vanishes(
@@ -600,6 +1927,7 @@ class BaseImage:
             confidence,
             timeout,
             scans_per_second=scans_per_second,
+            change_tolerance=change_tolerance,
             text_kwargs={
                 "regex": regex,
                 "regex_flags": regex_flags,
@@ -609,6 +1937,192 @@ class BaseImage:
             },
         )
 
+    def _conditions_search(
+        self,
+        conditions: Mapping[Hashable, Union[NeedleType, Iterable[NeedleType], Callable[["BaseImage"], Any]]],
+        confidence: Optional[float],
+        text_kwargs: Optional[Mapping[str, Any]],
+        image_kwargs: Optional[Mapping[str, Any]],
+    ) -> Callable[["BaseImage"], Optional[FiredCondition]]:
+        """
+        Get a function that checks the conditions of ``wait_for_any`` against an image, in order, and returns the first
+        one that holds.
+        """
+        searches = {
+            name: condition
+            if callable(condition)
+            else self._needle_search(condition, confidence, text_kwargs, image_kwargs)
+            for name, condition in conditions.items()
+        }
+
+        def search(image: BaseImage) -> Optional[FiredCondition]:
+            for name, condition_search in searches.items():
+                result = condition_search(image)
+                if result:
+                    return FiredCondition(name, result if isinstance(result, list) else [])
+            return None
+
+        return search
+
+    def wait_for_any(
+        self,
+        conditions: Mapping[Hashable, Union[NeedleType, Iterable[NeedleType], Callable[["BaseImage"], Any]]],
+        confidence: Optional[float] = None,
+        timeout: float = 5,
+        *,
+        scans_per_second: ScanRateType = 3,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+        change_tolerance: float = 0,
+    ) -> Optional[FiredCondition]:
+        """
+        Pauses execution until any of several conditions holds or it times out.
+
+        Each scan captures the image once and checks every condition against that capture, so waiting for several
+        outcomes (e.g. a success dialog or an error message) costs about the same as waiting for one.  Text needles
+        share the capture's OCR, so the text is recognized once per scan for each ``language``.
+
+        :param conditions: The conditions to wait for, by name.  A condition is either a needle (as for
+            ``wait_until_appears``), which holds when it's found, or a predicate, which is called with the captured
+            image and holds when it returns a truthy value.  Conditions are checked in order, so if several hold at
+            once, the first of them fires.
+        :param confidence: Sets the confidence threshold of the needles.  See ``wait_until_appears``.
+        :param timeout: Wait up to ``timeout`` seconds before giving up waiting.
+        :param scans_per_second: How many times per second should the image be checked, or a ``ScanPolicy`` that
+            varies the rate during the wait (e.g. ``BackoffScanPolicy``).
+        :param text_kwargs: Additional arguments to pass along to the `find_text_all` method.
+        :param image_kwargs: Additional arguments to pass along to the `find_image_all` method.
+        :param change_tolerance: The fraction of the image that may change without it being searched again (e.g. so a
+            blinking cursor or a clock doesn't make the text be recognized again).  See ``ChangeDetector``.
+        :return: The condition that fired and its matches, or ``None`` if ``timeout`` is reached and no condition held.
+        """
+        search = self._conditions_search(conditions, confidence, text_kwargs, image_kwargs)
+        for result in self._scan_repeatedly(search, timeout, scans_per_second, change_tolerance):
+            if result is not None:
+                return result
+
+        return None
+
+    def wait_until_stable(
+        self,
+        region: Optional[Region] = None,
+        quiet_period: float = 0.5,
+        timeout: float = 5,
+        *,
+        scans_per_second: ScanRateType = 10,
+    ) -> bool:
+        """
+        Pauses execution until the image stops changing (e.g. until an animation or a fade finishes) or it times out.
+
+        Successive captures are compared by the checksums of their tiles (see ``ChangeDetector``), and the image is
+        stable once no tile has changed for ``quiet_period`` seconds.  If the capture backend can tell when the screen
+        changes, the wait sleeps until it does, so it returns as soon as the quiet period is over.  An image that can't
+        change (e.g. an ``Image``) is always stable.
+
+        :param region: The region of the image to watch.  If ``None``, the whole image is watched.
+        :param quiet_period: How long (in seconds) the image must be unchanged to be stable.
+        :param timeout: Wait up to ``timeout`` seconds before giving up waiting.
+        :param scans_per_second: How many times per second should the image be captured, or a ``ScanPolicy`` that
+            varies the rate during the wait.
+        :return: True if the image became stable, False if the method timed out.
+        """
+        image = self if region is None else self.get_child_region(region)
+        if not image._is_live:
+            return True
+
+        change_detector = image._create_change_detector()
+        policy = _as_scan_policy(scans_per_second)
+        interval: Optional[float] = None
+        deadline = time.monotonic() + max(timeout, 0)
+        last_change = deadline
+        while True:
+            scan_time = time.monotonic()
+            damage_count = image._get_damage_count()
+            changed = change_detector.has_changed(image._get_numpy_image(), damage_count)
+            if changed:
+                last_change = scan_time
+            elif scan_time - last_change >= quiet_period - _DEADLINE_TOLERANCE:
+                return True
+            if scan_time >= deadline - _DEADLINE_TOLERANCE:
+                return False
+
+            interval = policy.next_interval(interval, changed)
+            quiet_end = last_change + quiet_period
+            pyautogui.sleep(max(min(scan_time + interval, quiet_end, deadline) - time.monotonic(), 0))
+
+            if image._wait_for_change(max(min(quiet_end, deadline) - time.monotonic(), 0), damage_count) is False:
+                return quiet_end <= deadline + _DEADLINE_TOLERANCE
+
+    async def await_until_appears(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        confidence: Optional[float] = None,
+        timeout: float = 5,
+        *,
+        scans_per_second: ScanRateType = 3,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+        change_tolerance: float = 0,
+    ) -> List["MatchedRegionInImage"]:
+        """
+        The asyncio version of ``wait_until_appears``.  Each scan runs on the asyncio executor (see
+        ``set_async_executor``) and the time between scans is spent in ``asyncio.sleep``, so many waits can run at once
+        on one event loop.  Cancelling the task stops the wait (a scan that's already running finishes in the
+        background).
+        """
+        result: List[MatchedRegionInImage] = []
+        search = self._needle_search(needle, confidence, text_kwargs, image_kwargs)
+        async for result in self._scan_repeatedly_async(search, timeout, scans_per_second, change_tolerance):
+            if len(result) > 0:
+                break
+
+        return result
+
+    async def await_until_vanishes(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        confidence: Optional[float] = None,
+        timeout: float = 5,
+        *,
+        scans_per_second: ScanRateType = 3,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+        change_tolerance: float = 0,
+    ) -> bool:
+        """
+        The asyncio version of ``wait_until_vanishes``.  Each scan runs on the asyncio executor (see
+        ``set_async_executor``) and the time between scans is spent in ``asyncio.sleep``, so many waits can run at once
+        on one event loop.  Cancelling the task stops the wait (a scan that's already running finishes in the
+        background).
+        """
+        search = self._needle_search(needle, confidence, text_kwargs, image_kwargs)
+        async for result in self._scan_repeatedly_async(search, timeout, scans_per_second, change_tolerance):
+            if len(result) == 0:
+                return True
+
+        return False
+
+    async def await_for_any(
+        self,
+        conditions: Mapping[Hashable, Union[NeedleType, Iterable[NeedleType], Callable[["BaseImage"], Any]]],
+        confidence: Optional[float] = None,
+        timeout: float = 5,
+        *,
+        scans_per_second: ScanRateType = 3,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+        change_tolerance: float = 0,
+    ) -> Optional[FiredCondition]:
+        """
+        The asyncio version of ``wait_for_any``.  See ``await_until_appears`` for how the scans run.
+        """
+        search = self._conditions_search(conditions, confidence, text_kwargs, image_kwargs)
+        async for result in self._scan_repeatedly_async(search, timeout, scans_per_second, change_tolerance):
+            if result is not None:
+                return result
+
+        return None
+
     def contains(self, needle: Union[NeedleType, Iterable[NeedleType]], *args, **kwargs) -> bool:
         """
         Determines whether ``needle`` appears in the image.
@@ -665,8 +2179,9 @@ class Image(BaseImage):
                 if image.shape[2] == 4:
                     # Remove alpha channel.  This is necessary for `find_image_all`, where color dimension needs to
                     # match between the two images (and the datatype, e.g. uint8 vs float, but for now this isn't
-                    # checked/corrected).
-                    image = image[:, :, :3]
+                    # checked/corrected).  Copy the color channels once here, since OpenCV would otherwise copy them on
+                    # every call.
+                    image = np.ascontiguousarray(image[:, :, :3])
                 self.__numpy_image = image
             else:
                 raise TypeError(f"Unrecognized type for image: {self._original_image!r}")
@@ -685,7 +2200,102 @@ class Image(BaseImage):
             )
         else:
             str_original_image = repr(self._original_image)
-        return f"Image(image={str_original_image})"
+        return f"{self.__class__.__name__}(image={str_original_image})"
+
+
+class Screenshot(Image):
+    """
+    An image captured from the screen, which remembers where on the desktop it was captured (see ``origin``).
+
+    A screenshot may have been captured at a reduced resolution (see ``Screen``).  Its coordinates (e.g. ``width`` and
+    the regions found in it) are still those of the full resolution.
+
+    :param image: The captured pixels.
+    :param origin: Where the image's top left pixel is on the desktop.
+    :param scale: How much the pixels were shrunk when they were captured, e.g. 0.5 if there's one pixel for every 2x2
+        pixels of the screen.
+    :param size: The ``(width, height)`` of the screen area that was captured.  If ``None``, it's calculated from the
+        size of ``image`` and ``scale``.
+    :param capture_info: When and how the image was captured, if known.
+    :param captured_region: If only part of the screen area was captured (e.g. just the region being waited on), the
+        part that ``image`` covers.  The screenshot still has the size and coordinates of the whole area, so the regions
+        found in it are located in the whole area, but only regions inside the captured part can be looked at.
+    """
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        origin: Point = Point(0, 0),
+        scale: float = 1,
+        size: Optional[Tuple[int, int]] = None,
+        capture_info: Optional[CaptureInfo] = None,
+        captured_region: Optional[Region] = None,
+    ):
+        super().__init__(image)
+        self._origin = origin
+        self._capture_info = capture_info
+        self._capture_scale = scale
+        if size is None:
+            size = (_scale_length(image.shape[1], 1 / scale), _scale_length(image.shape[0], 1 / scale))
+        self._size = size
+        self._captured_region = captured_region
+
+    @property
+    def origin(self) -> Point:
+        return self._origin
+
+    @property
+    def _scale(self) -> float:
+        return self._capture_scale
+
+    @property
+    def capture_info(self) -> Optional[CaptureInfo]:
+        return self._capture_info
+
+    @property
+    def width(self) -> int:
+        return self._size[0]
+
+    @property
+    def height(self) -> int:
+        return self._size[1]
+
+    @property
+    def captured_region(self) -> Region:
+        """
+        The part of the screenshot that was captured.
+        """
+        if self._captured_region is None:
+            return Region(0, 0, self.width, self.height)
+        return self._captured_region
+
+    def _get_pixel_offset(self) -> Point:
+        """
+        Get where the pixels of ``_get_numpy_image`` start, in the pixels of the whole screenshot.
+        """
+        if self._captured_region is None:
+            return Point(0, 0)
+        return super()._to_pixels(self._captured_region).top_left
+
+    def _to_pixels(self, region: Region) -> Region:
+        pixels = super()._to_pixels(region)
+        offset = self._get_pixel_offset()
+        return Region(pixels.x - offset.x, pixels.y - offset.y, pixels.width, pixels.height)
+
+    def _from_pixels(self, region: Region, size: Optional[Tuple[int, int]] = None) -> Region:
+        offset = self._get_pixel_offset()
+        return super()._from_pixels(Region(region.x + offset.x, region.y + offset.y, region.width, region.height), size)
+
+    def _get_region_numpy_image(self, region: Region) -> np.ndarray:
+        captured_region = self.captured_region
+        if not (
+            captured_region.left <= region.left
+            and captured_region.top <= region.top
+            and region.right <= captured_region.right
+            and region.bottom <= captured_region.bottom
+        ):
+            raise OutOfBoundsError(f"{region!r} is outside the captured part of the screenshot ({captured_region!r})")
+        return super()._get_region_numpy_image(region)
 
 
 class RegionInImage(BaseImage):
@@ -750,14 +2360,115 @@ class RegionInImage(BaseImage):
 
         return self.region
 
-    def _get_numpy_image(self) -> np.ndarray:
-        x_min = self._region.left
-        x_max = self._region.right
+    @property
+    def screen_region(self) -> Region:
+        """
+        The region on the desktop (i.e. in the coordinates used for moving the mouse), which accounts for where the root
+        image was captured (see ``BaseImage.origin``).
+        """
+        absolute_region = self.absolute_region
+        origin = self.root_image.origin
+        return Region(
+            origin.x + absolute_region.x, origin.y + absolute_region.y, absolute_region.width, absolute_region.height
+        )
+
+    @property
+    def screen_center(self) -> Point:
+        """
+        The center point of the region on the desktop (see ``screen_region``).
+        """
+        return self.screen_region.center
+
+    @property
+    def width(self) -> int:
+        return self._region.width
+
+    @property
+    def height(self) -> int:
+        return self._region.height
+
+    @property
+    def _is_live(self) -> bool:
+        return self._parent_image._is_live
+
+    @property
+    def _scale(self) -> float:
+        return self._parent_image._scale
+
+    @property
+    def capture_info(self) -> Optional[CaptureInfo]:
+        return self._parent_image.capture_info
+
+    def _create_change_detector(self, tolerance: float = 0) -> ChangeDetector:
+        return self._parent_image._create_change_detector(tolerance)
+
+    def _get_damage_count(self) -> Optional[int]:
+        return self._parent_image._get_damage_count()
+
+    def _wait_for_change(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        return self._parent_image._wait_for_change(timeout, since)
+
+    def _snapshot(self) -> "BaseImage":
+        if not self._is_live:
+            return self
+        # Take the region as a region of the root image's snapshot (rather than as a bare image), so the regions found
+        # in the snapshot still know where they are in the root image and on the desktop
+        return self.root_image._snapshot_region(self.absolute_region)
+
+    # A region of a live image is searched through a snapshot, like ``Screen`` does, so each query runs on one frame and
+    # the matches belong to that frame rather than to the live image.  The snapshot only captures the region.
+    def find_all(
+        self,
+        needle: Union[BaseImage, Iterable[NeedleType]],
+        confidence: Optional[float] = None,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+        mode: FindModeType = "all",
+    ) -> List["MatchedRegionInImage"]:
+        if self._is_live:
+            return self._snapshot().find_all(needle, confidence, text_kwargs, image_kwargs, mode)
+        return super().find_all(needle, confidence, text_kwargs, image_kwargs, mode)
 
-        y_min = self._region.top
-        y_max = self._region.bottom
+    def find_image_all(
+        self, needle: Union[BaseImage, Iterable[BaseImage]], *args, **kwargs
+    ) -> List["MatchedRegionInImage"]:
+        if self._is_live:
+            return self._snapshot().find_image_all(needle, *args, **kwargs)
+        return super().find_image_all(needle, *args, **kwargs)
+
+    def find_text_all(self, needle: Union[str, Iterable[str]], *args, **kwargs) -> List["MatchedRegionInImage"]:
+        if self._is_live:
+            return self._snapshot().find_text_all(needle, *args, **kwargs)
+        return super().find_text_all(needle, *args, **kwargs)
+
+    def get_text(self, **kwargs) -> str:
+        if self._is_live:
+            return self._snapshot().get_text(**kwargs)
+        return super().get_text(**kwargs)
+
+    def _get_prepared_haystack(self, numpy_image: Optional[np.ndarray] = None) -> PreparedHaystack:
+        if self._is_live:
+            return super()._get_prepared_haystack(numpy_image)
+        # Reuse the root image's integral images instead of computing new ones for the region.  The region's pixels are
+        # found from its absolute region, like ``_get_region_numpy_image`` does.
+        root_image = self.root_image
+        return self._get_cached(
+            "prepared_haystack",
+            lambda: root_image._get_prepared_haystack().get_child(root_image._to_pixels(self.absolute_region)),
+        )
+
+    def _has_prepared_haystack(self) -> bool:
+        return super()._has_prepared_haystack() or (not self._is_live and self.root_image._has_prepared_haystack())
 
-        return self._parent_image._get_numpy_image()[y_min:y_max, x_min:x_max, :]
+    def _get_numpy_image(self) -> np.ndarray:
+        return self._parent_image._get_region_numpy_image(self._region)
+
+    def _get_region_numpy_image(self, region: Region) -> np.ndarray:
+        # Ask the parent for the region directly, so a chain of regions in the screen results in capturing just the
+        # innermost region
+        return self._parent_image._get_region_numpy_image(
+            Region(self._region.x + region.x, self._region.y + region.y, region.width, region.height)
+        )
 
     def raw_region_left(self, size: Optional[int] = None, absolute=True) -> Region:
         """
@@ -1089,7 +2800,7 @@ class RegionInImage(BaseImage):
         :param speed: pixels per second
         """
         current = Point.from_tuple(pyautogui.position())
-        destination = self.center
+        destination = self.screen_center
         duration = current.distance_to(destination) / speed
         pyautogui.moveTo(destination.x, destination.y, duration)
 
@@ -1120,6 +2831,15 @@ class MatchedRegionInImage(RegionInImage):
         """
         return self._confidence
 
+    @property
+    def timestamp(self) -> Optional[float]:
+        """
+        When the frame that the match was found in finished being captured (according to ``time.monotonic``), or
+        ``None`` if the match wasn't found on the screen.  See ``capture_info`` for more details about the capture.
+        """
+        capture_info = self.capture_info
+        return None if capture_info is None else capture_info.end
+
     def __repr__(self) -> str:  # pragma: no cover
         attributes = ("parent_image", "needle", "region", "confidence")
         attribute_str = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr in attributes)
@@ -1142,23 +2862,175 @@ class MatchedRegionInImage(RegionInImage):
 
 
 class Screen(BaseImage):
+    """
+    The live screen.
+
+    Each query (e.g. ``find_image_all`` or ``get_text``) captures exactly one frame and runs on it, so the results of a
+    query all refer to the same frame.  The screen's size is remembered from the last full capture, so reading
+    ``width``, ``height``, or ``region`` (e.g. in ``get_child_region``) doesn't capture the screen again; a change in
+    resolution is picked up by the next full capture.
+
+    By default, the screen is everything the capture backend captures (e.g. the whole desktop), but it can be limited to
+    one monitor.  Searching one monitor of a multi-monitor desktop is proportionally cheaper.  Either way, regions found
+    on the screen know where they are on the desktop (see ``RegionInImage.screen_region``).
+
+    :param capture_backend: How to capture the screen.  If ``None``, ``PyAutoGUICapture`` is used.  See
+        ``pin_the_tail.capture.best_capture_backend`` for a faster backend on systems that support it.
+    :param monitor: Index of the monitor (see ``pin_the_tail.capture.get_monitors``) to limit the screen to.  If
+        ``None``, the screen isn't limited to a monitor.
+    :param scale: Shrink each frame by this much as soon as it's captured, e.g. 0.5 to search a quarter of the pixels.
+        This makes every query proportionally cheaper, for watching the screen when only rough locations or large
+        needles matter.  Needles are shrunk to match, and the regions found are still in full-resolution coordinates.
+        Small needles (e.g. text) may no longer be found at a reduced scale.
+    """
+
+    def __init__(
+        self, capture_backend: Optional[CaptureBackend] = None, monitor: Optional[int] = None, scale: float = 1
+    ):
+        super().__init__()
+        if not 0 < scale <= 1:
+            raise ValueError(f'Unrecognized value for "scale": {scale!r} (must be more than 0 and at most 1)')
+        self._capture_scale = scale
+        self._capture_backend = PyAutoGUICapture() if capture_backend is None else capture_backend
+        self._size: Optional[Tuple[int, int]] = None
+        self._n_captures = 0
+        self._last_capture_info: Optional[CaptureInfo] = None
+
+        self._monitor: Optional[Monitor] = None
+        if monitor is not None:
+            monitors = self._capture_backend.monitors()
+            if not 0 <= monitor < len(monitors):
+                raise ValueError(f'Unrecognized value for "monitor": {monitor!r} (there are {len(monitors)} monitors)')
+            self._monitor = monitors[monitor]
+
+    @property
+    def capture_backend(self) -> CaptureBackend:
+        return self._capture_backend
+
+    @property
+    def monitor(self) -> Optional[Monitor]:
+        """
+        The monitor that the screen is limited to, if any.
+        """
+        return self._monitor
+
+    @property
+    def scale(self) -> float:
+        """
+        How much each frame is shrunk when it's captured.
+        """
+        return self._capture_scale
+
+    @property
+    def _scale(self) -> float:
+        return self._capture_scale
+
+    @property
+    def origin(self) -> Point:
+        if self._monitor is None:
+            return Point(0, 0)
+        return self._monitor.region.top_left
+
+    def _get_size(self) -> Tuple[int, int]:
+        """
+        Get the ``(height, width)`` of the screen from the last full capture, capturing the screen if there wasn't one.
+        """
+        if self._monitor is not None:
+            return self._monitor.region.height, self._monitor.region.width
+        if self._size is None:
+            self._get_numpy_image()
+        return self._size
+
+    @property
+    def width(self) -> int:
+        return self._get_size()[1]
+
+    @property
+    def height(self) -> int:
+        return self._get_size()[0]
+
+    @property
+    def _is_live(self) -> bool:
+        return True
+
     def _get_ocr_matcher(self, language, line_break, paragraph_break):
         return self._create_ocr_matcher(language, line_break, paragraph_break)
 
-    def _get_pil_image(self):
-        return pyautogui.screenshot()
+    @property
+    def capture_info(self) -> Optional[CaptureInfo]:
+        """
+        When and how the latest frame was captured, or ``None`` if no frame has been captured yet.
+        """
+        return self._last_capture_info
 
     def _get_numpy_image(self):
-        return np.asarray(self._get_pil_image())
+        return self._capture(None)[0]
+
+    def _get_region_numpy_image(self, region: Region) -> np.ndarray:
+        return self._capture(region)[0]
+
+    def _capture(self, region: Optional[Region]) -> Tuple[np.ndarray, CaptureInfo]:
+        """
+        Capture ``region`` of the screen (or all of it, if ``None``), shrunk by ``scale``.  The pixels are returned
+        along with when they were captured, since ``capture_info`` may already be about a later capture (e.g. from
+        another thread) by the time the caller reads it.
+        """
+        start = time.monotonic()
+        # ``as_frame`` doesn't copy frames from backends that already return the right format, and guarantees the format
+        # for those that don't, so OpenCV never has to copy the frame
+        if region is None and self._monitor is None:
+            numpy_image = as_frame(self._capture_backend.grab())
+            self._size = numpy_image.shape[:2]
+        else:
+            region = self.region if region is None else region
+            origin = self.origin
+            numpy_image = as_frame(
+                self._capture_backend.grab(
+                    Region(origin.x + region.x, origin.y + region.y, region.width, region.height)
+                )
+            )
+        numpy_image = self._shrink(numpy_image, self.region if region is None else region)
+
+        capture_info = CaptureInfo(start, time.monotonic(), self._capture_backend.name, self._n_captures)
+        self._n_captures += 1
+        self._last_capture_info = capture_info
+        return numpy_image, capture_info
+
+    def _shrink(self, numpy_image: np.ndarray, region: Region) -> np.ndarray:
+        """
+        Shrink the captured ``region`` of the screen by ``scale``, to the pixels ``_to_pixels`` says cover it.
+        """
+        if self._capture_scale == 1:
+            return numpy_image
+        pixel_region = self._to_pixels(region)
+        return _resize(numpy_image, pixel_region.width, pixel_region.height)
 
     def save(self, location) -> None:
         self._get_pil_image().save(location)
 
-    def screenshot(self) -> Image:
+    def screenshot(self) -> "Screenshot":
         """
         Get an image of what's currently on the screen.
         """
-        return Image(self._get_numpy_image())
+        numpy_image, capture_info = self._capture(None)
+        return Screenshot(numpy_image, self.origin, self._capture_scale, (self.width, self.height), capture_info)
+
+    def _snapshot(self) -> "BaseImage":
+        return self.screenshot()
+
+    def _snapshot_region(self, region: Region) -> "RegionInImage":
+        # Only the region is captured, but the screenshot keeps the screen's coordinates
+        numpy_image, capture_info = self._capture(region)
+        screenshot = Screenshot(
+            numpy_image, self.origin, self._capture_scale, (self.width, self.height), capture_info, region
+        )
+        return screenshot.get_child_region(region)
+
+    def _get_damage_count(self) -> Optional[int]:
+        return self._capture_backend.damage_count()
+
+    def _wait_for_change(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        return self._capture_backend.wait_for_damage(timeout, since)
 
     def find_all(
         self,
@@ -1166,5 +3038,17 @@ class Screen(BaseImage):
         confidence: Optional[float] = None,
         text_kwargs: Optional[Mapping[str, Any]] = None,
         image_kwargs: Optional[Mapping[str, Any]] = None,
+        mode: FindModeType = "all",
+    ) -> List["MatchedRegionInImage"]:
+        return self.screenshot().find_all(needle, confidence, text_kwargs, image_kwargs, mode)
+
+    def find_image_all(
+        self, needle: Union[BaseImage, Iterable[BaseImage]], *args, **kwargs
     ) -> List["MatchedRegionInImage"]:
-        return self.screenshot().find_all(needle, confidence, text_kwargs, image_kwargs)
+        return self.screenshot().find_image_all(needle, *args, **kwargs)
+
+    def find_text_all(self, needle: Union[str, Iterable[str]], *args, **kwargs) -> List["MatchedRegionInImage"]:
+        return self.screenshot().find_text_all(needle, *args, **kwargs)
+
+    def get_text(self, **kwargs) -> str:
+        return self.screenshot().get_text(**kwargs)
@@ -4,7 +4,7 @@ from typing import Iterable, Optional, SupportsIndex, Tuple, Union
 
 import pyautogui
 
-from pin_the_tail.image import NeedleNotFoundError, NeedleType, Screen
+from pin_the_tail.image import NeedleNotFoundError, NeedleType, RegionInImage, Screen
 from pin_the_tail.location import Point
 
 NumberType = Union[int, float]
@@ -393,7 +393,7 @@ class Mouse:
             region = self.screen.find(location)
             if region is None:
                 raise NeedleNotFoundError(location, self.screen)
-            location = region.center
+            location = region.screen_center if isinstance(region, RegionInImage) else region.center
 
         if duration is None:
             speed = speed or self.default_move_speed
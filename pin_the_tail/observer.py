@@ -0,0 +1,234 @@
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Union
+
+from pin_the_tail.change_detection import ChangeDetector
+from pin_the_tail.image import BaseImage, MatchedRegionInImage, NeedleType
+from pin_the_tail.location import Region
+from pin_the_tail.scheduler import Watcher
+
+
+class _NeedleWatch:
+    """
+    An ``on_appear`` or ``on_vanish`` registration, and whether its needle was present when it was last checked.
+    """
+
+    def __init__(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        callback: Callable[..., Any],
+        fires_when_present: bool,
+        confidence: Optional[float],
+        text_kwargs: Optional[Mapping[str, Any]],
+        image_kwargs: Optional[Mapping[str, Any]],
+    ):
+        self._needle = needle
+        self._callback = callback
+        self._fires_when_present = fires_when_present
+        self._confidence = confidence
+        self._text_kwargs = text_kwargs
+        self._image_kwargs = image_kwargs
+        self._was_present: Optional[bool] = None
+
+    @property
+    def is_new(self) -> bool:
+        return self._was_present is None
+
+    def check(self, snapshot: BaseImage) -> None:
+        matches = list(
+            snapshot.find_all(
+                self._needle,
+                self._confidence,
+                text_kwargs=self._text_kwargs,
+                image_kwargs=self._image_kwargs,
+                mode="any",
+            )
+        )
+        is_present = len(matches) > 0
+        if is_present != self._was_present and is_present == self._fires_when_present:
+            if is_present:
+                self._callback(matches)
+            else:
+                self._callback()
+        self._was_present = is_present
+
+
+class _ChangeWatch:
+    """
+    An ``on_change`` registration, and the checksums of its region when it was last checked.
+    """
+
+    def __init__(self, callback: Callable[[BaseImage], Any], region: Optional[Region]):
+        self._callback = callback
+        self._region = region
+        self._change_detector = ChangeDetector()
+        self._is_new = True
+
+    @property
+    def is_new(self) -> bool:
+        return self._is_new
+
+    def check(self, snapshot: BaseImage) -> None:
+        image = snapshot if self._region is None else snapshot.get_child_region(self._region)
+        # The first check only records what the region looks like
+        pixels = image._get_numpy_image()  # pylint: disable=protected-access
+        if self._change_detector.has_changed(pixels) and not self._is_new:
+            self._callback(image)
+        self._is_new = False
+
+
+class Observer:
+    """
+    Watch an image (e.g. a ``Screen`` or a region of it) in a background thread, and call back when needles appear or
+    vanish or when the image changes.  One observer can watch many conditions: each tick captures the image once and
+    checks every registration against that capture, so text needles share one OCR pass per language.  When the capture
+    hasn't changed since the previous tick, nothing is searched again.
+
+    Events are only reported when something changes: an ``on_appear`` callback is called when its needle is first seen,
+    and then again only after the needle has vanished in between (and the other way around for ``on_vanish``).
+    Callbacks are called on the observer's thread, one at a time.
+
+    The thread starts when ``start`` is called (or when entering the observer as a context manager) and runs until
+    ``close`` is called.  Registrations can be added while it runs.  ``tick`` can also be called directly, instead of
+    starting the thread.
+
+    :param image: The image to watch.
+    :param scans_per_second: How many times per second should the image be checked (at most).
+    :param watcher: If given, the ticks of the background thread are scheduled as this watcher's scans (see
+        ``ScanScheduler``), and are made no faster than the watcher's ``scans_per_second``.
+    """
+
+    def __init__(self, image: BaseImage, scans_per_second: float = 3, *, watcher: Optional[Watcher] = None):
+        if scans_per_second <= 0:
+            raise ValueError(f'"scans_per_second" must be positive: {scans_per_second!r}')
+
+        self._image = image
+        self._period = 1 / scans_per_second
+        self._watcher = watcher
+        self._change_detector = image._create_change_detector()  # pylint: disable=protected-access
+        self._needle_watches: List[_NeedleWatch] = []
+        self._change_watches: List[_ChangeWatch] = []
+        self._error: Optional[BaseException] = None
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def image(self) -> BaseImage:
+        return self._image
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def on_appear(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        callback: Callable[[List[MatchedRegionInImage]], Any],
+        confidence: Optional[float] = None,
+        *,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Call ``callback`` with the matches when ``needle`` appears.
+
+        :param needle: Text, regular expression, image, or iterable of them to watch for.  See ``BaseImage.find_all``.
+        :param callback: Called with the regions containing the needle(s).
+        :param confidence: Sets the confidence threshold.  See ``BaseImage.find_all``.
+        :param text_kwargs: Additional arguments to pass along to the `find_text_all` method.
+        :param image_kwargs: Additional arguments to pass along to the `find_image_all` method.
+        """
+        with self._lock:
+            self._needle_watches.append(_NeedleWatch(needle, callback, True, confidence, text_kwargs, image_kwargs))
+
+    def on_vanish(
+        self,
+        needle: Union[NeedleType, Iterable[NeedleType]],
+        callback: Callable[[], Any],
+        confidence: Optional[float] = None,
+        *,
+        text_kwargs: Optional[Mapping[str, Any]] = None,
+        image_kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Call ``callback`` (with no arguments) when ``needle`` vanishes, or isn't there to begin with.  The arguments are
+        the same as for ``on_appear``.
+        """
+        with self._lock:
+            self._needle_watches.append(_NeedleWatch(needle, callback, False, confidence, text_kwargs, image_kwargs))
+
+    def on_change(self, callback: Callable[[BaseImage], Any], region: Optional[Region] = None) -> None:
+        """
+        Call ``callback`` with a snapshot of the image (or of ``region``) whenever it changes.  Changes are found by
+        comparing the checksums of tiles of successive captures (see ``ChangeDetector``).
+
+        :param callback: Called with the changed image or region.
+        :param region: The region of the image to watch.  If ``None``, the whole image is watched.
+        """
+        with self._lock:
+            self._change_watches.append(_ChangeWatch(callback, region))
+
+    def tick(self) -> None:
+        """
+        Capture the image once and check every registration against it, calling the callbacks of any events.
+        """
+        damage_count = self._image._get_damage_count()  # pylint: disable=protected-access
+        snapshot = self._image._snapshot()  # pylint: disable=protected-access
+        pixels = snapshot._get_numpy_image()  # pylint: disable=protected-access
+        has_changed = self._change_detector.has_changed(pixels, damage_count)
+        with self._lock:
+            watches = self._change_watches + self._needle_watches
+        for watch in watches:
+            # New registrations are checked even if nothing changed, to find out how things stand
+            if has_changed or watch.is_new:
+                watch.check(snapshot)
+
+    def start(self) -> "Observer":
+        """
+        Start watching in the background, if not already started.
+        """
+        if self._stop_event.is_set():
+            raise ValueError("Cannot start an observer after it is closed")
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="Observer", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        period = self._period if self._watcher is None else self._watcher.cap_interval(self._period)
+        next_tick = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                if self._watcher is None:
+                    self.tick()
+                else:
+                    with self._watcher.scan(next_tick, period):
+                        self.tick()
+            except BaseException as error:  # pylint: disable=broad-exception-caught
+                self._error = error
+                return
+
+            # Skip ticks that couldn't be made in time rather than trying to catch up
+            next_tick = max(next_tick + period, time.monotonic())
+            self._stop_event.wait(next_tick - time.monotonic())
+
+    def close(self) -> None:
+        """
+        Stop watching.  If a capture, search, or callback raised an error, which stopped the observer, it's raised here.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "Observer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(image={self._image!r}, scans_per_second={1 / self._period!r})"
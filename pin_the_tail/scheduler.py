@@ -0,0 +1,226 @@
+import dataclasses
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+
+@dataclass
+class ScanMetrics:
+    """
+    How promptly the scans of a watcher (or of all the watchers of a ``ScanScheduler``) were started.
+    """
+
+    #: How many scans were started
+    scans: int = 0
+    #: How many scans started so late that they missed the time of the scan after them
+    deadline_misses: int = 0
+    #: Total time (in seconds) between when scans were due and when they started
+    total_lateness: float = 0.0
+    #: The longest time (in seconds) between when a scan was due and when it started
+    max_lateness: float = 0.0
+
+    @property
+    def mean_lateness(self) -> Optional[float]:
+        """
+        The average time (in seconds) between when a scan was due and when it started, or ``None`` if there were no
+        scans.
+        """
+        if self.scans == 0:
+            return None
+        return self.total_lateness / self.scans
+
+    def _record(self, lateness: float, missed: bool) -> None:
+        self.scans += 1
+        self.deadline_misses += int(missed)
+        self.total_lateness += lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+
+
+class ScanScheduler:
+    """
+    Coordinate the scans of many waits and observers in one process, so they share a CPU budget instead of competing for
+    the CPU.
+
+    At most ``cores`` scans (i.e. captures and searches) run at once.  When more scans are due than that, the scans of
+    higher priority watchers start first, and then the scans that have been due for longest.  Scans that have to wait
+    start late, and the waits and observers skip the scans they missed in the meantime, so under load the low priority
+    watchers are the ones that scan less often.
+
+    Waits take part by running inside a watcher (see ``Watcher``); observers are given one.  The ``metrics`` show how
+    well the budget keeps up.
+
+    :param cores: How many scans may run at once.  If ``None``, one per CPU.
+    """
+
+    def __init__(self, cores: Optional[int] = None):
+        if cores is None:
+            cores = os.cpu_count() or 1
+        if cores < 1:
+            raise ValueError(f'"cores" must be at least one: {cores!r}')
+
+        self._cores = cores
+        self._n_running = 0
+        # Heap of the scans waiting to start, as (-priority, due, ticket)
+        self._waiting: List[Tuple[int, float, int]] = []
+        self._tickets = itertools.count()
+        self._metrics = ScanMetrics()
+        self._condition = threading.Condition()
+
+    @property
+    def cores(self) -> int:
+        return self._cores
+
+    @property
+    def metrics(self) -> ScanMetrics:
+        """
+        The metrics of the scans of all of the watchers.
+        """
+        with self._condition:
+            return dataclasses.replace(self._metrics)
+
+    def watcher(
+        self, priority: int = 0, name: Optional[str] = None, scans_per_second: Optional[float] = None
+    ) -> "Watcher":
+        """
+        Create a watcher whose scans are scheduled by this scheduler.
+
+        :param priority: Scans of watchers with a higher priority start before scans of watchers with a lower one.
+        :param name: A name for the watcher, e.g. for reporting its metrics.
+        :param scans_per_second: The most scans per second that each wait or observer inside the watcher may make, or
+            ``None`` to leave their rates as they are.
+        """
+        return Watcher(self, priority, name, scans_per_second)
+
+    def _start_scan(self, priority: int, due: float) -> None:
+        entry = (-priority, due, next(self._tickets))
+        with self._condition:
+            heapq.heappush(self._waiting, entry)
+            try:
+                self._condition.wait_for(lambda: self._n_running < self._cores and self._waiting[0] == entry)
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._n_running += 1
+            # The next scan in line may be able to start too
+            self._condition.notify_all()
+
+    def _finish_scan(self) -> None:
+        with self._condition:
+            self._n_running -= 1
+            self._condition.notify_all()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(cores={self._cores!r})"
+
+
+# The watcher that the waits started in the current context (thread or asyncio task) belong to
+_current_watcher: ContextVar[Optional["Watcher"]] = ContextVar("current_watcher", default=None)
+# The tokens for restoring ``_current_watcher`` when leaving the watchers entered in the current context (innermost
+# last).  They're kept per context rather than on the watchers, so one watcher can be entered from several threads or
+# tasks at once.
+_watcher_tokens: ContextVar[Tuple[Token, ...]] = ContextVar("watcher_tokens", default=())
+
+
+def get_current_watcher() -> Optional["Watcher"]:
+    """
+    Get the watcher that waits started now belong to, or ``None`` if they aren't scheduled.
+    """
+    return _current_watcher.get()
+
+
+class Watcher:
+    """
+    One of the things whose scans a ``ScanScheduler`` schedules.  Create one with ``ScanScheduler.watcher``.
+
+    The ``wait_until_*`` methods called while inside a watcher (``with watcher:``) are scheduled as part of it.  Waits
+    keep their own ``scans_per_second``, which is what their scans' deadlines are based on, but if the watcher has a
+    ``scans_per_second`` too, it caps them: no wait (or observer) inside the watcher scans faster than that.
+    """
+
+    def __init__(
+        self, scheduler: ScanScheduler, priority: int, name: Optional[str], scans_per_second: Optional[float] = None
+    ):
+        if scans_per_second is not None and scans_per_second <= 0:
+            raise ValueError(f'"scans_per_second" must be positive: {scans_per_second!r}')
+
+        self._scheduler = scheduler
+        self._priority = priority
+        self._name = name
+        self._scans_per_second = scans_per_second
+        self._metrics = ScanMetrics()
+
+    @property
+    def scheduler(self) -> ScanScheduler:
+        return self._scheduler
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._name
+
+    @property
+    def scans_per_second(self) -> Optional[float]:
+        return self._scans_per_second
+
+    def cap_interval(self, interval: float) -> float:
+        """
+        Get the interval (in seconds) between scans to use instead of ``interval``, so scans are made no faster than the
+        watcher's ``scans_per_second``.
+        """
+        if self._scans_per_second is None:
+            return interval
+        return max(interval, 1 / self._scans_per_second)
+
+    @property
+    def metrics(self) -> ScanMetrics:
+        """
+        The metrics of this watcher's scans.
+        """
+        with self._scheduler._condition:  # pylint: disable=protected-access
+            return dataclasses.replace(self._metrics)
+
+    @contextmanager
+    def scan(self, due: float, period: float) -> Iterator[None]:
+        """
+        Wait for the scheduler to let a scan start, and hold its place in the budget until the scan is done.
+
+        :param due: When (as a ``time.monotonic`` time) the scan was scheduled to start.
+        :param period: How long (in seconds) after ``due`` the next scan is scheduled.  A scan that starts later than
+            that counts as a deadline miss.
+        """
+        self._scheduler._start_scan(self._priority, due)  # pylint: disable=protected-access
+        try:
+            lateness = max(time.monotonic() - due, 0)
+            with self._scheduler._condition:  # pylint: disable=protected-access
+                self._metrics._record(lateness, lateness > period)  # pylint: disable=protected-access
+                self._scheduler._metrics._record(lateness, lateness > period)  # pylint: disable=protected-access
+            yield
+        finally:
+            self._scheduler._finish_scan()  # pylint: disable=protected-access
+
+    def __enter__(self) -> "Watcher":
+        _watcher_tokens.set(_watcher_tokens.get() + (_current_watcher.set(self),))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        *tokens, token = _watcher_tokens.get()
+        _watcher_tokens.set(tuple(tokens))
+        _current_watcher.reset(token)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(priority={self._priority!r}, name={self._name!r}, "
+            f"scans_per_second={self._scans_per_second!r})"
+        )
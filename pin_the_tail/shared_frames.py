@@ -0,0 +1,261 @@
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Set, Tuple
+
+import numpy as np
+
+from pin_the_tail.capture import CaptureBackend, CaptureUnavailableError, Frame, ScreenStream
+from pin_the_tail.location import Region
+
+# Layout of the shared memory: a header of ``_HEADER_SIZE`` int64 values, then one int64 seqlock and one float64
+# timestamp per slot, then the slots' pixels (starting at a multiple of ``_ALIGNMENT`` bytes)
+_MAGIC_NUMBER = 0x50494E5441494C01  # "PINTAIL" and a format version
+_HEADER_SIZE = 8
+_MAGIC, _HEIGHT, _WIDTH, _CHANNELS, _N_SLOTS, _LATEST_SEQUENCE = range(6)
+_ALIGNMENT = 64
+
+# How often a subscriber checks whether the first frame has been published
+_POLL_INTERVAL = 0.01
+
+# Names of the shared memory published by this process, which subscribers in this process must not unregister
+_published_names: Set[str] = set()
+
+
+def _pixels_offset(n_slots: int) -> int:
+    metadata_size = (_HEADER_SIZE + 2 * n_slots) * 8
+    return -(-metadata_size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _create_views(
+    shared_memory: SharedMemory, shape: Tuple[int, int, int], n_slots: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the header, seqlocks, timestamps, and pixels stored in ``shared_memory`` as numpy arrays.
+    """
+    header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=shared_memory.buf)
+    locks = np.ndarray((n_slots,), dtype=np.int64, buffer=shared_memory.buf, offset=_HEADER_SIZE * 8)
+    timestamps = np.ndarray((n_slots,), dtype=np.float64, buffer=shared_memory.buf, offset=(_HEADER_SIZE + n_slots) * 8)
+    pixels = np.ndarray((n_slots,) + shape, dtype=np.uint8, buffer=shared_memory.buf, offset=_pixels_offset(n_slots))
+    return header, locks, timestamps, pixels
+
+
+class FramePublisher(ScreenStream):
+    """
+    Capture frames in a background thread (like ``ScreenStream``) and publish them in shared memory, so other processes
+    can read them with a ``FrameSubscriber`` instead of capturing the screen themselves.
+
+    The frames are stored in a ring of ``history_size`` buffers.  Each buffer has a sequence lock: it holds an odd
+    number while its frame is being written and ``2 * (sequence + 1)`` once frame number ``sequence`` is complete, so
+    readers can tell whether the frame they read was overwritten while they were reading it.
+
+    The shared memory is sized from the first frame, which is captured when the publisher starts.  The size of the
+    frames can't change afterwards; if the screen's resolution changes, publishing stops with an error.
+
+    :param shared_memory_name: Name of the shared memory to create.  If ``None``, a unique name is chosen; see
+        ``shared_memory_name``.
+    :param backend: How to capture each frame.  If ``None``, ``PyAutoGUICapture`` is used.
+    :param fps: How many frames to capture per second (at most).
+    :param history_size: How many buffers are in the ring.  Readers have until this many more frames are published to
+        finish reading a frame.
+    """
+
+    name = "publisher"
+
+    def __init__(
+        self,
+        shared_memory_name: Optional[str] = None,
+        backend: Optional[CaptureBackend] = None,
+        fps: float = 30,
+        history_size: int = 3,
+    ):
+        super().__init__(backend, fps, history_size)
+        self._shared_memory_name = shared_memory_name
+        self._shared_memory: Optional[SharedMemory] = None
+        self._header: Optional[np.ndarray] = None
+        self._locks: Optional[np.ndarray] = None
+
+    @property
+    def shared_memory_name(self) -> str:
+        """
+        The name subscribers use to find the frames.  Starts the publisher, if it isn't started yet.
+        """
+        self.start()
+        return self._shared_memory.name
+
+    def start(self) -> "FramePublisher":
+        if self._shared_memory is None and not self._stop_event.is_set():
+            first_frame = self._backend.grab()
+            self._allocate(first_frame.shape)
+            self._store(first_frame, time.monotonic())
+        super().start()
+        return self
+
+    def _allocate(self, shape: Tuple[int, ...]) -> None:
+        if len(shape) != 3:
+            raise ValueError(f"Frames must have a channel dimension: shape={shape!r}")
+        size = _pixels_offset(self._history_size) + self._history_size * int(np.prod(shape))
+        self._shared_memory = SharedMemory(self._shared_memory_name, create=True, size=size)
+        _published_names.add(self._shared_memory.name)
+
+        self._header, self._locks, self._timestamps, self._buffer = _create_views(
+            self._shared_memory, shape, self._history_size
+        )
+        self._locks[:] = 0
+        self._header[[_HEIGHT, _WIDTH, _CHANNELS, _N_SLOTS, _LATEST_SEQUENCE]] = shape + (self._history_size, -1)
+        # Written last, so a subscriber never sees a valid header with missing sizes
+        self._header[_MAGIC] = _MAGIC_NUMBER
+
+    def _store(self, image: np.ndarray, timestamp: float) -> None:
+        with self._condition:
+            if image.shape != self._buffer.shape[1:]:
+                raise ValueError(
+                    f"Cannot publish a frame of shape {image.shape!r} after frames of shape {self._buffer.shape[1:]!r}"
+                )
+            sequence = self._n_frames
+            slot = sequence % self._history_size
+            self._locks[slot] = 2 * sequence + 1
+            np.copyto(self._buffer[slot], image)
+            self._timestamps[slot] = timestamp
+            self._locks[slot] = 2 * sequence + 2
+            self._header[_LATEST_SEQUENCE] = sequence
+            self._n_frames += 1
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        super().close()
+        with self._condition:
+            if self._shared_memory is None:
+                return
+            # Keep a private copy of the frames, so the history is still available after closing
+            self._buffer = self._buffer.copy()
+            self._timestamps = self._timestamps.copy()
+            self._header = self._locks = None
+
+            _published_names.discard(self._shared_memory.name)
+            self._shared_memory.close()
+            self._shared_memory.unlink()
+            self._shared_memory = None
+
+
+class FrameSubscriber(CaptureBackend):
+    """
+    Read the frames published by a ``FramePublisher``, possibly in another process.
+
+    ``grab`` copies the latest frame.  To avoid the copy, ``view_latest`` returns a read-only view of the shared memory
+    (e.g. to wrap in an ``Image``), which stays valid until the publisher reuses its buffer; check with ``is_intact``.
+
+    :param shared_memory_name: The publisher's ``shared_memory_name``.
+    :param timeout: How long to wait (in seconds) for the first frame when reading.
+    :raises CaptureUnavailableError: If there's no publisher with that name.
+    """
+
+    name = "subscriber"
+
+    def __init__(self, shared_memory_name: str, timeout: float = 5):
+        try:
+            self._shared_memory = SharedMemory(shared_memory_name)
+        except FileNotFoundError as error:
+            raise CaptureUnavailableError(f"No frames are published as {shared_memory_name!r}") from error
+        if sys.version_info < (3, 13) and self._shared_memory.name not in _published_names:
+            # Before Python 3.13, attaching registers the shared memory to be deleted when this process exits, which
+            # would delete it from under the publisher
+            resource_tracker.unregister(self._shared_memory._name, "shared_memory")  # pylint: disable=protected-access
+        self._timeout = timeout
+        # Sequence number of the frame that was last read
+        self._last_read_sequence = -1
+
+        header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=self._shared_memory.buf)
+        if header[_MAGIC] != _MAGIC_NUMBER:
+            del header
+            self._shared_memory.close()
+            raise CaptureUnavailableError(f"{shared_memory_name!r} doesn't contain published frames")
+        shape = (int(header[_HEIGHT]), int(header[_WIDTH]), int(header[_CHANNELS]))
+        self._n_slots = int(header[_N_SLOTS])
+        del header
+        self._header, self._locks, self._timestamps, self._pixels = _create_views(
+            self._shared_memory, shape, self._n_slots
+        )
+
+    @property
+    def latest_sequence(self) -> int:
+        """
+        The sequence number of the latest published frame, or -1 if none has been published yet.
+        """
+        return int(self._header[_LATEST_SEQUENCE])
+
+    def _wait_for_first_frame(self) -> None:
+        deadline = time.monotonic() + self._timeout
+        while self.latest_sequence < 0:
+            if time.monotonic() >= deadline:
+                raise TimeoutError("No frame was published in time")
+            time.sleep(_POLL_INTERVAL)
+
+    def is_intact(self, frame: Frame) -> bool:
+        """
+        Check whether ``frame`` (from ``view_latest``) still holds the pixels that were published, i.e. the publisher
+        hasn't started overwriting it.
+        """
+        return int(self._locks[frame.sequence % self._n_slots]) == 2 * frame.sequence + 2
+
+    def view_latest(self) -> Frame:
+        """
+        Get a read-only view of the latest frame, without copying it.
+        """
+        self._wait_for_first_frame()
+        while True:
+            sequence = self.latest_sequence
+            slot = sequence % self._n_slots
+            frame = Frame(self._pixels[slot], float(self._timestamps[slot]), sequence)
+            if self.is_intact(frame):
+                frame.image.flags.writeable = False
+                self._last_read_sequence = sequence
+                return frame
+
+    def _read_latest(self, region: Optional[Region]) -> Frame:
+        self._wait_for_first_frame()
+        while True:
+            sequence = self.latest_sequence
+            slot = sequence % self._n_slots
+            pixels = self._pixels[slot]
+            if region is not None:
+                pixels = pixels[region.top : region.bottom, region.left : region.right]
+            frame = Frame(pixels.copy(), float(self._timestamps[slot]), sequence)
+            # If the buffer was overwritten during the copy, try again with the new latest frame
+            if self.is_intact(frame):
+                self._last_read_sequence = sequence
+                return frame
+
+    def latest(self) -> Frame:
+        """
+        Get a copy of the latest frame.
+        """
+        return self._read_latest(None)
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        return self._read_latest(region).image
+
+    def wait_for_damage(self, timeout: float, since: Optional[int] = None) -> Optional[bool]:
+        """
+        Block until a frame newer than the last one read is published, or until ``timeout`` seconds pass.  The new frame
+        may be the same as the last one.  The subscriber doesn't count changes, so ``since`` is ignored.
+        """
+        deadline = time.monotonic() + timeout
+        while self.latest_sequence <= self._last_read_sequence:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(_POLL_INTERVAL, remaining))
+        return True
+
+    def close(self) -> None:
+        if self._shared_memory is None:
+            return
+        self._header = self._locks = self._timestamps = self._pixels = None
+        self._shared_memory.close()
+        self._shared_memory = None
+
+    def __repr__(self) -> str:
+        name = None if self._shared_memory is None else self._shared_memory.name
+        return f"{self.__class__.__name__}(shared_memory_name={name!r})"
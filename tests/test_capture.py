@@ -0,0 +1,391 @@
+import itertools
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PIL import Image as PILImage
+
+from pin_the_tail.capture import (
+    CaptureInfo,
+    CaptureUnavailableError,
+    Monitor,
+    PyAutoGUICapture,
+    ScreenStream,
+    XShmCapture,
+    as_frame,
+    best_capture_backend,
+    get_monitors,
+)
+from pin_the_tail.image import Image, Screen
+from pin_the_tail.location import Region
+
+
+class TestAsFrame:
+    @staticmethod
+    def test_frame_in_right_format_is_not_copied():
+        pixels = np.zeros((20, 30, 3), dtype=np.uint8)
+
+        assert as_frame(pixels) is pixels
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "pixels",
+        [
+            np.arange(20 * 30 * 4).reshape((20, 30, 4)).astype(np.uint8)[:, :, :3],
+            np.arange(20 * 30 * 3).reshape((20, 30, 3)).astype(np.uint8)[:, ::2],
+            np.arange(20 * 30 * 3).reshape((20, 30, 3)).astype(np.uint16),
+        ],
+    )
+    def test_frame_in_wrong_layout_is_converted(pixels):
+        actual = as_frame(pixels)
+
+        assert actual.dtype == np.uint8
+        assert actual.flags.c_contiguous and actual.flags.writeable
+        assert np.array_equal(actual, pixels.astype(np.uint8))
+
+    @staticmethod
+    def test_read_only_frame_is_copied():
+        pixels = np.zeros((20, 30, 3), dtype=np.uint8)
+        pixels.flags.writeable = False
+
+        actual = as_frame(pixels)
+
+        assert actual.flags.writeable
+        assert np.array_equal(actual, pixels)
+
+    @staticmethod
+    def test_alpha_channel_is_removed():
+        pixels = np.arange(20 * 30 * 4).reshape((20, 30, 4)).astype(np.uint8)
+
+        actual = as_frame(pixels)
+
+        assert actual.flags.c_contiguous
+        assert np.array_equal(actual, pixels[:, :, :3])
+
+    @staticmethod
+    @pytest.mark.parametrize("shape", [(20, 30), (20, 30, 2)])
+    def test_unsupported_shape_raises_value_error(shape):
+        with pytest.raises(ValueError):
+            as_frame(np.zeros(shape, dtype=np.uint8))
+
+
+class TestPyAutoGUICapture:
+    @staticmethod
+    def test_grabbing_whole_screen():
+        fake_screenshot = PILImage.new("RGB", (100, 60), color=(1, 2, 3))
+
+        with mock.patch("pin_the_tail.capture.pyautogui.screenshot", return_value=fake_screenshot) as screenshot_patch:
+            actual = PyAutoGUICapture().grab()
+
+        screenshot_patch.assert_called_once_with()
+        assert np.array_equal(actual, np.asarray(fake_screenshot))
+        assert actual.flags.c_contiguous and actual.flags.writeable
+
+    @staticmethod
+    def test_grabbing_screen_with_alpha_channel_removes_alpha_channel():
+        fake_screenshot = PILImage.new("RGBA", (100, 60), color=(1, 2, 3, 4))
+
+        with mock.patch("pin_the_tail.capture.pyautogui.screenshot", return_value=fake_screenshot):
+            actual = PyAutoGUICapture().grab()
+
+        assert actual.shape == (60, 100, 3)
+        assert actual.flags.c_contiguous
+
+    @staticmethod
+    def test_grabbing_region_only_captures_region():
+        fake_screenshot = PILImage.new("RGB", (30, 20))
+
+        with mock.patch("pin_the_tail.capture.pyautogui.screenshot", return_value=fake_screenshot) as screenshot_patch:
+            actual = PyAutoGUICapture().grab(Region(10, 5, 30, 20))
+
+        screenshot_patch.assert_called_once_with(region=(10, 5, 30, 20))
+        assert actual.shape == (20, 30, 3)
+
+
+class TestMonitors:
+    @staticmethod
+    def test_backend_reports_captured_area_as_one_monitor():
+        fake_screenshot = PILImage.new("RGB", (100, 60))
+
+        with mock.patch("pin_the_tail.capture.pyautogui.screenshot", return_value=fake_screenshot):
+            actual = PyAutoGUICapture().monitors()
+
+        assert actual == [Monitor(0, Region(0, 0, 100, 60), is_primary=True)]
+
+    @staticmethod
+    def test_getting_monitors_from_backend():
+        backend = MagicMock()
+
+        actual = get_monitors(backend)
+
+        assert actual is backend.monitors.return_value
+
+    @staticmethod
+    def test_stream_reports_monitors_of_its_backend():
+        backend = MagicMock()
+
+        actual = ScreenStream(backend).monitors()
+
+        assert actual is backend.monitors.return_value
+
+
+class TestWaitForDamage:
+    @staticmethod
+    def test_backend_that_cannot_tell_returns_immediately():
+        assert PyAutoGUICapture().wait_for_damage(10) is None
+
+
+class TestXShmCapture:
+    @staticmethod
+    def test_unavailable_display_raises_capture_unavailable_error():
+        with pytest.raises(CaptureUnavailableError):
+            XShmCapture(":987")
+
+
+class TestBestCaptureBackend:
+    @staticmethod
+    def test_uses_xshm_capture_when_available():
+        fake_backend = MagicMock()
+
+        with mock.patch.dict("os.environ", {"DISPLAY": ":0"}), mock.patch("sys.platform", "linux"), mock.patch(
+            "pin_the_tail.capture.XShmCapture", return_value=fake_backend
+        ):
+            actual = best_capture_backend()
+
+        assert actual is fake_backend
+
+    @staticmethod
+    def test_falls_back_to_pyautogui_when_xshm_capture_is_unavailable():
+        with mock.patch.dict("os.environ", {"DISPLAY": ":0"}), mock.patch("sys.platform", "linux"), mock.patch(
+            "pin_the_tail.capture.XShmCapture", side_effect=CaptureUnavailableError
+        ):
+            actual = best_capture_backend()
+
+        assert isinstance(actual, PyAutoGUICapture)
+
+    @staticmethod
+    def test_falls_back_to_pyautogui_when_not_on_x11():
+        with mock.patch("sys.platform", "win32"), mock.patch("pin_the_tail.capture.XShmCapture") as xshm_patch:
+            actual = best_capture_backend()
+
+        xshm_patch.assert_not_called()
+        assert isinstance(actual, PyAutoGUICapture)
+
+
+def create_counting_backend(shape=(4, 5, 3)):
+    """
+    Create a fake capture backend whose n-th frame is filled with n (up to 255).
+    """
+    backend = MagicMock()
+    backend.grab.side_effect = lambda: np.full(shape, min(backend.grab.call_count, 255), dtype=np.uint8)
+    return backend
+
+
+class TestScreenStream:
+    @staticmethod
+    @pytest.mark.parametrize("kwargs", [dict(fps=0), dict(fps=-1), dict(history_size=0)])
+    def test_invalid_arguments_raise_value_error(kwargs):
+        with pytest.raises(ValueError):
+            ScreenStream(MagicMock(), **kwargs)
+
+    @staticmethod
+    def test_grab_returns_latest_frame():
+        with ScreenStream(create_counting_backend(), fps=1000) as subject:
+            first = subject.grab()
+            second = subject.grab(Region(1, 2, 3, 2))
+
+        assert first.shape == (4, 5, 3)
+        assert second.shape == (2, 3, 3)
+        assert second[0, 0, 0] >= first[0, 0, 0] >= 1
+
+    @staticmethod
+    def test_grabbed_frames_are_not_overwritten_by_later_frames():
+        subject = ScreenStream(MagicMock(), history_size=2)
+        subject._store(np.full((4, 5, 3), 1, dtype=np.uint8), 1.0)
+        subject.start = MagicMock()
+
+        actual = subject.grab()
+        subject._store(np.full((4, 5, 3), 2, dtype=np.uint8), 2.0)
+        subject._store(np.full((4, 5, 3), 3, dtype=np.uint8), 3.0)
+
+        assert (actual == 1).all()
+
+    @staticmethod
+    def test_history_keeps_most_recent_frames_oldest_first():
+        subject = ScreenStream(MagicMock(), history_size=3)
+        for i in range(1, 6):
+            subject._store(np.full((4, 5, 3), i, dtype=np.uint8), float(i))
+
+        actual = subject.history()
+
+        assert [frame.sequence for frame in actual] == [2, 3, 4]
+        assert [frame.timestamp for frame in actual] == [3.0, 4.0, 5.0]
+        assert [frame.image[0, 0, 0] for frame in actual] == [3, 4, 5]
+
+    @staticmethod
+    def test_resolution_change_starts_new_history():
+        subject = ScreenStream(MagicMock(), history_size=3)
+        subject._store(np.zeros((4, 5, 3), dtype=np.uint8), 1.0)
+
+        subject._store(np.zeros((8, 10, 3), dtype=np.uint8), 2.0)
+
+        assert [frame.image.shape for frame in subject.history()] == [(8, 10, 3)]
+
+    @staticmethod
+    def test_capture_error_is_raised_when_grabbing():
+        backend = MagicMock()
+        backend.grab.side_effect = CaptureUnavailableError("no screen")
+
+        with ScreenStream(backend) as subject:
+            with pytest.raises(CaptureUnavailableError):
+                subject.grab()
+
+    @staticmethod
+    def test_closing_stops_thread_and_closes_backend():
+        backend = create_counting_backend()
+        subject = ScreenStream(backend, fps=1000).start()
+
+        subject.close()
+
+        assert not subject.is_running
+        backend.close.assert_called_once_with()
+        with pytest.raises(ValueError):
+            subject.grab()
+
+    @staticmethod
+    def test_waiting_for_damage_waits_for_a_frame_newer_than_the_count():
+        subject = ScreenStream(MagicMock())
+        subject.start = MagicMock()
+        subject._store(np.full((4, 5, 3), 1, dtype=np.uint8), 1.0)
+        damage_count = subject.damage_count()
+        subject.grab()
+
+        without_new_frame = subject.wait_for_damage(0, damage_count)
+        subject._store(np.full((4, 5, 3), 2, dtype=np.uint8), 2.0)
+        with_new_frame = subject.wait_for_damage(0, damage_count)
+
+        assert without_new_frame is False
+        assert with_new_frame is True
+
+    @staticmethod
+    def test_reading_frames_does_not_affect_other_consumers_waiting_for_damage():
+        subject = ScreenStream(MagicMock())
+        subject.start = MagicMock()
+        subject._store(np.full((4, 5, 3), 1, dtype=np.uint8), 1.0)
+        damage_count = subject.damage_count()
+        subject._store(np.full((4, 5, 3), 2, dtype=np.uint8), 2.0)
+
+        subject.grab()
+
+        assert subject.wait_for_damage(0, damage_count) is True
+
+    @staticmethod
+    def test_frame_count_keeps_counting_across_resolution_changes():
+        subject = ScreenStream(MagicMock(), history_size=3)
+        subject.start = MagicMock()
+        subject._store(np.zeros((4, 5, 3), dtype=np.uint8), 1.0)
+        subject._store(np.zeros((4, 5, 3), dtype=np.uint8), 2.0)
+        damage_count = subject.damage_count()
+
+        subject._store(np.zeros((8, 10, 3), dtype=np.uint8), 3.0)
+
+        assert subject.damage_count() == 3
+        assert subject.latest().sequence == 2
+        assert subject.wait_for_damage(0, damage_count) is True
+
+    @staticmethod
+    def test_waiting_for_damage_wakes_when_stream_captures_a_frame():
+        with ScreenStream(create_counting_backend(), fps=100) as subject:
+            subject.grab()
+
+            actual = subject.wait_for_damage(5)
+
+        assert actual is True
+
+    @staticmethod
+    def test_screen_reads_frames_from_stream():
+        with ScreenStream(create_counting_backend(), fps=1000) as stream:
+            screen = Screen(capture_backend=stream)
+
+            actual = screen.screenshot()
+
+        assert actual._get_numpy_image().shape == (4, 5, 3)
+
+
+class TestScreenCaptureBackend:
+    @staticmethod
+    def test_screen_uses_pyautogui_by_default():
+        assert isinstance(Screen().capture_backend, PyAutoGUICapture)
+
+    @staticmethod
+    def test_screen_converts_frames_from_backends_in_wrong_format():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((20, 30, 4), dtype=np.uint8)[:, :, :3]
+
+        actual = Screen(capture_backend=fake_backend)._get_numpy_image()
+
+        assert actual.flags.c_contiguous and actual.flags.writeable
+
+    @staticmethod
+    def test_screen_captures_with_capture_backend():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((20, 30, 3), dtype=np.uint8)
+        screen = Screen(capture_backend=fake_backend)
+
+        actual = screen.screenshot()
+
+        fake_backend.grab.assert_called_once_with()
+        assert np.array_equal(actual._get_numpy_image(), fake_backend.grab.return_value)
+
+    @staticmethod
+    def test_screenshots_record_when_and_how_they_were_captured():
+        fake_backend = MagicMock()
+        fake_backend.name = "fake"
+        fake_backend.grab.return_value = np.zeros((20, 30, 3), dtype=np.uint8)
+        screen = Screen(capture_backend=fake_backend)
+
+        with mock.patch("pin_the_tail.image.time") as time_patch:
+            time_patch.monotonic.side_effect = [10.0, 10.25, 11.0, 11.5]
+            first_screenshot = screen.screenshot()
+            second_screenshot = screen.screenshot()
+
+        assert first_screenshot.capture_info == CaptureInfo(10.0, 10.25, "fake", 0)
+        assert second_screenshot.capture_info == CaptureInfo(11.0, 11.5, "fake", 1)
+        assert second_screenshot.capture_info.duration == 0.5
+        assert screen.capture_info == second_screenshot.capture_info
+
+    @staticmethod
+    def test_region_in_screen_records_its_capture():
+        fake_backend = MagicMock()
+        fake_backend.name = "fake"
+        fake_backend.grab.return_value = np.zeros((20, 30, 3), dtype=np.uint8)
+        subject = Screen(capture_backend=fake_backend).get_child_region(Region(0, 0, 10, 10))
+
+        with mock.patch("pin_the_tail.image.time") as time_patch:
+            time_patch.monotonic.side_effect = [10.0, 10.25]
+            subject._get_numpy_image()
+
+        assert subject.capture_info == CaptureInfo(10.0, 10.25, "fake", 1)
+
+    @staticmethod
+    def test_matches_in_region_of_screen_keep_the_timestamp_of_their_frame():
+        needle = np.random.default_rng(0).integers(0, 256, size=(5, 6, 3), dtype=np.uint8)
+        frame = np.full((20, 30, 3), 128, dtype=np.uint8)
+        frame[10:15, 12:18] = needle
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = lambda region=None: (
+            frame if region is None else frame[region.top : region.bottom, region.left : region.right]
+        )
+        screen = Screen(capture_backend=fake_backend)
+        subject = screen.get_child_region(Region(10, 5, 15, 15))
+
+        with mock.patch("pin_the_tail.image.time") as time_patch:
+            time_patch.monotonic.side_effect = itertools.count()
+            matches = subject.find_image_all(Image(needle), 0.99)
+            timestamp = matches[0].timestamp
+            screen.screenshot()
+
+        assert matches[0].absolute_region == Region(12, 10, 6, 5)
+        assert matches[0].timestamp == timestamp
+        assert screen.capture_info.end > timestamp
@@ -0,0 +1,143 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from pin_the_tail.change_detection import ChangeDetector, tile_checksums
+
+
+def create_random_image(height=100, width=150):
+    return np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+class TestTileChecksums:
+    @staticmethod
+    @pytest.mark.parametrize("height, width, expected_shape", [(64, 128, (1, 2)), (100, 150, (2, 3)), (1, 1, (1, 1))])
+    def test_one_checksum_per_tile(height, width, expected_shape):
+        assert tile_checksums(create_random_image(height, width)).shape == expected_shape
+
+    @staticmethod
+    def test_same_image_has_same_checksums():
+        image = create_random_image()
+
+        assert np.array_equal(tile_checksums(image), tile_checksums(image.copy()))
+
+    @staticmethod
+    @pytest.mark.parametrize("y, x, expected_tile", [(0, 0, (0, 0)), (70, 10, (1, 0)), (99, 149, (1, 2))])
+    def test_changing_one_pixel_only_changes_checksum_of_its_tile(y, x, expected_tile):
+        image = create_random_image()
+        changed_image = image.copy()
+        changed_image[y, x, 1] ^= 1
+
+        changed_tiles = tile_checksums(image) != tile_checksums(changed_image)
+
+        assert [tuple(tile) for tile in np.argwhere(changed_tiles)] == [expected_tile]
+
+    @staticmethod
+    def test_swapping_pixels_within_tile_changes_checksum():
+        image = create_random_image()
+        swapped_image = image.copy()
+        swapped_image[[3, 40], 5] = image[[40, 3], 5]
+
+        assert (tile_checksums(image) != tile_checksums(swapped_image)).any()
+
+    @staticmethod
+    @pytest.mark.parametrize("tile_size", [0, 12, -8])
+    def test_invalid_tile_size_raises_value_error(tile_size):
+        with pytest.raises(ValueError):
+            tile_checksums(create_random_image(), tile_size)
+
+
+class TestChangeDetector:
+    @staticmethod
+    def test_first_image_is_a_change():
+        assert ChangeDetector().has_changed(create_random_image())
+
+    @staticmethod
+    def test_same_image_is_not_a_change():
+        subject = ChangeDetector()
+        subject.has_changed(create_random_image())
+
+        assert not subject.has_changed(create_random_image())
+        assert not subject.changed_tiles.any()
+
+    @staticmethod
+    def test_changed_image_is_a_change():
+        subject = ChangeDetector()
+        image = create_random_image()
+        subject.has_changed(image)
+        image[70, 10, 0] ^= 1
+
+        assert subject.has_changed(image)
+        assert [tuple(tile) for tile in np.argwhere(subject.changed_tiles)] == [(1, 0)]
+
+    @staticmethod
+    def test_resized_image_is_a_change():
+        subject = ChangeDetector()
+        subject.has_changed(create_random_image())
+
+        assert subject.has_changed(create_random_image(200, 150))
+
+    @staticmethod
+    def test_unchanged_damage_count_skips_comparing_checksums():
+        subject = ChangeDetector()
+        subject.has_changed(create_random_image(), 3)
+
+        with mock.patch("pin_the_tail.change_detection.tile_checksums") as checksums_patch:
+            actual = subject.has_changed(create_random_image(), 3)
+
+        assert not actual
+        checksums_patch.assert_not_called()
+
+    @staticmethod
+    @pytest.mark.parametrize("damage_counts", [(4, 5), (None, None)])
+    def test_possible_damage_compares_checksums(damage_counts):
+        subject = ChangeDetector()
+        image = create_random_image()
+        subject.has_changed(image, 3)
+
+        assert not subject.has_changed(image, damage_counts[0])
+        image[0, 0, 0] ^= 1
+        assert subject.has_changed(image, damage_counts[1])
+
+    @staticmethod
+    def test_detectors_sharing_a_source_each_see_its_changes():
+        first_detector, second_detector = ChangeDetector(), ChangeDetector()
+        image = create_random_image()
+        first_detector.has_changed(image, 0)
+        second_detector.has_changed(image, 0)
+
+        changed_image = image.copy()
+        changed_image[0, 0, 0] ^= 1
+
+        assert first_detector.has_changed(changed_image, 1)
+        assert second_detector.has_changed(changed_image, 1)
+
+    @staticmethod
+    def test_change_within_tolerance_is_not_a_change():
+        # 100 x 150 pixels are 2 x 3 tiles, so one tile is a sixth of the image
+        subject = ChangeDetector(tolerance=0.2)
+        image = create_random_image()
+        subject.has_changed(image)
+        image[0, 0, 0] ^= 1
+
+        assert not subject.has_changed(image)
+        assert subject.changed_tiles.sum() == 1
+
+    @staticmethod
+    def test_changes_within_tolerance_add_up():
+        subject = ChangeDetector(tolerance=0.2)
+        image = create_random_image()
+        subject.has_changed(image)
+        image[0, 0, 0] ^= 1
+        subject.has_changed(image)
+        image[0, 70, 0] ^= 1
+
+        assert subject.has_changed(image)
+        assert not subject.has_changed(image)
+
+    @staticmethod
+    @pytest.mark.parametrize("tolerance", [-0.1, 1])
+    def test_invalid_tolerance_raises_value_error(tolerance):
+        with pytest.raises(ValueError):
+            ChangeDetector(tolerance=tolerance)
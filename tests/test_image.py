@@ -1,20 +1,75 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock, call
 
+import cv2
 import numpy as np
 import pyautogui
 import pytest
 from PIL import Image as PILImage
 from PIL import ImageChops
 
-from pin_the_tail.image import BaseImage, Image, MatchedRegionInImage, OutOfBoundsError, RegionInImage, Screen
+from pin_the_tail.capture import Monitor
+from pin_the_tail.image import (
+    BackoffScanPolicy,
+    BaseImage,
+    FiredCondition,
+    FixedScanPolicy,
+    Image,
+    MatchedRegionInImage,
+    OutOfBoundsError,
+    PreparedHaystack,
+    RegionInImage,
+    Screen,
+    Screenshot,
+    WaitStatistics,
+    _as_float_channels,
+    _eliminate_candidates,
+    _match_template_numpy,
+    _select_distinctive_patch,
+    set_async_executor,
+)
 from pin_the_tail.location import Point, Region
 from pin_the_tail.ocr import OCRMatch
+from pin_the_tail.scheduler import ScanScheduler
 
 RESOURCES_DIR = Path(__file__).parent / "resources"
 
 
+class FakeClock:
+    """
+    A clock that only advances when something sleeps or ``advance`` is called.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleep = MagicMock(side_effect=self.advance)
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def monotonic(self):
+        return self.now
+
+
+@contextmanager
+def fake_clock():
+    """
+    Make the wait methods use a ``FakeClock``, so waiting takes no real time.
+    """
+    clock = FakeClock()
+    with mock.patch("pin_the_tail.image.time") as time_patch, mock.patch(
+        "pin_the_tail.image.pyautogui.sleep", clock.sleep
+    ), mock.patch("pin_the_tail.image.asyncio.sleep", side_effect=clock.advance) as async_sleep_patch:
+        time_patch.monotonic.side_effect = clock.monotonic
+        clock.async_sleep = async_sleep_patch
+        yield clock
+
+
 def are_pil_images_equal(img1, img2):
     # from https://stackoverflow.com/a/68402702
     equal_size = img1.height == img2.height and img1.width == img2.width
@@ -90,6 +145,16 @@ class TestBaseImage:
 
 
 class TestImage:
+    @staticmethod
+    def test_image_with_alpha_channel_only_copies_color_channels_once():
+        subject = Image(np.zeros((20, 30, 4), dtype=np.uint8))
+
+        actual = subject._get_numpy_image()
+
+        assert actual.shape == (20, 30, 3)
+        assert actual.flags.c_contiguous
+        assert subject._get_numpy_image() is actual
+
     @staticmethod
     def test_getting_child_image():
         any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
@@ -175,11 +240,12 @@ class TestImage:
         )
 
     @staticmethod
-    def test_finding_all_instances_of_an_image():
+    @pytest.mark.parametrize("backend", ["opencv", "numpy", "elimination"])
+    def test_finding_all_instances_of_an_image(backend):
         any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
         needle = Image(RESOURCES_DIR / "the.png")
 
-        found = list(any_image.find_image_all(needle))
+        found = list(any_image.find_image_all(needle, backend=backend))
 
         expected = {
             Region(x=1046, y=142, width=30, height=19),
@@ -192,6 +258,135 @@ class TestImage:
         assert all(f.confidence >= 0.99 for f in found)
         assert expected == {image.region for image in found}
 
+    @staticmethod
+    def test_finding_image_at_candidate_locations():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        found = list(
+            any_image.find_image_all(
+                needle, candidates=[Point(1046, 142), (427, 293), (0, 0), (500, 500), (704, 293), (1300, 800)]
+            )
+        )
+
+        expected = {
+            Region(x=1046, y=142, width=30, height=19),
+            Region(x=427, y=293, width=30, height=19),
+            Region(x=704, y=293, width=30, height=19),
+        }
+
+        assert len(found) == len(expected)
+        assert all(f.confidence >= 0.99 for f in found)
+        assert expected == {image.region for image in found}
+
+    @staticmethod
+    def test_finding_all_instances_of_a_large_image_by_subpatch():
+        pixels = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[:, :, :3]
+        any_image = Image(np.ascontiguousarray(np.tile(pixels, (1, 2, 1))))
+        needle = Image(np.ascontiguousarray(pixels[300:450, 200:500]))
+
+        found = list(any_image.find_image_all(needle, subpatch=True))
+
+        expected = {
+            Region(x=200, y=300, width=300, height=150),
+            Region(x=1513, y=300, width=300, height=150),
+        }
+
+        assert len(found) == len(expected)
+        assert all(f.confidence >= 0.99 for f in found)
+        assert expected == {image.region for image in found}
+
+    @staticmethod
+    def test_finding_large_image_by_subpatch_with_ccorr_searches_whole_image():
+        pixels = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[:, :, :3]
+        any_image = Image(np.ascontiguousarray(pixels))
+        needle = Image(np.ascontiguousarray(pixels[300:450, 200:500]))
+
+        with mock.patch("pin_the_tail.image._find_all_by_subpatch") as subpatch_patch:
+            found = list(any_image.find_image_all(needle, match_method=cv2.TM_CCORR_NORMED, subpatch=True))
+
+        subpatch_patch.assert_not_called()
+        assert Region(x=200, y=300, width=300, height=150) in {image.region for image in found}
+
+    @staticmethod
+    def test_subpatch_found_in_too_many_places_searches_whole_image():
+        pixels = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[:, :, :3]
+        any_image = Image(np.ascontiguousarray(np.tile(pixels, (1, 2, 1))))
+        needle = Image(np.ascontiguousarray(pixels[300:450, 200:500]))
+
+        with mock.patch("pin_the_tail.image._SUBPATCH_MAX_CANDIDATES", 1), mock.patch(
+            "pin_the_tail.image._match_template_numpy"
+        ) as numpy_patch:
+            found = list(any_image.find_image_all(needle, subpatch=True))
+
+        numpy_patch.assert_not_called()
+        assert {image.region for image in found} == {
+            Region(x=200, y=300, width=300, height=150),
+            Region(x=1513, y=300, width=300, height=150),
+        }
+
+    @staticmethod
+    def test_finding_small_image_by_subpatch_searches_whole_image():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        found = list(any_image.find_image_all(needle, subpatch=True))
+
+        assert len(found) == 4
+
+    @staticmethod
+    def test_finding_image_at_candidate_locations_with_opencv_backend_raises_value_error():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        with pytest.raises(ValueError):
+            any_image.find_image_all(needle, backend="opencv", candidates=[(1046, 142)])
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "haystack_transform",
+        [
+            lambda pixels: pixels,
+            lambda pixels: 255 - pixels,
+            lambda pixels: pixels[:, :, ::-1],
+        ],
+    )
+    def test_finding_all_instances_of_an_image_by_edges(haystack_transform):
+        pixels = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[:, :, :3]
+        any_image = Image(np.ascontiguousarray(haystack_transform(pixels)))
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        found = list(any_image.find_image_all(needle, 0.95, match_domain="edges"))
+
+        expected = {
+            Region(x=1046, y=142, width=30, height=19),
+            Region(x=427, y=293, width=30, height=19),
+            Region(x=704, y=293, width=30, height=19),
+            Region(x=329, y=409, width=30, height=19),
+        }
+
+        assert len(found) == len(expected)
+        assert all(f.confidence >= 0.95 for f in found)
+        assert expected == {image.region for image in found}
+
+    @staticmethod
+    def test_finding_image_with_unrecognized_match_domain_raises_value_error():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        with pytest.raises(ValueError):
+            any_image.find_image_all(needle, match_domain="shapes")
+
+    @staticmethod
+    def test_edge_map_is_only_computed_once():
+        any_image = Image(RESOURCES_DIR / "the.png")
+
+        with mock.patch("pin_the_tail.image._compute_edge_map", return_value=np.zeros((19, 30))) as compute_patch:
+            any_image._get_edge_map()
+            any_image._get_edge_map()
+
+        compute_patch.assert_called_once()
+
     @staticmethod
     def test_finding_all_instances_of_text():
         any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
@@ -527,6 +722,96 @@ class TestImage:
             [needle_image1, needle_image2], confidence=0.88, match_method=None
         )
 
+    @staticmethod
+    def test_find_all_recognizes_text_on_another_thread_while_searching_for_images():
+        any_image = BaseImage()
+        needle_image = Image(np.array([[[1, 2, 3], [4, 5, 6]], [[255, 254, 253], [252, 251, 250]]]))
+        text_result = MatchedRegionInImage(any_image, Region(1, 3, 5, 7), "text", 0.9)
+        image_result = MatchedRegionInImage(any_image, Region(1, 2, 3, 4), needle_image, 0.9)
+        text_started = threading.Event()
+        threads = []
+
+        def find_text_all(*args, **kwargs):
+            threads.append(threading.current_thread())
+            text_started.set()
+            return [text_result]
+
+        any_image.find_text_all = mock.MagicMock(side_effect=find_text_all)
+        # The image search only finishes once the OCR has started, so they must overlap
+        any_image.find_image_all = mock.MagicMock(
+            side_effect=lambda *args, **kwargs: text_started.wait(5) and [image_result]
+        )
+
+        actual = any_image.find_all(["text", needle_image])
+
+        assert actual == [text_result, image_result]
+        assert threads != [threading.current_thread()]
+
+    @staticmethod
+    def test_find_any_returns_image_matches_without_waiting_for_text():
+        any_image = BaseImage()
+        needle_image = Image(np.array([[[1, 2, 3], [4, 5, 6]], [[255, 254, 253], [252, 251, 250]]]))
+        image_result = MatchedRegionInImage(any_image, Region(1, 2, 3, 4), needle_image, 0.9)
+        ocr_may_finish = threading.Event()
+        any_image.find_text_all = mock.MagicMock(side_effect=lambda *args, **kwargs: ocr_may_finish.wait(5) and [])
+        any_image.find_image_all = mock.MagicMock(return_value=[image_result])
+
+        try:
+            actual = any_image.find_all(["text", needle_image], mode="any")
+        finally:
+            ocr_may_finish.set()
+
+        assert actual == [image_result]
+
+    @staticmethod
+    def test_find_any_waits_for_text_when_no_image_is_found():
+        any_image = BaseImage()
+        needle_image = Image(np.array([[[1, 2, 3], [4, 5, 6]], [[255, 254, 253], [252, 251, 250]]]))
+        text_result = MatchedRegionInImage(any_image, Region(1, 3, 5, 7), "text", 0.9)
+        any_image.find_text_all = mock.MagicMock(return_value=[text_result])
+        any_image.find_image_all = mock.MagicMock(return_value=[])
+
+        actual = any_image.find_all(["text", needle_image], mode="any")
+
+        assert actual == [text_result]
+
+    @staticmethod
+    def test_find_any_does_not_queue_more_ocr_while_abandoned_ocr_is_running():
+        any_image = BaseImage()
+        needle_image = Image(np.array([[[1, 2, 3], [4, 5, 6]], [[255, 254, 253], [252, 251, 250]]]))
+        image_result = MatchedRegionInImage(any_image, Region(1, 2, 3, 4), needle_image, 0.9)
+        any_image.find_text_all = mock.MagicMock(return_value=[])
+        any_image.find_image_all = mock.MagicMock(return_value=[image_result])
+        ocr_executor = MagicMock()
+        text_future = ocr_executor.submit.return_value
+        text_future.cancel.return_value = False
+
+        with mock.patch("pin_the_tail.image._get_ocr_executor", return_value=ocr_executor), mock.patch(
+            "pin_the_tail.image._abandoned_ocr_runs", set()
+        ):
+            first = any_image.find_all(["text", needle_image], mode="any")
+            second = any_image.find_all(["text", needle_image], mode="any")
+            # Once the abandoned OCR finishes, the text is recognized in the background again
+            text_future.add_done_callback.call_args[0][0](text_future)
+            third = any_image.find_all(["text", needle_image], mode="any")
+
+        assert first == second == third == [image_result]
+        assert ocr_executor.submit.call_count == 2
+        any_image.find_text_all.assert_not_called()
+
+    @staticmethod
+    def test_find_all_with_unrecognized_mode_raises_value_error():
+        with pytest.raises(ValueError):
+            BaseImage().find_all("text", mode="some")
+
+    @staticmethod
+    def test_finding_no_text_needles_does_not_recognize_text():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject._create_ocr_matcher = MagicMock()
+
+        assert subject.find_text_all([]) == []
+        subject._create_ocr_matcher.assert_not_called()
+
     @staticmethod
     def test_finding_best_match():
         # Arrange
@@ -607,6 +892,226 @@ class TestImage:
         )
 
 
+class TestMatchTemplateNumpy:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "match_method",
+        [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED, cv2.TM_CCORR, cv2.TM_CCORR_NORMED, cv2.TM_CCOEFF, cv2.TM_CCOEFF_NORMED],
+    )
+    @pytest.mark.parametrize("channels", [slice(None), 0])
+    def test_scores_match_opencv(match_method, channels):
+        haystack = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[130:180, 1000:1100, :3]
+        haystack = np.ascontiguousarray(haystack[:, :, channels])
+        needle = np.ascontiguousarray(haystack[12:31, 46:76])
+
+        expected = cv2.matchTemplate(needle, haystack, match_method)
+        actual = _match_template_numpy(needle, haystack, match_method)
+
+        assert actual.shape == expected.shape
+        assert np.allclose(actual, expected, rtol=1e-4, atol=1e-4 * np.abs(expected).max())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "match_method",
+        [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED, cv2.TM_CCORR, cv2.TM_CCORR_NORMED, cv2.TM_CCOEFF, cv2.TM_CCOEFF_NORMED],
+    )
+    @pytest.mark.parametrize("channels", [slice(None), 0])
+    def test_scores_at_candidates_match_opencv(match_method, channels):
+        haystack = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[130:180, 1000:1100, :3]
+        haystack = np.ascontiguousarray(haystack[:, :, channels])
+        needle = np.ascontiguousarray(haystack[12:31, 46:76])
+        candidates = np.array([[46, 12], [0, 0], [70, 31], [13, 7]])
+
+        expected = cv2.matchTemplate(needle, haystack, match_method)[candidates[:, 1], candidates[:, 0]]
+        actual = _match_template_numpy(needle, haystack, match_method, candidates)
+
+        assert np.allclose(actual, expected, rtol=1e-4, atol=1e-4 * np.abs(expected).max())
+
+    @staticmethod
+    def test_scoring_candidates_does_not_convert_haystack():
+        haystack = np.ascontiguousarray(
+            np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[130:180, 1000:1100, :3]
+        )
+        needle = np.ascontiguousarray(haystack[12:31, 46:76])
+
+        with mock.patch("pin_the_tail.image._as_float_channels", wraps=_as_float_channels) as convert_patch:
+            _match_template_numpy(needle, haystack, cv2.TM_SQDIFF_NORMED, np.array([[46, 12]]))
+
+        assert all(converted_call.args[0] is not haystack for converted_call in convert_patch.call_args_list)
+
+
+class TestSelectDistinctivePatch:
+    @staticmethod
+    def test_small_needle_has_no_patch():
+        needle = np.asarray(PILImage.open(str(RESOURCES_DIR / "the.png")))[:, :, :3]
+
+        assert _select_distinctive_patch(needle) is None
+
+    @staticmethod
+    def test_patch_is_not_repeated_within_needle():
+        rng = np.random.default_rng(0)
+        tile = rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8)
+        needle = np.tile(tile, (3, 3, 1))
+        needle[70:90, 40:60] = rng.integers(0, 256, size=(20, 20, 3), dtype=np.uint8)
+
+        actual = _select_distinctive_patch(needle, 32)
+
+        assert actual.width == actual.height == 32
+        assert actual.contains(Region(40, 70, 20, 20), overlap="any")
+
+    @staticmethod
+    def test_image_only_selects_patch_once():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        with mock.patch(
+            "pin_the_tail.image._select_distinctive_patch", return_value=Region(0, 0, 32, 32)
+        ) as select_patch:
+            any_image._get_distinctive_patch()
+            any_image._get_distinctive_patch()
+
+        select_patch.assert_called_once()
+
+
+class TestPreparedHaystack:
+    @staticmethod
+    def test_window_sums():
+        pixels = np.arange(4 * 5 * 3).reshape((4, 5, 3)).astype(np.uint8)
+        subject = PreparedHaystack(pixels)
+
+        actual_sums = subject.window_sums(2, 3)
+        actual_square_sums = subject.window_square_sums(2, 3)
+
+        windows = np.lib.stride_tricks.sliding_window_view(pixels.astype(np.float64), (2, 3), axis=(0, 1))
+        assert np.array_equal(actual_sums, windows.sum(axis=(3, 4)))
+        assert np.array_equal(actual_square_sums, (windows**2).sum(axis=(2, 3, 4)))
+
+    @staticmethod
+    def test_child_window_sums_reuse_parent_integral_images():
+        pixels = np.arange(6 * 7 * 3).reshape((6, 7, 3)).astype(np.uint8)
+        parent = PreparedHaystack(pixels)
+        parent.window_square_sums(2, 2)
+
+        subject = parent.get_child(Region(1, 2, 4, 3))
+        actual = subject.window_square_sums(2, 2)
+
+        assert subject._integrals is parent._integrals
+        assert np.array_equal(subject.image, pixels[2:5, 1:5])
+        assert np.array_equal(actual, PreparedHaystack(pixels[2:5, 1:5]).window_square_sums(2, 2))
+
+    @staticmethod
+    def test_sums_at():
+        pixels = np.arange(4 * 5 * 3).reshape((4, 5, 3)).astype(np.uint8)
+        subject = PreparedHaystack(pixels).get_child(Region(1, 1, 4, 3))
+
+        actual_sums, actual_square_sums = subject.sums_at(np.array([0, 2]), np.array([1, 0]), 2, 2)
+
+        windows = [pixels[2:4, 1:3].astype(np.float64), pixels[1:3, 3:5].astype(np.float64)]
+        assert np.array_equal(actual_sums, [window.sum(axis=(0, 1)) for window in windows])
+        assert np.array_equal(actual_square_sums, [(window**2).sum() for window in windows])
+
+    @staticmethod
+    def test_window_larger_than_haystack_has_no_sums():
+        subject = PreparedHaystack(np.zeros((4, 5, 3), dtype=np.uint8))
+
+        assert subject.window_square_sums(5, 5).size == 0
+
+    @staticmethod
+    def test_image_only_prepares_haystack_once():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        assert any_image._get_prepared_haystack() is any_image._get_prepared_haystack()
+
+    @staticmethod
+    def test_region_in_image_prepares_haystack_from_parent():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        child_image = any_image.get_child_region(Region(10, 20, 100, 50))
+
+        actual = child_image._get_prepared_haystack()
+
+        assert actual is child_image._get_prepared_haystack()
+        assert actual._integrals is any_image._get_prepared_haystack()._integrals
+        assert np.array_equal(actual.image, child_image._get_numpy_image())
+
+    @staticmethod
+    def test_screen_prepares_haystack_each_time():
+        any_image = Screen()
+        any_image._get_numpy_image = MagicMock(return_value=np.zeros((19, 30, 3), dtype=np.uint8))
+
+        assert any_image._get_prepared_haystack() is not any_image._get_prepared_haystack()
+
+    @staticmethod
+    def test_searching_for_one_needle_does_not_prepare_haystack():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        any_image.find_image_all(Image(RESOURCES_DIR / "the.png"))
+
+        assert not any_image._has_prepared_haystack()
+
+    @staticmethod
+    def test_searching_for_several_needles_prepares_haystack():
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        any_image.find_image_all([needle, needle])
+
+        assert any_image._has_prepared_haystack()
+        assert any_image.get_child_region(Region(10, 20, 100, 50))._has_prepared_haystack()
+
+    @staticmethod
+    @pytest.mark.parametrize("match_method", [cv2.TM_SQDIFF_NORMED, cv2.TM_CCORR_NORMED])
+    def test_finding_image_with_prepared_haystack_matches_opencv(match_method):
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        needle = Image(RESOURCES_DIR / "the.png")
+        haystack_pixels = np.ascontiguousarray(any_image._get_numpy_image())
+        any_image._get_prepared_haystack()
+
+        found = any_image.find_image_all(needle, 0.99, match_method=match_method)
+
+        expected = cv2.matchTemplate(haystack_pixels, np.ascontiguousarray(needle._get_numpy_image()), match_method)
+        if match_method == cv2.TM_SQDIFF_NORMED:
+            expected = 1 - expected
+        for match in found:
+            assert match.confidence == pytest.approx(expected[match.region.y, match.region.x], abs=1e-5)
+        assert len(found) == (expected >= 0.99).sum()
+
+
+class TestEliminateCandidates:
+    @staticmethod
+    def test_keeps_all_matches_and_eliminates_most_other_locations():
+        haystack = np.ascontiguousarray(
+            Image(RESOURCES_DIR / "wiki-python-text.png")._get_numpy_image()[120:220, 950:1150]
+        )
+        needle = np.ascontiguousarray(Image(RESOURCES_DIR / "the.png")._get_numpy_image())
+
+        actual = _eliminate_candidates(needle, PreparedHaystack(haystack), 0.99)
+
+        similarities = 1 - cv2.matchTemplate(haystack, needle, cv2.TM_SQDIFF_NORMED)
+        expected_ys, expected_xs = np.nonzero(similarities >= 0.99)
+        assert len(expected_xs) > 0
+        assert set(zip(expected_xs, expected_ys)) <= set(map(tuple, actual))
+        assert len(actual) < similarities.size // 100
+
+    @staticmethod
+    def test_gives_up_when_too_many_locations_survive():
+        haystack = np.full((200, 300, 3), 255, dtype=np.uint8)
+        needle = np.full((10, 10, 3), 250, dtype=np.uint8)
+
+        assert _eliminate_candidates(needle, PreparedHaystack(haystack), 0.9) is None
+
+    @staticmethod
+    @pytest.mark.parametrize("confidence", [0.9, 0.99])
+    def test_finding_image_by_elimination_matches_opencv(confidence):
+        any_image = Image(RESOURCES_DIR / "wiki-python-text.png").get_child_region(Region(950, 120, 200, 100))
+        needle = Image(RESOURCES_DIR / "the.png")
+
+        expected = any_image.find_image_all(needle, confidence, match_method=cv2.TM_SQDIFF_NORMED)
+        actual = any_image.find_image_all(needle, confidence, match_method=cv2.TM_SQDIFF_NORMED, backend="elimination")
+
+        assert [match.region for match in actual] == [match.region for match in expected]
+        for actual_match, expected_match in zip(actual, expected):
+            assert actual_match.confidence == pytest.approx(expected_match.confidence, abs=1e-5)
+
+
 class TestBaseImageWaitUntilAppears:
     @staticmethod
     def test_wait_until_image_appears_passes_arguments_to_general_wait_until_appears_method():
@@ -646,6 +1151,7 @@ class TestBaseImageWaitUntilAppears:
             line_break="\r\n",
             paragraph_break="\r\n\r\n",
             scans_per_second=15,
+            change_tolerance=0.05,
         )
 
         # Assert
@@ -654,6 +1160,7 @@ class TestBaseImageWaitUntilAppears:
             0.8,
             10,
             scans_per_second=15,
+            change_tolerance=0.05,
             text_kwargs=dict(regex=True, regex_flags=14, language="deu", line_break="\r\n", paragraph_break="\r\n\r\n"),
         )
         assert actual == []
@@ -666,18 +1173,19 @@ class TestBaseImageWaitUntilAppears:
         needle1 = "text"
         needle2 = BaseImage()
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             found = subject.wait_until_appears(
                 [needle1, needle2], 0.8, 10, scans_per_second=20, image_kwargs={"match_method": "ANY-METHOD"}
             )
 
             assert found == []
-            assert subject.find_text_all.call_count == 200
-            subject.find_text_all.assert_has_calls([call([needle1], 0.8)] * 200)
-            assert subject.find_image_all.call_count == 200
-            subject.find_image_all.assert_has_calls([call([needle2], 0.8, match_method="ANY-METHOD")] * 200)
-            assert sleep_patch.call_count == 200
-            sleep_patch.assert_has_calls([call(1 / 20)] * 200)
+            assert subject.find_text_all.call_count == 201
+            subject.find_text_all.assert_has_calls([call([needle1], 0.8)] * 201)
+            assert subject.find_image_all.call_count == 201
+            subject.find_image_all.assert_has_calls([call([needle2], 0.8, match_method="ANY-METHOD")] * 201)
+            assert clock.sleep.call_count == 200
+            assert clock.sleep.call_args_list == [call(pytest.approx(1 / 20))] * 200
+            assert clock.now == 10
 
     @staticmethod
     def test_wait_until_appears_returns_found_region_when_needle_found_in_image_immediately():
@@ -686,13 +1194,15 @@ class TestBaseImageWaitUntilAppears:
         needle2 = Image(RESOURCES_DIR / "the.png")
         subject.find_all = MagicMock(return_value=[MatchedRegionInImage(subject, Region(0, 0, 1, 1), needle2, 1.0)])
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             found = subject.wait_until_appears([needle1, needle2], 0.8, 10, scans_per_second=20)
 
             assert found == [MatchedRegionInImage(subject, Region(0, 0, 1, 1), needle2, 1.0)]
-            subject.find_all.assert_has_calls([call([needle1, needle2], 0.8, text_kwargs=None, image_kwargs=None)])
+            subject.find_all.assert_has_calls(
+                [call([needle1, needle2], 0.8, text_kwargs=None, image_kwargs=None, mode="any")]
+            )
             assert subject.find_all.call_count == 1
-            sleep_patch.assert_not_called()
+            clock.sleep.assert_not_called()
 
     @staticmethod
     def test_wait_until_appears_returns_found_region_when_needle_found_in_image_after_some_scans():
@@ -707,13 +1217,15 @@ class TestBaseImageWaitUntilAppears:
             ]
         )
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             found = subject.wait_until_appears([needle1, needle2], 0.8, 10, scans_per_second=20)
 
             assert found == [MatchedRegionInImage(subject, Region(0, 0, 1, 1), needle1, 1.0)]
-            subject.find_all.assert_has_calls([call([needle1, needle2], 0.8, text_kwargs=None, image_kwargs=None)])
+            subject.find_all.assert_has_calls(
+                [call([needle1, needle2], 0.8, text_kwargs=None, image_kwargs=None, mode="any")]
+            )
             assert subject.find_all.call_count == 3
-            assert sleep_patch.call_count == 2
+            assert clock.sleep.call_count == 2
 
     @staticmethod
     def test_wait_until_appears_scans_once_when_timeout_is_zero():
@@ -722,13 +1234,559 @@ class TestBaseImageWaitUntilAppears:
         needle2 = Image(RESOURCES_DIR / "the.png")
         subject.find_all = MagicMock(return_value=[])
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             found = subject.wait_until_appears([needle1, needle2], 0.8, 0, scans_per_second=20)
 
             assert found == []
-            subject.find_all.assert_has_calls([call([needle1, needle2], 0.8, text_kwargs=None, image_kwargs=None)])
+            subject.find_all.assert_has_calls(
+                [call([needle1, needle2], 0.8, text_kwargs=None, image_kwargs=None, mode="any")]
+            )
             assert subject.find_all.call_count == 1
-            sleep_patch.assert_called_once_with(1 / 20)
+            clock.sleep.assert_not_called()
+
+
+class TestScreenWaitUntilAppears:
+    @staticmethod
+    def test_unchanged_screen_reuses_previous_result():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 100, 3), dtype=np.uint8)
+        fake_backend.damage_count.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+
+        with mock.patch.object(Image, "find_all", return_value=[]) as find_all_patch, fake_clock():
+            found = subject.wait_until_appears("text", 0.8, 1, scans_per_second=10)
+
+        assert found == []
+        assert find_all_patch.call_count == 1
+        assert fake_backend.grab.call_count == 11
+        assert subject.last_wait_statistics == WaitStatistics(scans=11, skipped_scans=10)
+
+    @staticmethod
+    def test_changed_screen_is_scanned_again():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.full((60, 100, 3), i, dtype=np.uint8) for i in (0, 0, 1, 1, 2)]
+        fake_backend.damage_count.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+        match = MatchedRegionInImage(Image(RESOURCES_DIR / "the.png"), Region(0, 0, 1, 1), "text", 1.0)
+
+        with mock.patch.object(Image, "find_all", side_effect=[[], [], [match]]) as find_all_patch, fake_clock():
+            found = subject.wait_until_appears("text", 0.8, 1, scans_per_second=10)
+
+        assert found == [match]
+        assert find_all_patch.call_count == 3
+        assert subject.last_wait_statistics == WaitStatistics(scans=5, skipped_scans=2)
+
+    @staticmethod
+    def test_text_is_only_recognized_again_when_screen_changes_beyond_tolerance():
+        # 128 x 256 pixels are 2 x 4 tiles, so each tile is an eighth of the screen
+        frames = [np.zeros((128, 256, 3), dtype=np.uint8) for _ in range(5)]
+        frames[1][0, 0] = frames[2][0, 0] = 1
+        frames[3][0, 0] = frames[4][0, 0] = frames[3][100, 200] = frames[4][100, 200] = 1
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = frames
+        fake_backend.damage_count.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+        matcher = MagicMock()
+        matcher.find_all.return_value = []
+
+        with mock.patch.object(Image, "_create_ocr_matcher", return_value=matcher) as create_patch, fake_clock():
+            subject.wait_until_text_appears("text", timeout=1, scans_per_second=4, change_tolerance=0.2)
+
+        # Only the first frame and the fourth (where a quarter of the tiles differ from the first) are read
+        assert create_patch.call_count == 2
+        assert subject.last_wait_statistics == WaitStatistics(scans=5, skipped_scans=3)
+
+    @staticmethod
+    def test_region_of_unchanged_screen_reuses_previous_result():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = lambda region=None: np.zeros(
+            (60, 100, 3) if region is None else (region.height, region.width, 3), dtype=np.uint8
+        )
+        fake_backend.damage_count.return_value = 0
+        subject = RegionInImage(Screen(capture_backend=fake_backend), Region(10, 10, 30, 20))
+
+        with mock.patch.object(RegionInImage, "find_all", return_value=[]) as find_all_patch, fake_clock():
+            subject.wait_until_appears("text", 0.8, 1, scans_per_second=4)
+
+        assert find_all_patch.call_count == 1
+        fake_backend.grab.assert_called_with(Region(10, 10, 30, 20))
+        assert subject.last_wait_statistics == WaitStatistics(scans=5, skipped_scans=4)
+
+    @staticmethod
+    def test_matches_found_in_region_of_screen_are_located_in_screen():
+        needle = np.random.default_rng(0).integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+        frame = np.full((1024, 1280, 3), 128, dtype=np.uint8)
+        frame[260:280, 150:180] = needle
+        fake_backend = create_dual_monitor_backend()
+        fake_backend.grab.side_effect = lambda region: frame[
+            region.top : region.bottom, region.left - 1920 : region.right - 1920
+        ]
+        subject = Screen(capture_backend=fake_backend, monitor=1).get_child_region(Region(100, 200, 300, 300))
+
+        with fake_clock():
+            found = subject.wait_until_appears(Image(needle), 0.99, 1)
+
+        fake_backend.grab.assert_called_with(Region(2020, 200, 300, 300))
+        assert len(found) == 1
+        assert found[0].absolute_region == Region(150, 260, 30, 20)
+        assert found[0].screen_region == Region(2070, 260, 30, 20)
+
+    @staticmethod
+    def test_screen_that_reports_changes_is_not_scanned_again_until_it_changes():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 100, 3), dtype=np.uint8)
+        fake_backend.damage_count.return_value = None
+
+        with mock.patch.object(Image, "find_all", return_value=[]) as find_all_patch, fake_clock() as clock:
+            fake_backend.wait_for_damage.side_effect = lambda timeout, since: clock.advance(timeout) or False
+            subject = Screen(capture_backend=fake_backend)
+            found = subject.wait_until_appears("text", 0.8, 1, scans_per_second=10)
+
+        assert found == []
+        assert find_all_patch.call_count == 1
+        assert fake_backend.grab.call_count == 1
+        fake_backend.wait_for_damage.assert_called_once_with(pytest.approx(0.9), None)
+        assert clock.now == pytest.approx(1)
+
+    @staticmethod
+    def test_screen_that_reports_changes_is_scanned_as_soon_as_it_changes():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.full((60, 100, 3), i, dtype=np.uint8) for i in (0, 1)]
+        fake_backend.damage_count.return_value = None
+        match = MatchedRegionInImage(Image(RESOURCES_DIR / "the.png"), Region(0, 0, 1, 1), "text", 1.0)
+
+        with mock.patch.object(Image, "find_all", side_effect=[[], [match]]), fake_clock() as clock:
+            fake_backend.wait_for_damage.side_effect = lambda timeout, since: clock.advance(0.5) or True
+            subject = Screen(capture_backend=fake_backend)
+            found = subject.wait_until_appears("text", 0.8, 5, scans_per_second=10)
+
+        assert found == [match]
+        assert clock.now == pytest.approx(0.6)
+
+    @staticmethod
+    def test_image_is_scanned_every_time():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+
+        with fake_clock():
+            subject.wait_until_appears("text", 0.8, 1, scans_per_second=4)
+
+        assert subject.find_all.call_count == 5
+        assert subject.last_wait_statistics == WaitStatistics(scans=5, skipped_scans=0)
+
+
+class TestWaitSchedule:
+    @staticmethod
+    def test_time_spent_scanning_counts_toward_time_between_scans():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        with fake_clock() as clock:
+            subject.find_all = MagicMock(side_effect=lambda *args, **kwargs: clock.advance(0.1) or [])
+            subject.wait_until_appears("text", 0.8, 1, scans_per_second=4)
+
+        assert subject.find_all.call_count == 5
+        assert clock.sleep.call_args_list == [call(pytest.approx(0.15))] * 4
+        assert clock.now == pytest.approx(1.1)
+
+    @staticmethod
+    def test_slow_scans_skip_missed_scans_and_deadline_is_honored():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        with fake_clock() as clock:
+            # Each scan takes 0.4 seconds, but a scan is requested every 0.25 seconds
+            subject.find_all = MagicMock(side_effect=lambda *args, **kwargs: clock.advance(0.4) or [])
+            subject.wait_until_appears("text", 0.8, 1, scans_per_second=4)
+
+        # Scans start at 0, 0.5 (0.25 was missed), and the deadline (1), instead of every 0.4 + 0.25 seconds
+        assert subject.find_all.call_count == 3
+        assert clock.sleep.call_args_list == [call(pytest.approx(0.1)), call(pytest.approx(0.1))]
+        assert clock.now == pytest.approx(1.4)
+
+    @staticmethod
+    def test_last_scan_is_clamped_to_deadline():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+
+        with fake_clock() as clock:
+            subject.wait_until_appears("text", 0.8, 1, scans_per_second=2.5)
+
+        assert subject.find_all.call_count == 4
+        assert clock.sleep.call_args_list == [
+            call(pytest.approx(0.4)),
+            call(pytest.approx(0.4)),
+            call(pytest.approx(0.2)),
+        ]
+        assert clock.now == pytest.approx(1)
+
+    @staticmethod
+    def test_achieved_scan_rate_is_reported():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        with fake_clock() as clock:
+            subject.find_all = MagicMock(side_effect=lambda *args, **kwargs: clock.advance(0.5) or [])
+            subject.wait_until_appears("text", 0.8, 1.5, scans_per_second=10)
+
+        assert subject.last_wait_statistics.scans == 3
+        assert subject.last_wait_statistics.elapsed_time == pytest.approx(1.5)
+        assert subject.last_wait_statistics.achieved_scans_per_second == pytest.approx(2)
+
+    @staticmethod
+    def test_watcher_caps_scan_rate():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+
+        with ScanScheduler().watcher(scans_per_second=2), fake_clock() as clock:
+            subject.wait_until_appears("text", 0.8, 1, scans_per_second=10)
+
+        assert subject.find_all.call_count == 3
+        assert clock.sleep.call_args_list == [call(pytest.approx(0.5))] * 2
+
+
+class TestScanPolicy:
+    @staticmethod
+    def test_backoff_policy_backs_off_to_minimum_rate():
+        policy = BackoffScanPolicy(initial_scans_per_second=10, minimum_scans_per_second=1, backoff=2)
+
+        intervals = [policy.next_interval(None, False)]
+        for _ in range(4):
+            intervals.append(policy.next_interval(intervals[-1], False))
+
+        assert intervals == pytest.approx([0.1, 0.2, 0.4, 0.8, 1])
+
+    @staticmethod
+    def test_backoff_policy_is_fast_again_after_change():
+        policy = BackoffScanPolicy(initial_scans_per_second=10, minimum_scans_per_second=1, backoff=2)
+
+        assert policy.next_interval(0.8, True) == pytest.approx(0.1)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"minimum_scans_per_second": 0},
+            {"initial_scans_per_second": 1, "minimum_scans_per_second": 2},
+            {"backoff": 0.5},
+        ],
+    )
+    def test_backoff_policy_with_invalid_arguments_raises_value_error(kwargs):
+        with pytest.raises(ValueError):
+            BackoffScanPolicy(**kwargs)
+
+    @staticmethod
+    def test_fixed_policy_with_non_positive_rate_raises_value_error():
+        with pytest.raises(ValueError):
+            FixedScanPolicy(0)
+
+    @staticmethod
+    def test_wait_follows_policy():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+        policy = BackoffScanPolicy(initial_scans_per_second=10, minimum_scans_per_second=1, backoff=2)
+
+        with fake_clock() as clock:
+            subject.wait_until_appears("text", 0.8, 2, scans_per_second=policy)
+
+        # Scans at 0, 0.1, 0.3, 0.7, 1.5, and the deadline (2)
+        assert subject.find_all.call_count == 6
+        assert clock.sleep.call_args_list == [call(pytest.approx(interval)) for interval in (0.1, 0.2, 0.4, 0.8, 0.5)]
+
+    @staticmethod
+    def test_wait_on_screen_scans_fast_again_after_change():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.full((60, 100, 3), i, dtype=np.uint8) for i in (0, 0, 1, 1, 1, 1)]
+        fake_backend.damage_count.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+        policy = BackoffScanPolicy(initial_scans_per_second=10, minimum_scans_per_second=1, backoff=2)
+
+        with mock.patch.object(Image, "find_all", return_value=[]), fake_clock() as clock:
+            subject.wait_until_appears("text", 0.8, 0.75, scans_per_second=policy)
+
+        # The screen changes at the third scan (0.3), so the interval goes back to 0.1
+        assert clock.sleep.call_args_list == [call(pytest.approx(interval)) for interval in (0.1, 0.2, 0.1, 0.2, 0.15)]
+
+    @staticmethod
+    def test_await_follows_policy():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+        policy = BackoffScanPolicy(initial_scans_per_second=10, minimum_scans_per_second=1, backoff=2)
+
+        with fake_clock() as clock:
+            asyncio.run(subject.await_until_appears("text", 0.8, 1, scans_per_second=policy))
+
+        assert clock.async_sleep.call_args_list == [call(pytest.approx(interval)) for interval in (0.1, 0.2, 0.4, 0.3)]
+
+
+class TestWaitUntilStable:
+    @staticmethod
+    def test_image_is_always_stable():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+
+        with fake_clock() as clock:
+            assert subject.wait_until_stable() is True
+
+        clock.sleep.assert_not_called()
+
+    @staticmethod
+    def test_screen_is_stable_once_unchanged_for_quiet_period():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.full((60, 100, 3), i, dtype=np.uint8) for i in (0, 1, 1, 1, 1)]
+        fake_backend.damage_count.return_value = None
+        fake_backend.wait_for_damage.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+
+        with fake_clock() as clock:
+            stable = subject.wait_until_stable(quiet_period=0.3, scans_per_second=10)
+
+        # The screen last changed at 0.1, so it's stable at 0.4
+        assert stable is True
+        assert fake_backend.grab.call_count == 5
+        assert clock.now == pytest.approx(0.4)
+
+    @staticmethod
+    def test_screen_that_keeps_changing_times_out():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = lambda *args: np.full((60, 100, 3), fake_backend.grab.call_count, np.uint8)
+        fake_backend.damage_count.return_value = None
+        fake_backend.wait_for_damage.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+
+        with fake_clock() as clock:
+            stable = subject.wait_until_stable(quiet_period=0.5, timeout=1, scans_per_second=4)
+
+        assert stable is False
+        assert fake_backend.grab.call_count == 5
+        assert clock.now == pytest.approx(1)
+
+    @staticmethod
+    def test_screen_that_reports_changes_is_stable_as_soon_as_quiet_period_ends():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 100, 3), dtype=np.uint8)
+        fake_backend.damage_count.return_value = None
+
+        with fake_clock() as clock:
+            fake_backend.wait_for_damage.side_effect = lambda timeout, since: clock.advance(timeout) or False
+            subject = Screen(capture_backend=fake_backend)
+            stable = subject.wait_until_stable(quiet_period=0.5, scans_per_second=10)
+
+        assert stable is True
+        assert fake_backend.grab.call_count == 1
+        fake_backend.wait_for_damage.assert_called_once_with(pytest.approx(0.4), None)
+        assert clock.now == pytest.approx(0.5)
+
+    @staticmethod
+    def test_screen_that_reports_changes_times_out_before_quiet_period_ends():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 100, 3), dtype=np.uint8)
+        fake_backend.damage_count.return_value = None
+
+        with fake_clock() as clock:
+            fake_backend.wait_for_damage.side_effect = lambda timeout, since: clock.advance(timeout) or False
+            subject = Screen(capture_backend=fake_backend)
+            stable = subject.wait_until_stable(quiet_period=2, timeout=1)
+
+        assert stable is False
+        assert clock.now == pytest.approx(1)
+
+    @staticmethod
+    def test_only_region_is_captured():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((20, 30, 3), dtype=np.uint8)
+        fake_backend.damage_count.return_value = None
+        fake_backend.wait_for_damage.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+
+        with mock.patch.object(Screen, "_get_size", return_value=(100, 60)), fake_clock():
+            stable = subject.wait_until_stable(Region(10, 10, 30, 20), quiet_period=0.2, scans_per_second=10)
+
+        assert stable is True
+        assert fake_backend.grab.call_count == 3
+        fake_backend.grab.assert_called_with(Region(10, 10, 30, 20))
+
+
+class TestWaitForAny:
+    @staticmethod
+    def test_returns_first_condition_that_holds():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        match = MatchedRegionInImage(subject, Region(0, 0, 1, 1), "Error", 1.0)
+        subject.find_all = MagicMock(side_effect=lambda needle, *args, **kwargs: [match] if needle == "Error" else [])
+
+        with fake_clock():
+            fired = subject.wait_for_any({"success": "Saved", "failure": "Error"}, 0.8)
+
+        assert fired == FiredCondition("failure", [match])
+        assert subject.find_all.call_args_list == [
+            call("Saved", 0.8, text_kwargs=None, image_kwargs=None, mode="any"),
+            call("Error", 0.8, text_kwargs=None, image_kwargs=None, mode="any"),
+        ]
+
+    @staticmethod
+    def test_earlier_conditions_take_priority():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        match = MatchedRegionInImage(subject, Region(0, 0, 1, 1), "text", 1.0)
+        subject.find_all = MagicMock(return_value=[match])
+
+        with fake_clock():
+            fired = subject.wait_for_any({"first": "text", "second": "other text"})
+
+        assert fired == FiredCondition("first", [match])
+        subject.find_all.assert_called_once()
+
+    @staticmethod
+    def test_predicate_is_called_with_image():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        predicate = MagicMock(side_effect=[False, False, True])
+
+        with fake_clock() as clock:
+            fired = subject.wait_for_any({"ready": predicate}, timeout=10, scans_per_second=20)
+
+        assert fired == FiredCondition("ready", [])
+        predicate.assert_called_with(subject)
+        assert clock.sleep.call_args_list == [call(pytest.approx(1 / 20))] * 2
+
+    @staticmethod
+    def test_returns_none_when_no_condition_holds_before_timeout():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+        predicate = MagicMock(return_value=[])
+
+        with fake_clock():
+            fired = subject.wait_for_any({"text": "text", "predicate": predicate}, timeout=1, scans_per_second=4)
+
+        assert fired is None
+        assert subject.find_all.call_count == 5
+        assert predicate.call_count == 5
+
+    @staticmethod
+    def test_screen_is_captured_and_read_once_per_scan_for_all_conditions():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.full((60, 100, 3), i, dtype=np.uint8) for i in range(3)]
+        fake_backend.damage_count.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+        matcher = MagicMock()
+        matcher.find_all.return_value = []
+        predicate = MagicMock(side_effect=lambda image: image.find_text_all("OK"))
+
+        with mock.patch.object(Image, "_create_ocr_matcher", return_value=matcher) as create_patch, fake_clock():
+            fired = subject.wait_for_any(
+                {"saved": "Saved", "failed": ["Error", "Failed"], "ok": predicate}, timeout=1, scans_per_second=2
+            )
+
+        assert fired is None
+        assert fake_backend.grab.call_count == 3
+        assert create_patch.call_count == 3
+        assert matcher.find_all.call_count == 12
+
+    @staticmethod
+    def test_await_for_any_returns_condition_that_holds():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        match = MatchedRegionInImage(subject, Region(0, 0, 1, 1), "text", 1.0)
+        subject.find_all = MagicMock(side_effect=[[], [match]])
+
+        with fake_clock() as clock:
+            fired = asyncio.run(subject.await_for_any({"text": "text"}, timeout=10, scans_per_second=20))
+
+        assert fired == FiredCondition("text", [match])
+        assert clock.async_sleep.call_args_list == [call(pytest.approx(1 / 20))]
+
+
+class TestAsyncio:
+    @staticmethod
+    def test_afind_all_searches_on_executor():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        match = MatchedRegionInImage(subject, Region(0, 0, 1, 1), "text", 1.0)
+        threads = []
+        subject.find_all = MagicMock(side_effect=lambda *args: threads.append(threading.current_thread()) or [match])
+
+        actual = asyncio.run(subject.afind_all("text", 0.8))
+
+        assert actual == [match]
+        subject.find_all.assert_called_once_with("text", 0.8, None, None)
+        assert threads != [threading.main_thread()]
+
+    @staticmethod
+    def test_afind_returns_result_of_find():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        match = MatchedRegionInImage(subject, Region(0, 0, 1, 1), "text", 1.0)
+        subject.find = MagicMock(return_value=match)
+
+        actual = asyncio.run(subject.afind("text", 0.8, image_kwargs={"subpatch": True}))
+
+        assert actual == match
+        subject.find.assert_called_once_with("text", 0.8, None, {"subpatch": True})
+
+    @staticmethod
+    def test_await_until_appears_returns_found_region_after_some_scans():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        match = MatchedRegionInImage(subject, Region(0, 0, 1, 1), "text", 1.0)
+        subject.find_all = MagicMock(side_effect=[[], [], [match]])
+
+        with fake_clock() as clock:
+            found = asyncio.run(subject.await_until_appears("text", 0.8, 10, scans_per_second=20))
+
+        assert found == [match]
+        assert clock.async_sleep.call_args_list == [call(pytest.approx(1 / 20))] * 2
+        clock.sleep.assert_not_called()
+
+    @staticmethod
+    def test_await_until_vanishes_returns_false_when_needle_stays():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[MatchedRegionInImage(subject, Region(0, 0, 1, 1), "text", 1.0)])
+
+        with fake_clock() as clock:
+            vanished = asyncio.run(subject.await_until_vanishes("text", 0.8, 1, scans_per_second=4))
+
+        assert vanished is False
+        assert subject.find_all.call_count == 5
+        assert clock.now == pytest.approx(1)
+
+    @staticmethod
+    def test_await_until_vanishes_skips_capture_while_screen_reports_no_change():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 100, 3), dtype=np.uint8)
+        fake_backend.wait_for_damage.return_value = False
+        subject = Screen(capture_backend=fake_backend)
+        match = MatchedRegionInImage(Image(RESOURCES_DIR / "the.png"), Region(0, 0, 1, 1), "text", 1.0)
+
+        with mock.patch.object(Image, "find_all", return_value=[match]), fake_clock():
+            vanished = asyncio.run(subject.await_until_vanishes("text", 0.8, 1, scans_per_second=4))
+
+        assert vanished is False
+        assert fake_backend.grab.call_count == 1
+        assert subject.last_wait_statistics == WaitStatistics(scans=5, skipped_scans=4)
+
+    @staticmethod
+    def test_cancelling_await_until_appears_stops_waiting():
+        subject = Image(RESOURCES_DIR / "wiki-python-text.png")
+        subject.find_all = MagicMock(return_value=[])
+
+        async def cancel_wait():
+            task = asyncio.ensure_future(subject.await_until_appears("text", 0.8, 100))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(asyncio.wait_for(cancel_wait(), 5))
+
+    @staticmethod
+    def test_many_waits_share_a_bounded_executor():
+        subjects = [Image(RESOURCES_DIR / "the.png") for _ in range(200)]
+        for subject in subjects:
+            subject.find_all = MagicMock(return_value=[])
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        async def wait_for_all():
+            return await asyncio.gather(*(subject.await_until_appears("text", 0.8, 0) for subject in subjects))
+
+        set_async_executor(executor)
+        try:
+            actual = asyncio.run(wait_for_all())
+        finally:
+            set_async_executor(None)
+            executor.shutdown()
+
+        assert actual == [[]] * 200
+        assert all(subject.find_all.call_count == 1 for subject in subjects)
 
 
 class TestBaseImageWaitUntilVanishes:
@@ -770,6 +1828,7 @@ class TestBaseImageWaitUntilVanishes:
             line_break="\r\n",
             paragraph_break="\r\n\r\n",
             scans_per_second=15,
+            change_tolerance=0.05,
         )
 
         # Assert
@@ -778,6 +1837,7 @@ class TestBaseImageWaitUntilVanishes:
             0.8,
             10,
             scans_per_second=15,
+            change_tolerance=0.05,
             text_kwargs=dict(regex=True, regex_flags=14, language="deu", line_break="\r\n", paragraph_break="\r\n\r\n"),
         )
         assert actual == []
@@ -790,7 +1850,7 @@ class TestBaseImageWaitUntilVanishes:
         needle1 = "text"
         needle2 = BaseImage()
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             result = subject.wait_until_vanishes(
                 [needle1, needle2], 0.8, 10, scans_per_second=20, image_kwargs={"match_method": "ANY-METHOD"}
             )
@@ -798,7 +1858,7 @@ class TestBaseImageWaitUntilVanishes:
             assert result is True
             subject.find_text_all.assert_called_once_with([needle1], 0.8)
             subject.find_image_all.assert_called_once_with([needle2], 0.8, match_method="ANY-METHOD")
-            sleep_patch.assert_not_called()
+            clock.sleep.assert_not_called()
 
     @staticmethod
     def test_wait_until_vanishes_returns_false_when_needle_found_in_image():
@@ -809,19 +1869,23 @@ class TestBaseImageWaitUntilVanishes:
             return_value=[MatchedRegionInImage(subject, Region(0, 0, 1, 1), needle2, 1.0)]
         )
         subject.find_text_all = MagicMock(return_value=[])
+        ocr_executor = MagicMock()
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock, mock.patch("pin_the_tail.image._get_ocr_executor", return_value=ocr_executor):
             result = subject.wait_until_vanishes(
                 [needle1, needle2], 0.8, 10, scans_per_second=20, image_kwargs={"match_method": "ANY-METHOD"}
             )
 
             assert result is False
-            assert subject.find_text_all.call_count == 200
-            subject.find_text_all.assert_has_calls([call([needle1], 0.8)] * 200)
-            assert subject.find_image_all.call_count == 200
-            subject.find_image_all.assert_has_calls([call([needle2], 0.8, match_method="ANY-METHOD")] * 200)
-            assert sleep_patch.call_count == 200
-            sleep_patch.assert_has_calls([call(1 / 20)] * 200)
+            # The image is found first each time, so the OCR is cancelled rather than waited for
+            ocr_executor.submit.assert_has_calls([call(subject.find_text_all, [needle1], 0.8)] * 201, any_order=True)
+            assert ocr_executor.submit.return_value.cancel.call_count == 201
+            ocr_executor.submit.return_value.result.assert_not_called()
+            assert subject.find_image_all.call_count == 201
+            subject.find_image_all.assert_has_calls([call([needle2], 0.8, match_method="ANY-METHOD")] * 201)
+            assert clock.sleep.call_count == 200
+            assert clock.sleep.call_args_list == [call(pytest.approx(1 / 20))] * 200
+            assert clock.now == 10
 
     @staticmethod
     def test_wait_until_vanishes_returns_true_when_needle_eventually_leaves_image():
@@ -835,14 +1899,16 @@ class TestBaseImageWaitUntilVanishes:
             ]
         )
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             vanished = any_image.wait_until_vanishes(needle, 0.8, 10, scans_per_second=20)
 
             assert vanished is True
-            any_image.find_all.assert_has_calls([call(needle, 0.8, text_kwargs=None, image_kwargs=None)] * 3)
+            any_image.find_all.assert_has_calls(
+                [call(needle, 0.8, text_kwargs=None, image_kwargs=None, mode="any")] * 3
+            )
             assert any_image.find_all.call_count == 3
-            sleep_patch.assert_has_calls([call(1 / 20)] * 2)
-            assert sleep_patch.call_count == 2
+            assert clock.sleep.call_args_list == [call(pytest.approx(1 / 20))] * 2
+            assert clock.sleep.call_count == 2
 
     @staticmethod
     def test_wait_until_vanishes_scans_once_when_timeout_is_zero():
@@ -850,13 +1916,13 @@ class TestBaseImageWaitUntilVanishes:
         needle = "text"
         any_image.find_all = MagicMock(return_value=[MatchedRegionInImage(any_image, Region(0, 0, 1, 1), needle, 1.0)])
 
-        with mock.patch("pin_the_tail.image.pyautogui.sleep", return_value=None, new_callable=MagicMock) as sleep_patch:
+        with fake_clock() as clock:
             vanished = any_image.wait_until_vanishes(needle, 0.8, 0, scans_per_second=20)
 
             assert vanished is False
-            any_image.find_all.assert_has_calls([call(needle, 0.8, text_kwargs=None, image_kwargs=None)])
+            any_image.find_all.assert_has_calls([call(needle, 0.8, text_kwargs=None, image_kwargs=None, mode="any")])
             assert any_image.find_all.call_count == 1
-            sleep_patch.assert_called_once_with(1 / 20)
+            clock.sleep.assert_not_called()
 
 
 class TestBaseImageContains:
@@ -1468,6 +2534,19 @@ class TestMatchedRegionInImage:
         assert subject != MatchedRegionInImage(parent_image, region, needle, confidence)
 
 
+def create_dual_monitor_backend():
+    """
+    Create a fake capture backend for a desktop with a 1920x1080 monitor and a 1280x1024 monitor to its right.
+    """
+    fake_backend = MagicMock()
+    fake_backend.monitors.return_value = [
+        Monitor(0, Region(0, 0, 1920, 1080), "left", True),
+        Monitor(1, Region(1920, 0, 1280, 1024), "right", False),
+    ]
+    fake_backend.grab.return_value = np.zeros((1024, 1280, 3), dtype=np.uint8)
+    return fake_backend
+
+
 class TestScreen:
     @staticmethod
     def test_getting_ocr_matcher_for_same_language_creates_it_each_time():
@@ -1486,6 +2565,17 @@ class TestScreen:
             ]
         )
 
+    @staticmethod
+    def test_edge_map_is_computed_each_time():
+        any_image = Screen()
+
+        with mock.patch("pin_the_tail.image._compute_edge_map", return_value=np.zeros((19, 30))) as compute_patch:
+            any_image._get_numpy_image = MagicMock(return_value=np.zeros((19, 30, 3), dtype=np.uint8))
+            any_image._get_edge_map()
+            any_image._get_edge_map()
+
+        assert compute_patch.call_count == 2
+
     @staticmethod
     def test_getting_screenshot_takes_a_screenshot():
         any_image = Screen()
@@ -1539,6 +2629,268 @@ class TestScreen:
         # Assert
         assert pyautogui.screenshot.call_count == 1
 
+    @staticmethod
+    def test_screen_size_is_remembered_between_captures():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 100, 3), dtype=np.uint8)
+        screen = Screen(capture_backend=fake_backend)
+
+        screen.get_child_region(Region(10, 10, 20, 20))
+        screen.get_child_region(Region(10, 10, 20, 20))
+
+        assert (screen.width, screen.height) == (100, 60)
+        assert fake_backend.grab.call_count == 1
+
+    @staticmethod
+    def test_screen_size_is_updated_when_resolution_changes():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.zeros((60, 100, 3), dtype=np.uint8), np.zeros((90, 160, 3), dtype=np.uint8)]
+        screen = Screen(capture_backend=fake_backend)
+        first_region = screen.region
+
+        screen.screenshot()
+
+        assert first_region == Region(0, 0, 100, 60)
+        assert screen.region == Region(0, 0, 160, 90)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("find_image_all", (Image(RESOURCES_DIR / "the.png"),)),
+            ("find_image", (Image(RESOURCES_DIR / "the.png"),)),
+            ("find_text_all", ("the",)),
+            ("find_text", ("the",)),
+            ("get_text", ()),
+        ],
+    )
+    def test_query_methods_only_capture_one_frame(method, args):
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[
+            :, :, :3
+        ]
+        screen = Screen(capture_backend=fake_backend)
+
+        with mock.patch("pin_the_tail.image.OCRMatcher") as ocr_matcher_patch:
+            ocr_matcher_patch.return_value.find_all.return_value = [OCRMatch(0, 3, Region(155, 84, 24, 12), 0.95)]
+            getattr(screen, method)(*args)
+
+        fake_backend.grab.assert_called_once_with()
+
+    @staticmethod
+    def test_screen_limited_to_monitor_only_captures_monitor():
+        fake_backend = create_dual_monitor_backend()
+        subject = Screen(capture_backend=fake_backend, monitor=1)
+
+        actual = subject.screenshot()
+
+        fake_backend.grab.assert_called_once_with(Region(1920, 0, 1280, 1024))
+        assert actual.origin == Point(1920, 0)
+        assert subject.monitor == fake_backend.monitors.return_value[1]
+        assert (subject.width, subject.height) == (1280, 1024)
+
+    @staticmethod
+    def test_region_in_screen_limited_to_monitor_captures_region_on_monitor():
+        fake_backend = create_dual_monitor_backend()
+        subject = Screen(capture_backend=fake_backend, monitor=1).get_child_region(Region(10, 20, 30, 40))
+
+        subject._get_numpy_image()
+
+        fake_backend.grab.assert_called_once_with(Region(1930, 20, 30, 40))
+        assert subject.screen_region == Region(1930, 20, 30, 40)
+
+    @staticmethod
+    @pytest.mark.parametrize("monitor", [-1, 2])
+    def test_unrecognized_monitor_raises_value_error(monitor):
+        with pytest.raises(ValueError):
+            Screen(capture_backend=create_dual_monitor_backend(), monitor=monitor)
+
+    @staticmethod
+    def test_regions_found_on_monitor_know_where_they_are_on_the_desktop():
+        fake_backend = create_dual_monitor_backend()
+        fake_backend.grab.return_value = np.ascontiguousarray(
+            np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[:, :, :3]
+        )
+        subject = Screen(capture_backend=fake_backend, monitor=1)
+
+        found = subject.find_image(Image(RESOURCES_DIR / "the.png"))
+
+        assert found.region == Region(1046, 142, 30, 19)
+        assert found.screen_region == Region(2966, 142, 30, 19)
+        assert found.screen_center == Point(2981, 151)
+
+    @staticmethod
+    def test_matches_found_on_screen_know_when_their_frame_was_captured():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.ascontiguousarray(
+            np.asarray(PILImage.open(str(RESOURCES_DIR / "wiki-python-text.png")))[:, :, :3]
+        )
+        subject = Screen(capture_backend=fake_backend)
+
+        with mock.patch("pin_the_tail.image.time") as time_patch:
+            time_patch.monotonic.side_effect = [10.0, 10.25]
+            found = subject.find_image(Image(RESOURCES_DIR / "the.png"))
+
+        assert found.timestamp == 10.25
+        assert found.capture_info.sequence == 0
+
+    @staticmethod
+    def test_matches_found_in_image_have_no_timestamp():
+        found = Image(RESOURCES_DIR / "wiki-python-text.png").find_image(Image(RESOURCES_DIR / "the.png"))
+
+        assert found.timestamp is None
+
+    @staticmethod
+    def test_region_in_screen_only_captures_region():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((40, 30, 3), dtype=np.uint8)
+        screen = Screen(capture_backend=fake_backend)
+        subject = RegionInImage(screen, Region(110, 70, 30, 40))
+
+        actual = subject._get_numpy_image()
+
+        fake_backend.grab.assert_called_once_with(Region(110, 70, 30, 40))
+        assert actual is fake_backend.grab.return_value
+
+    @staticmethod
+    def test_nested_regions_in_screen_capture_innermost_region_once():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((40, 30, 3), dtype=np.uint8)
+        screen = Screen(capture_backend=fake_backend)
+        subject = RegionInImage(
+            RegionInImage(RegionInImage(screen, Region(100, 50, 300, 200)), Region(5, 10, 100, 100)),
+            Region(5, 10, 30, 40),
+        )
+
+        subject._get_numpy_image()
+
+        fake_backend.grab.assert_called_once_with(Region(110, 70, 30, 40))
+
+    @staticmethod
+    def test_scaled_screen_shrinks_frames_but_keeps_full_resolution_size():
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = np.zeros((60, 101, 3), dtype=np.uint8)
+        subject = Screen(capture_backend=fake_backend, scale=0.5)
+
+        actual = subject.screenshot()
+
+        assert actual._get_numpy_image().shape == (30, 51, 3)
+        assert (subject.width, subject.height) == (101, 60)
+        assert (actual.width, actual.height) == (101, 60)
+
+    @staticmethod
+    @pytest.mark.parametrize("kwargs", [{}, {"candidates": [Point(60, 80)]}, {"subpatch": True}])
+    def test_images_found_on_scaled_screen_are_in_full_resolution_coordinates(kwargs):
+        pixels = np.zeros((200, 240, 3), dtype=np.uint8)
+        pixels[80:150, 60:130] = np.random.default_rng(0).integers(0, 256, (70, 70, 3), dtype=np.uint8)
+        fake_backend = MagicMock()
+        fake_backend.grab.return_value = pixels
+        subject = Screen(capture_backend=fake_backend, scale=0.5)
+
+        actual = subject.find_image_all(Image(pixels[80:150, 60:130].copy()), 0.99, **kwargs)
+
+        assert [found.region for found in actual] == [Region(60, 80, 70, 70)]
+
+    @staticmethod
+    def test_region_in_scaled_screen_captures_full_region_then_shrinks_it():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = lambda region=None: np.zeros(
+            (100, 100, 3) if region is None else (region.height, region.width, 3), dtype=np.uint8
+        )
+        subject = Screen(capture_backend=fake_backend, scale=0.5).get_child_region(Region(10, 20, 30, 40))
+
+        actual = subject._get_numpy_image()
+
+        fake_backend.grab.assert_called_with(Region(10, 20, 30, 40))
+        assert actual.shape == (20, 15, 3)
+        assert (subject.width, subject.height) == (30, 40)
+
+    @staticmethod
+    def test_region_in_scaled_screenshot_uses_the_pixels_that_cover_it():
+        pixels = np.arange(30 * 50 * 3, dtype=np.uint32).astype(np.uint8).reshape((30, 50, 3))
+        subject = Screenshot(pixels, scale=0.5, size=(100, 60)).get_child_region(Region(11, 20, 30, 40))
+
+        actual = subject._get_numpy_image()
+
+        assert np.array_equal(actual, pixels[10:30, 5:21])
+
+    @staticmethod
+    @pytest.mark.parametrize("method", ["find_all", "find_image_all"])
+    def test_finding_once_in_region_of_screen_captures_only_the_region(method):
+        needle = np.random.default_rng(0).integers(0, 256, size=(5, 6, 3), dtype=np.uint8)
+        frame = np.full((60, 100, 3), 128, dtype=np.uint8)
+        frame[30:35, 40:46] = needle
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = lambda region=None: (
+            frame if region is None else frame[region.top : region.bottom, region.left : region.right]
+        )
+        subject = Screen(capture_backend=fake_backend).get_child_region(Region(30, 20, 40, 30))
+        fake_backend.grab.reset_mock()
+
+        found = getattr(subject, method)([Image(needle)], 0.99)
+
+        fake_backend.grab.assert_called_once_with(Region(30, 20, 40, 30))
+        assert [match.absolute_region for match in found] == [Region(40, 30, 6, 5)]
+
+    @staticmethod
+    def test_region_in_partly_captured_scaled_screenshot_uses_the_pixels_that_cover_it():
+        pixels = np.arange(30 * 50 * 3, dtype=np.uint32).astype(np.uint8).reshape((30, 50, 3))
+        screenshot = Screenshot(pixels[8:30, 4:30], scale=0.5, size=(100, 60), captured_region=Region(8, 16, 52, 44))
+        subject = screenshot.get_child_region(Region(11, 20, 30, 40))
+
+        actual = subject._get_numpy_image()
+
+        assert np.array_equal(actual, pixels[10:30, 5:21])
+
+    @staticmethod
+    def test_matches_in_snapshot_of_region_of_scaled_screen_are_located_in_screen():
+        needle = np.kron(
+            np.random.default_rng(0).integers(0, 256, size=(10, 15, 3), dtype=np.uint8), np.ones((2, 2, 1), np.uint8)
+        )
+        frame = np.full((100, 160, 3), 128, dtype=np.uint8)
+        frame[60:80, 110:140] = needle
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = lambda region=None: (
+            frame if region is None else frame[region.top : region.bottom, region.left : region.right]
+        )
+        subject = Screen(capture_backend=fake_backend, scale=0.5).get_child_region(Region(100, 40, 60, 60))
+
+        found = subject.find_image_all(Image(needle), 0.99)
+
+        fake_backend.grab.assert_called_with(Region(100, 40, 60, 60))
+        assert [match.absolute_region for match in found] == [Region(110, 60, 30, 20)]
+
+    @staticmethod
+    def test_looking_outside_the_captured_part_of_a_screenshot_raises_out_of_bounds_error():
+        screenshot = Screenshot(
+            np.zeros((20, 30, 3), dtype=np.uint8), size=(100, 60), captured_region=Region(10, 5, 30, 20)
+        )
+        subject = screenshot.get_child_region(Region(10, 5, 30, 20)).region_right()
+
+        with pytest.raises(OutOfBoundsError):
+            subject._get_numpy_image()
+
+    @staticmethod
+    @pytest.mark.parametrize("scale", [0, -0.5, 1.5])
+    def test_unrecognized_scale_raises_value_error(scale):
+        with pytest.raises(ValueError):
+            Screen(capture_backend=MagicMock(), scale=scale)
+
+    @staticmethod
+    def test_wait_until_vanishes_reuses_result_while_screen_is_unchanged():
+        fake_backend = MagicMock()
+        fake_backend.grab.side_effect = [np.full((60, 100, 3), i, dtype=np.uint8) for i in (0, 0, 0, 1)]
+        fake_backend.damage_count.return_value = None
+        subject = Screen(capture_backend=fake_backend)
+        match = MatchedRegionInImage(Image(RESOURCES_DIR / "the.png"), Region(0, 0, 1, 1), "text", 1.0)
+
+        with mock.patch.object(Image, "find_all", side_effect=[[match], []]) as find_all_patch, fake_clock():
+            vanished = subject.wait_until_vanishes("text", 0.8, 1, scans_per_second=10)
+
+        assert vanished
+        assert find_all_patch.call_count == 2
+        assert subject.last_wait_statistics == WaitStatistics(scans=4, skipped_scans=2)
+
     @staticmethod
     def test_saving_screenshot(tmp_path):
         # Arrange
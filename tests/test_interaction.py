@@ -3,11 +3,12 @@
 from unittest import mock
 from unittest.mock import call
 
+import numpy as np
 import pyautogui
 import pytest
 
 from pin_the_tail import interaction
-from pin_the_tail.image import BaseImage, NeedleNotFoundError, Screen
+from pin_the_tail.image import BaseImage, NeedleNotFoundError, RegionInImage, Screen, Screenshot
 from pin_the_tail.location import Point, Region
 
 
@@ -940,6 +941,21 @@ class TestMouseMoveTo:
         move_to_patch.assert_called_once_with(region.center.x, region.center.y, 17)
         mock_screen.find.assert_called_once_with(mock_needle)
 
+    @staticmethod
+    def test_found_region_on_monitor_is_moved_to_on_the_desktop():
+        # Arrange
+        mock_screen = mock.MagicMock()
+        screenshot = Screenshot(np.zeros((100, 100, 3), dtype=np.uint8), Point(1920, 0))
+        mock_screen.find = mock.MagicMock(return_value=RegionInImage(screenshot, Region(10, 20, 6, 8)))
+        subject = interaction.Mouse(screen_reference=mock_screen)
+
+        # Act
+        with mock.patch("pin_the_tail.image.pyautogui.moveTo") as move_to_patch:
+            subject.move_to("string needle", duration=17)
+
+        # Assert
+        move_to_patch.assert_called_once_with(1933, 24, 17)
+
     @staticmethod
     @pytest.mark.parametrize("region", [Region(0, 0, 6, 8), Region(0, 0, 7, 9)])
     def test_found_region_is_odd_or_even_dimension_size_still_results_in_integer_location(region):
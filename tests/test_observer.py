@@ -0,0 +1,169 @@
+import threading
+from pathlib import Path
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pin_the_tail.image import Image, MatchedRegionInImage, Screen
+from pin_the_tail.location import Region
+from pin_the_tail.observer import Observer
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+
+
+def create_screen(values):
+    """
+    Create a 60 x 100 screen whose successive captures are filled with ``values``.
+    """
+    backend = MagicMock()
+    backend.grab.side_effect = [np.full((60, 100, 3), value, dtype=np.uint8) for value in values]
+    backend.damage_count.return_value = None
+    return Screen(capture_backend=backend)
+
+
+def create_match(needle="text"):
+    return MatchedRegionInImage(Image(RESOURCES_DIR / "the.png"), Region(0, 0, 1, 1), needle, 1.0)
+
+
+class TestObserver:
+    @staticmethod
+    def test_non_positive_rate_raises_value_error():
+        with pytest.raises(ValueError):
+            Observer(MagicMock(), scans_per_second=0)
+
+    @staticmethod
+    def test_appear_callback_is_called_once_per_appearance():
+        match = create_match()
+        subject = Observer(create_screen([0, 1, 2, 3, 4]))
+        callback = MagicMock()
+        subject.on_appear("text", callback)
+
+        with mock.patch.object(Image, "find_all", side_effect=[[], [match], [match], [], [match]]):
+            for _ in range(5):
+                subject.tick()
+
+        assert callback.call_args_list == [mock.call([match])] * 2
+
+    @staticmethod
+    def test_vanish_callback_is_called_once_per_disappearance():
+        match = create_match()
+        subject = Observer(create_screen([0, 1, 2, 3]))
+        callback = MagicMock()
+        subject.on_vanish("text", callback, 0.8)
+
+        with mock.patch.object(Image, "find_all", side_effect=[[match], [], [], [match]]) as find_all_patch:
+            for _ in range(4):
+                subject.tick()
+
+        callback.assert_called_once_with()
+        find_all_patch.assert_called_with("text", 0.8, text_kwargs=None, image_kwargs=None, mode="any")
+
+    @staticmethod
+    def test_vanish_callback_is_called_when_needle_is_absent_to_begin_with():
+        subject = Observer(create_screen([0]))
+        callback = MagicMock()
+        subject.on_vanish("text", callback)
+
+        with mock.patch.object(Image, "find_all", return_value=[]):
+            subject.tick()
+
+        callback.assert_called_once_with()
+
+    @staticmethod
+    def test_all_registrations_share_one_capture_per_tick():
+        screen = create_screen([0, 1])
+        subject = Observer(screen)
+        for needle in ("OK", "Cancel", "Error"):
+            subject.on_appear(needle, MagicMock())
+        subject.on_vanish("Loading", MagicMock())
+
+        with mock.patch.object(Image, "find_all", autospec=True, return_value=[]) as find_all_patch:
+            subject.tick()
+            subject.tick()
+
+        assert screen.capture_backend.grab.call_count == 2
+        assert find_all_patch.call_count == 8
+        searched_images = [call_args[0][0] for call_args in find_all_patch.call_args_list]
+        assert len({id(image) for image in searched_images[:4]}) == 1
+        assert len({id(image) for image in searched_images[4:]}) == 1
+
+    @staticmethod
+    def test_unchanged_image_is_not_searched_again():
+        subject = Observer(create_screen([0, 0, 0]))
+        subject.on_appear("text", MagicMock())
+
+        with mock.patch.object(Image, "find_all", return_value=[]) as find_all_patch:
+            for _ in range(3):
+                subject.tick()
+
+        assert find_all_patch.call_count == 1
+
+    @staticmethod
+    def test_new_registration_is_checked_even_if_image_is_unchanged():
+        subject = Observer(create_screen([0, 0]))
+        subject.on_appear("text", MagicMock())
+        callback = MagicMock()
+
+        with mock.patch.object(Image, "find_all", return_value=[create_match()]):
+            subject.tick()
+            subject.on_appear("other text", callback)
+            subject.tick()
+
+        callback.assert_called_once()
+
+    @staticmethod
+    def test_change_callback_is_called_when_region_changes():
+        backend = MagicMock()
+        frames = [np.zeros((60, 100, 3), dtype=np.uint8) for _ in range(3)]
+        frames[1][50:60, 90:100] = 1
+        frames[2][0:10, 0:10] = 1
+        backend.grab.side_effect = frames
+        backend.damage_count.return_value = None
+        subject = Observer(Screen(capture_backend=backend))
+        whole_callback = MagicMock()
+        region_callback = MagicMock()
+        subject.on_change(whole_callback)
+        subject.on_change(region_callback, Region(0, 0, 20, 20))
+
+        for _ in range(3):
+            subject.tick()
+
+        assert whole_callback.call_count == 2
+        region_callback.assert_called_once()
+        assert region_callback.call_args[0][0].region == Region(0, 0, 20, 20)
+
+    @staticmethod
+    def test_background_thread_calls_callbacks():
+        image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        image.find_all = MagicMock(return_value=[create_match()])
+        appeared = threading.Event()
+
+        with Observer(image, scans_per_second=100) as subject:
+            subject.on_appear("text", lambda matches: appeared.set())
+            assert appeared.wait(5)
+            assert subject.is_running
+
+        assert not subject.is_running
+
+    @staticmethod
+    def test_callback_error_is_raised_when_closing():
+        image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        image.find_all = MagicMock(return_value=[create_match()])
+        subject = Observer(image, scans_per_second=100)
+        subject.on_appear("text", MagicMock(side_effect=RuntimeError("callback failed")))
+
+        subject.start()
+        subject._thread.join(5)
+
+        with pytest.raises(RuntimeError):
+            subject.close()
+
+    @staticmethod
+    def test_starting_after_closing_raises_value_error():
+        subject = Observer(Image(RESOURCES_DIR / "wiki-python-text.png"))
+        subject.close()
+
+        with pytest.raises(ValueError):
+            subject.start()
@@ -0,0 +1,242 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from pin_the_tail.image import Image, MatchedRegionInImage
+from pin_the_tail.location import Region
+from pin_the_tail.observer import Observer
+from pin_the_tail.scheduler import ScanMetrics, ScanScheduler, get_current_watcher
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+
+
+def wait_until_queued(scheduler, n_waiting):
+    """
+    Wait until ``n_waiting`` scans are waiting to start.
+    """
+    deadline = time.monotonic() + 5
+    while len(scheduler._waiting) < n_waiting:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def start_scan_thread(watcher, due, started):
+    """
+    Start a thread that makes a scan for ``watcher`` and appends the watcher's name to ``started`` when the scan starts.
+    """
+
+    def scan():
+        with watcher.scan(due, 1):
+            started.append(watcher.name)
+
+    thread = threading.Thread(target=scan)
+    thread.start()
+    return thread
+
+
+class TestScanScheduler:
+    @staticmethod
+    def test_non_positive_cores_raises_value_error():
+        with pytest.raises(ValueError):
+            ScanScheduler(cores=0)
+
+    @staticmethod
+    def test_at_most_cores_scans_run_at_once():
+        subject = ScanScheduler(cores=2)
+        lock = threading.Lock()
+        n_running = [0]
+        max_running = [0]
+
+        def scan(watcher):
+            with watcher.scan(time.monotonic(), 1):
+                with lock:
+                    n_running[0] += 1
+                    max_running[0] = max(max_running[0], n_running[0])
+                time.sleep(0.01)
+                with lock:
+                    n_running[0] -= 1
+
+        threads = [threading.Thread(target=scan, args=(subject.watcher(),)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max_running[0] == 2
+        assert subject.metrics.scans == 6
+
+    @staticmethod
+    def test_higher_priority_scans_start_first():
+        subject = ScanScheduler(cores=1)
+        started = []
+        now = time.monotonic()
+
+        with subject.watcher().scan(now, 1):
+            threads = [start_scan_thread(subject.watcher(priority=0, name="low"), now, started)]
+            wait_until_queued(subject, 1)
+            threads.append(start_scan_thread(subject.watcher(priority=5, name="high"), now, started))
+            wait_until_queued(subject, 2)
+        for thread in threads:
+            thread.join()
+
+        assert started == ["high", "low"]
+
+    @staticmethod
+    def test_scans_due_longest_start_first_among_same_priority():
+        subject = ScanScheduler(cores=1)
+        started = []
+        now = time.monotonic()
+
+        with subject.watcher().scan(now, 1):
+            threads = [start_scan_thread(subject.watcher(name="later"), now, started)]
+            wait_until_queued(subject, 1)
+            threads.append(start_scan_thread(subject.watcher(name="earlier"), now - 1, started))
+            wait_until_queued(subject, 2)
+        for thread in threads:
+            thread.join()
+
+        assert started == ["earlier", "later"]
+
+    @staticmethod
+    def test_late_scans_are_reported_as_deadline_misses():
+        subject = ScanScheduler()
+        watcher = subject.watcher(name="watcher")
+        now = time.monotonic()
+
+        with watcher.scan(now - 2, 1):
+            pass
+        with watcher.scan(now + 10, 1):
+            pass
+
+        metrics = watcher.metrics
+        assert metrics.scans == 2
+        assert metrics.deadline_misses == 1
+        assert metrics.max_lateness >= 2
+        assert metrics.mean_lateness == pytest.approx(metrics.total_lateness / 2)
+        assert subject.metrics == metrics
+
+    @staticmethod
+    def test_metrics_without_scans_have_no_mean_lateness():
+        assert ScanMetrics().mean_lateness is None
+
+    @staticmethod
+    def test_failed_scan_releases_its_place():
+        subject = ScanScheduler(cores=1)
+        watcher = subject.watcher()
+
+        with pytest.raises(RuntimeError):
+            with watcher.scan(time.monotonic(), 1):
+                raise RuntimeError("search failed")
+        with watcher.scan(time.monotonic(), 1):
+            pass
+
+        assert subject.metrics.scans == 2
+
+
+class TestWatcher:
+    @staticmethod
+    def test_entering_watcher_makes_it_current():
+        subject = ScanScheduler().watcher()
+
+        with subject:
+            assert get_current_watcher() is subject
+        assert get_current_watcher() is None
+
+    @staticmethod
+    def test_waits_inside_watcher_are_scheduled():
+        subject = ScanScheduler(cores=1).watcher(priority=3)
+        image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        image.find_all = MagicMock(return_value=[])
+
+        with subject, mock.patch("pin_the_tail.image.pyautogui.sleep"):
+            image.wait_until_appears("text", 0.8, 0)
+            image.wait_until_vanishes("other text", 0.8, 0)
+
+        assert subject.metrics.scans == 2
+
+    @staticmethod
+    def test_waits_outside_watcher_are_not_scheduled():
+        subject = ScanScheduler(cores=1).watcher()
+        image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        image.find_all = MagicMock(return_value=[])
+
+        image.wait_until_appears("text", 0.8, 0)
+
+        assert subject.metrics.scans == 0
+
+    @staticmethod
+    def test_observer_ticks_are_scheduled():
+        subject = ScanScheduler(cores=1).watcher()
+        image = Image(RESOURCES_DIR / "wiki-python-text.png")
+        image.find_all = MagicMock(return_value=[MatchedRegionInImage(image, Region(0, 0, 1, 1), "text", 1.0)])
+        appeared = threading.Event()
+
+        with Observer(image, scans_per_second=100, watcher=subject) as observer:
+            observer.on_appear("text", lambda matches: appeared.set())
+            assert appeared.wait(5)
+
+        assert subject.metrics.scans > 0
+
+    @staticmethod
+    def test_non_positive_scans_per_second_raises_value_error():
+        with pytest.raises(ValueError):
+            ScanScheduler().watcher(scans_per_second=0)
+
+    @staticmethod
+    def test_watcher_without_scans_per_second_keeps_interval():
+        subject = ScanScheduler().watcher()
+
+        assert subject.cap_interval(0.1) == 0.1
+
+    @staticmethod
+    def test_scans_per_second_caps_interval():
+        subject = ScanScheduler().watcher(scans_per_second=2)
+
+        assert subject.cap_interval(0.1) == 0.5
+        assert subject.cap_interval(1) == 1
+
+    @staticmethod
+    def test_watcher_can_be_entered_from_several_threads_at_once():
+        subject = ScanScheduler().watcher()
+        other = ScanScheduler().watcher()
+        both_entered = threading.Barrier(2)
+        first_exited = threading.Event()
+        current = {}
+
+        def enter(name, exit_first):
+            with other:
+                with subject:
+                    both_entered.wait(5)
+                    if not exit_first:
+                        assert first_exited.wait(5)
+                current[name] = get_current_watcher()
+                if exit_first:
+                    first_exited.set()
+
+        threads = [threading.Thread(target=enter, args=(name, name == "first")) for name in ("first", "second")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert current == {"first": other, "second": other}
+
+    @staticmethod
+    def test_watcher_can_be_entered_from_several_tasks_at_once():
+        subject = ScanScheduler().watcher()
+
+        async def enter(delay):
+            with subject:
+                await asyncio.sleep(delay)
+                assert get_current_watcher() is subject
+            return get_current_watcher()
+
+        async def enter_concurrently():
+            return await asyncio.gather(enter(0), enter(0.01))
+
+        assert asyncio.run(enter_concurrently()) == [None, None]
@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pin_the_tail.capture import CaptureUnavailableError
+from pin_the_tail.image import Image, Screen
+from pin_the_tail.location import Region
+from pin_the_tail.shared_frames import FramePublisher, FrameSubscriber
+
+
+@pytest.fixture(name="publisher")
+def fixture_publisher():
+    """
+    A publisher whose frames are published by calling ``publish(value)`` instead of by a background thread.
+    """
+    publisher = FramePublisher(backend=MagicMock(), history_size=2)
+    publisher._allocate((20, 30, 3))
+    publisher.publish = lambda value: publisher._store(np.full((20, 30, 3), value, dtype=np.uint8), float(value))
+    yield publisher
+    publisher.close()
+
+
+class TestFrameSubscriber:
+    @staticmethod
+    def test_grabbing_latest_published_frame(publisher):
+        publisher.publish(1)
+        publisher.publish(2)
+        subject = FrameSubscriber(publisher._shared_memory.name)
+
+        actual = subject.latest()
+
+        assert actual.sequence == 1
+        assert actual.timestamp == 2.0
+        assert (actual.image == 2).all()
+        subject.close()
+
+    @staticmethod
+    def test_grabbing_region_of_published_frame(publisher):
+        publisher.publish(1)
+        subject = FrameSubscriber(publisher._shared_memory.name)
+
+        actual = subject.grab(Region(5, 2, 10, 4))
+
+        assert actual.shape == (4, 10, 3)
+        subject.close()
+
+    @staticmethod
+    def test_viewing_latest_frame_does_not_copy_it(publisher):
+        publisher.publish(1)
+        subject = FrameSubscriber(publisher._shared_memory.name)
+
+        actual = subject.view_latest()
+        actual_image = Image(actual.image)
+
+        assert not actual.image.flags.writeable
+        assert actual_image.width == 30
+        assert subject.is_intact(actual)
+        publisher.publish(2)
+        assert subject.is_intact(actual)
+        publisher.publish(3)
+        assert not subject.is_intact(actual)
+        assert (actual.image == 3).all()
+        del actual, actual_image
+        subject.close()
+
+    @staticmethod
+    def test_screen_can_capture_with_subscriber(publisher):
+        publisher.publish(7)
+        subject = FrameSubscriber(publisher._shared_memory.name)
+
+        actual = Screen(capture_backend=subject).screenshot()
+
+        assert (actual._get_numpy_image() == 7).all()
+        subject.close()
+
+    @staticmethod
+    def test_waiting_for_damage_waits_for_a_frame_newer_than_the_last_one_read(publisher):
+        publisher.publish(1)
+        subject = FrameSubscriber(publisher._shared_memory.name)
+        subject.grab()
+
+        without_new_frame = subject.wait_for_damage(0.02)
+        publisher.publish(2)
+        with_new_frame = subject.wait_for_damage(0.02)
+
+        assert without_new_frame is False
+        assert with_new_frame is True
+        subject.close()
+
+    @staticmethod
+    def test_waiting_too_long_for_first_frame_raises_timeout_error(publisher):
+        subject = FrameSubscriber(publisher._shared_memory.name, timeout=0.05)
+
+        with pytest.raises(TimeoutError):
+            subject.grab()
+        subject.close()
+
+    @staticmethod
+    def test_subscribing_to_unknown_name_raises_capture_unavailable_error():
+        with pytest.raises(CaptureUnavailableError):
+            FrameSubscriber("pin_the_tail_does_not_exist")
+
+
+class TestFramePublisher:
+    @staticmethod
+    def test_starting_publishes_first_frame():
+        backend = MagicMock()
+        backend.grab.return_value = np.full((20, 30, 3), 5, dtype=np.uint8)
+
+        with FramePublisher(backend=backend, fps=1000) as subject:
+            subscriber = FrameSubscriber(subject.shared_memory_name)
+            actual = subscriber.grab()
+            subscriber.close()
+
+        assert (actual == 5).all()
+
+    @staticmethod
+    def test_changing_frame_size_raises_value_error(publisher):
+        with pytest.raises(ValueError):
+            publisher._store(np.zeros((40, 30, 3), dtype=np.uint8), 0.0)
+
+    @staticmethod
+    def test_closing_removes_shared_memory_but_keeps_history(publisher):
+        name = publisher._shared_memory.name
+        publisher.publish(1)
+        publisher.publish(2)
+
+        publisher.close()
+
+        assert [frame.sequence for frame in publisher.history()] == [0, 1]
+        with pytest.raises(CaptureUnavailableError):
+            FrameSubscriber(name)